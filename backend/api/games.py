@@ -2,16 +2,14 @@
 from flask import Blueprint, request, jsonify, send_file
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from shared.database import db_session, db_error_response, db_get_or_404
-from datetime import datetime
+from datetime import date, datetime, time
 from services.team_service import TeamService
 from services.game_service import GameService
 from services.ai_service import AIService
 from shared.models import Game, Team
-from backend.utils import standardize_error_response
+from backend.utils import standardize_error_response, render_csv
 import csv
 import io
-import os
-import tempfile
 
 # Main games blueprint
 games = Blueprint("games", __name__)
@@ -19,6 +17,44 @@ games = Blueprint("games", __name__)
 # Nested routes blueprint for team-specific game operations
 games_nested = Blueprint("games_nested", __name__)
 
+def _parse_game_date(value):
+    """Parse an ISO date string, e.g. '2024-05-01', into a date.
+    
+    Plain dates go straight through date.fromisoformat; only strings with a
+    time component pay for building a full datetime first.
+    
+    Raises:
+        ValueError: If the value is not an ISO date or datetime
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value).date()
+
+
+def _parse_game_time(value):
+    """Parse a 24-hour 'HH:MM' string into a time.
+    
+    Splits the string directly rather than going through strptime, which
+    is slow because it matches against a locale-aware pattern every call.
+    
+    Raises:
+        ValueError: If the value is not in HH:MM format
+    """
+    hours, sep, minutes = value.partition(':')
+    if not (sep and hours.isdigit() and len(hours) <= 2 and minutes.isdigit() and 1 <= len(minutes) <= 2):
+        raise ValueError(f"time data {value!r} does not match format '%H:%M'")
+    return time(int(hours), int(minutes))
+
+
+# Sample schedule offered for download, encoded once rather than per request
+GAMES_CSV_TEMPLATE = render_csv([
+    ["game_number", "opponent", "date", "time", "innings"],
+    ["1", "Tigers", "2025-05-01", "18:00", "6"],
+    ["2", "Eagles", "2025-05-08", "17:30", "6"],
+])
+
+
 @games_nested.route('/<int:team_id>/games/csv-template', methods=['GET'])
 @jwt_required()
 def download_games_csv_template(team_id):
@@ -44,38 +80,14 @@ def download_games_csv_template(team_id):
             if not team:
                 return jsonify({'error': 'Team not found or unauthorized'}), 404
             
-            # Create CSV template in memory
-            csv_data = io.StringIO()
-            writer = csv.writer(csv_data)
-            
-            # Write headers
-            writer.writerow(["game_number", "opponent", "date", "time", "innings"])
-            
-            # Write sample data
-            writer.writerow(["1", "Tigers", "2025-05-01", "18:00", "6"])
-            writer.writerow(["2", "Eagles", "2025-05-08", "17:30", "6"])
-            
-            # Prepare file for download
-            csv_data.seek(0)
-            
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False)
-            temp_file.write(csv_data.getvalue().encode('utf-8'))
-            temp_file_path = temp_file.name
-            temp_file.close()
-            
             file_name = f"{team.name.replace(' ', '_')}_games_template.csv"
             
-            try:
-                return send_file(
-                    temp_file_path,
-                    mimetype='text/csv',
-                    as_attachment=True,
-                    download_name=file_name
-                )
-            finally:
-                # Clean up temp file after response is sent
-                os.remove(temp_file_path)
+            return send_file(
+                io.BytesIO(GAMES_CSV_TEMPLATE),
+                mimetype='text/csv',
+                as_attachment=True,
+                download_name=file_name
+            )
                 
     except Exception as e:
         print(f"Error creating games CSV template: {str(e)}")
@@ -204,14 +216,15 @@ def create_game(team_id):
             return jsonify({'error': 'File must be a CSV file'}), 400
         
         try:
-            # Parse CSV file
-            csv_file = io.StringIO(file.read().decode('utf-8'))
+            # Parse the CSV straight from the upload stream, decoding rows as
+            # they are read instead of buffering the whole file as bytes and text
+            csv_file = io.TextIOWrapper(file.stream, encoding='utf-8', newline='')
             csv_reader = csv.DictReader(csv_file)
             
             # Check for required headers
             required_fields = ['game_number', 'opponent']
             optional_fields = ['date', 'time', 'innings']
-            if not all(field in csv_reader.fieldnames for field in required_fields):
+            if not all(field in (csv_reader.fieldnames or []) for field in required_fields):
                 return jsonify({'error': 'CSV file must include headers: game_number, opponent'}), 400
             
             # Using commit=True to automatically commit successful operations
@@ -229,46 +242,49 @@ def create_game(team_id):
                         session.delete(game)
                     session.flush()
                 
-                games_imported = 0
                 errors = []
+                valid_games = []
                 
-                # Process each row in the CSV file
+                # Validate and convert each row in the CSV file
                 for idx, row in enumerate(csv_reader, start=2):  # start=2 for 1-based indexing and skipping header
+                    # Validate row data for required fields
+                    missing = [field for field in required_fields if not (row.get(field) or '').strip()]
+                    if missing:
+                        errors.extend(f"Row {idx}: Missing {field}" for field in missing)
+                        continue
+                    
                     try:
-                        # Validate row data for required fields
-                        for field in required_fields:
-                            if not row.get(field, '').strip():
-                                errors.append(f"Row {idx}: Missing {field}")
-                                continue
-                        
                         # Create game data dictionary
                         game_data = {
                             'game_number': row['game_number'],
                             'opponent': row['opponent'],
-                            'innings': int(row.get('innings', 6))
+                            'innings': int(row.get('innings') or 6)
                         }
-                        
-                        # Handle date if provided
-                        if 'date' in row and row['date'].strip():
-                            try:
-                                game_data['date'] = datetime.fromisoformat(row['date']).date()
-                            except ValueError:
-                                errors.append(f"Row {idx}: Invalid date format. Use ISO format (YYYY-MM-DD)")
-                                continue
-                        
-                        # Handle time if provided
-                        if 'time' in row and row['time'].strip():
-                            try:
-                                game_data['time'] = datetime.strptime(row['time'], '%H:%M').time()
-                            except ValueError:
-                                errors.append(f"Row {idx}: Invalid time format. Use 24-hour format (HH:MM)")
-                                continue
-                        
-                        # Create game using service
-                        game = GameService.create_game(session, game_data, team_id)
-                        games_imported += 1
-                    except Exception as e:
+                    except ValueError as e:
                         errors.append(f"Row {idx}: {str(e)}")
+                        continue
+                    
+                    # Handle date if provided
+                    if row.get('date') and row['date'].strip():
+                        try:
+                            game_data['date'] = _parse_game_date(row['date'])
+                        except ValueError:
+                            errors.append(f"Row {idx}: Invalid date format. Use ISO format (YYYY-MM-DD)")
+                            continue
+                    
+                    # Handle time if provided
+                    if row.get('time') and row['time'].strip():
+                        try:
+                            game_data['time'] = _parse_game_time(row['time'])
+                        except ValueError:
+                            errors.append(f"Row {idx}: Invalid time format. Use 24-hour format (HH:MM)")
+                            continue
+                    
+                    valid_games.append(game_data)
+                
+                # Create all valid games in a single flush
+                created_games = GameService.create_games(session, valid_games, team_id)
+                games_imported = len(created_games)
                 
                 if not errors:
                     return jsonify({
@@ -310,13 +326,13 @@ def create_game(team_id):
                 # Handle date and time if provided
                 if data.get('date'):
                     try:
-                        game_data['date'] = datetime.fromisoformat(data['date']).date()
+                        game_data['date'] = _parse_game_date(data['date'])
                     except ValueError:
                         return jsonify({'error': 'Invalid date format. Use ISO format (YYYY-MM-DD)'}), 400
                         
                 if data.get('time'):
                     try:
-                        game_data['time'] = datetime.strptime(data['time'], '%H:%M').time()
+                        game_data['time'] = _parse_game_time(data['time'])
                     except ValueError:
                         return jsonify({'error': 'Invalid time format. Use 24-hour format (HH:MM)'}), 400
                 
@@ -379,7 +395,7 @@ def update_game(game_id):
             if 'date' in data:
                 if data['date']:
                     try:
-                        game_data['date'] = datetime.fromisoformat(data['date']).date()
+                        game_data['date'] = _parse_game_date(data['date'])
                     except ValueError:
                         return jsonify({'error': 'Invalid date format. Use ISO format (YYYY-MM-DD)'}), 400
                 else:
@@ -388,7 +404,7 @@ def update_game(game_id):
             if 'time' in data:
                 if data['time']:
                     try:
-                        game_data['time'] = datetime.strptime(data['time'], '%H:%M').time()
+                        game_data['time'] = _parse_game_time(data['time'])
                     except ValueError:
                         return jsonify({'error': 'Invalid time format. Use 24-hour format (HH:MM)'}), 400
                 else:
@@ -481,36 +497,24 @@ def get_batting_order(game_id):
             if not batting_order:
                 return jsonify({'error': 'Batting order not found for this game'}), 404
             
-            # Get player availability to filter unavailable players
-            availability_records = GameService.get_player_availability(session, game_id)
-            unavailable_player_ids = set()
-            
-            # Create a set of unavailable player IDs
-            for record in availability_records:
-                if record.available is False:  # Only if explicitly False
-                    unavailable_player_ids.add(record.player_id)
+            # Get the IDs of explicitly unavailable players, filtered in SQL
+            unavailable_player_ids = GameService.get_unavailable_player_ids(session, game_id)
             
             # Serialize batting order
             result = GameService.serialize_batting_order(batting_order)
             
-            # Filter out unavailable players from order_data
+            # Filter out unavailable players from order_data. The stored order is
+            # left as is: reads don't write, and the filtered order is persisted
+            # the next time the batting order is saved.
             if result.get('order_data') and isinstance(result['order_data'], list):
                 filtered_order = [
                     player_id for player_id in result['order_data'] 
                     if player_id not in unavailable_player_ids
                 ]
-                result['order_data'] = filtered_order
                 
                 print(f"Filtered {len(result['order_data']) - len(filtered_order)} unavailable players from batting order")
                 
-                # Also save the filtered order back to the database
-                if len(filtered_order) != len(batting_order.order_data):
-                    print(f"Updating batting order to remove unavailable players")
-                    with db_session(commit=True) as write_session:
-                        # Re-fetch in write session
-                        write_batting_order = GameService.get_batting_order(write_session, game_id)
-                        if write_batting_order:
-                            write_batting_order.order_data = filtered_order
+                result['order_data'] = filtered_order
                     
             return jsonify(result), 200
     except Exception as e:
@@ -543,6 +547,16 @@ def save_batting_order(game_id):
     if not data or 'order_data' not in data:
         return jsonify({'error': 'Batting order data is required'}), 400
     
+    if not isinstance(data['order_data'], list):
+        return jsonify({'error': 'Batting order data must be a list of player IDs'}), 400
+    
+    # Parse the order into integer player IDs once, so readers such as the
+    # batting analytics can use the stored IDs as-is
+    try:
+        order_data = GameService.normalize_batting_order(data['order_data'])
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         # Using commit=True to automatically commit successful operations
         with db_session(commit=True) as session:
@@ -556,8 +570,10 @@ def save_batting_order(game_id):
             existing_batting_order = GameService.get_batting_order(session, game_id)
             status_code = 200 if existing_batting_order else 201
             
-            # Create or update batting order via service
-            batting_order = GameService.create_or_update_batting_order(session, game_id, data['order_data'])
+            # Create or update batting order via service, reusing the row loaded above
+            batting_order = GameService.save_batting_order(
+                session, game_id, order_data, existing_batting_order
+            )
             
             # Serialize response
             result = GameService.serialize_batting_order(batting_order)
@@ -636,10 +652,16 @@ def batch_save_fielding_rotations(game_id):
     if not data or not isinstance(data, dict) or len(data) == 0:
         return jsonify({'error': 'A dictionary of inning to positions data is required'}), 400
     
-    # Validate each record in the batch
-    for inning, positions in data.items():
+    # Validate each record in the batch and parse inning numbers up front
+    rotations_data = {}
+    for inning_str, positions in data.items():
         if not isinstance(positions, dict):
-            return jsonify({'error': f'Invalid positions data for inning {inning}: Must be a dictionary of positions to player IDs'}), 400
+            return jsonify({'error': f'Invalid positions data for inning {inning_str}: Must be a dictionary of positions to player IDs'}), 400
+        try:
+            rotations_data[int(inning_str)] = positions
+        except (ValueError, TypeError) as e:
+            print(f"Error processing inning {inning_str}: {str(e)}")
+            return jsonify({'error': f'Invalid inning number: {inning_str}'}), 400
     
     try:
         # Using commit=True to automatically commit successful operations
@@ -649,26 +671,11 @@ def batch_save_fielding_rotations(game_id):
             if not game:
                 return jsonify({'error': 'Game not found or unauthorized'}), 404
             
-            # Batch update fielding rotations
-            updated_rotations = []
-            processed_innings = []
-            
-            for inning_str, positions in data.items():
-                try:
-                    # Convert inning to integer
-                    inning = int(inning_str)
-                    processed_innings.append(inning)
-                    
-                    # Create or update fielding rotation via service
-                    rotation = GameService.create_or_update_fielding_rotation(
-                        session, game_id, inning, positions
-                    )
-                    
-                    # Add to result list
-                    updated_rotations.append(rotation)
-                except (ValueError, TypeError) as e:
-                    print(f"Error processing inning {inning_str}: {str(e)}")
-                    return jsonify({'error': f'Invalid inning number: {inning_str}'}), 400
+            # Batch update fielding rotations with one lookup and one flush
+            updated_rotations = GameService.batch_create_or_update_fielding_rotations(
+                session, game_id, rotations_data
+            )
+            processed_innings = list(rotations_data.keys())
             
             # Serialize responses
             result = [GameService.serialize_fielding_rotation(rotation) for rotation in updated_rotations]
@@ -835,9 +842,13 @@ def player_availability_by_id(game_id, player_id):
         return save_player_availability(game_id, player_id, user_id)
         
 def get_player_availability_by_id(game_id, player_id, user_id):
-    """Get availability for a specific player in a game."""
+    """Get availability for a specific player in a game.
+    
+    Players without a stored record are reported with the defaults
+    (available, not catching) without writing a record for them.
+    """
     try:
-        # First, just check if the record exists
+        # Using read_only mode since this is just a query operation
         with db_session(read_only=True) as session:
             # Verify game belongs to user's team
             game = GameService.get_game(session, game_id, user_id)
@@ -845,36 +856,23 @@ def get_player_availability_by_id(game_id, player_id, user_id):
             if not game:
                 return jsonify({'error': 'Game not found or unauthorized'}), 404
             
-            # Get specific player availability
-            availability = GameService.get_player_availability_by_id(session, game_id, player_id)
-            
             # Check if the player exists for this user
             from services.player_service import PlayerService
             player = PlayerService.get_player(session, player_id, user_id)
             if not player:
                 return jsonify({'error': f'Player {player_id} not found or unauthorized'}), 404
+            
+            # Get specific player availability
+            availability = GameService.get_player_availability_by_id(session, game_id, player_id)
                 
             if availability:
                 # If availability record exists, return it
                 result = GameService.serialize_player_availability(availability, include_player=True)
                 return jsonify(result), 200
-        
-        # If we get here, we need to create a default availability record
-        # Use a separate non-read-only session for this
-        print(f"No availability record found for player {player_id} in game {game_id}, creating default")
-        with db_session(commit=True) as session:
-            # Create a default availability record
-            availability = GameService.set_player_availability(
-                session, 
-                game_id, 
-                player_id, 
-                available=True,  # Default to available
-                can_play_catcher=False  # Default to not playing catcher
-            )
             
-            # Serialize the newly created availability
-            result = GameService.serialize_player_availability(availability, include_player=True)
-            return jsonify(result), 201  # 201 Created status code
+            # Otherwise report the defaults the batch endpoints assume
+            result = GameService.default_player_availability(game_id, player)
+            return jsonify(result), 200
     
     except Exception as e:
         print(f"Error getting player availability: {str(e)}")
@@ -966,12 +964,12 @@ def batch_save_player_availability(game_id):
             if not game:
                 return jsonify({'error': 'Game not found or unauthorized'}), 404
             
-            # Verify all players belong to user's team
+            # Verify all players belong to user's team, with one query for the batch
             from services.player_service import PlayerService
             player_ids = [record['player_id'] for record in data]
+            owned_player_ids = PlayerService.get_owned_player_ids(session, player_ids, user_id)
             for player_id in player_ids:
-                player = PlayerService.get_player(session, player_id, user_id)
-                if not player:
+                if player_id not in owned_player_ids:
                     return jsonify({'error': f'Player with ID {player_id} not found or unauthorized'}), 404
             
             # Batch update player availability via service
@@ -997,8 +995,8 @@ def generate_ai_fielding_rotation(game_id):
     """Generate AI-based fielding rotation for a specific game.
     
     Uses standardized database access patterns with in-route feature checking:
-    - db_session context manager for automatic cleanup
-    - Read-only operation (no commits needed) for verification
+    - Single read-only db_session for the feature check and game verification
+    - Session is closed before the (slow) AI call so the connection is not held
     - Structured error handling with standardize_error_response
     """
     from backend.utils import standardize_error_response
@@ -1020,111 +1018,111 @@ def generate_ai_fielding_rotation(game_id):
     if not data:
         return standardize_error_response('Request body is required with player data', 400)
     
-    # Check if user has the feature access
-    with db_session(read_only=True) as session:
-        user = session.query(User).filter(User.id == user_id).first()
-        
-        if not user:
-            return standardize_error_response('User not found', 404)
-        
-        # Skip feature check for admins
-        if user.role != 'admin':
-            if not has_feature(user.subscription_tier, 'ai_lineup_generation'):
-                return standardize_error_response(
-                    'Subscription required',
-                    403,
-                    {
-                        'message': 'AI lineup generation requires a Pro subscription',
-                        'current_tier': user.subscription_tier,
-                        'required_feature': 'ai_lineup_generation',
-                        'upgrade_url': '/account/billing'
-                    }
-                )
-    
-    # For the testing endpoint, create a basic structure if not provided
-    if 'players' not in data or not isinstance(data['players'], list):
-        print(f"AI Endpoint: Missing players data, creating dummy data for testing")
-        # Create a test structure - normally this would come from the client
-        from services.player_service import PlayerService
-        with db_session(read_only=True) as session:
-            # Get all players for the team
-            team = GameService.get_game(session, game_id, user_id).team
-            players_from_db = PlayerService.get_players_by_team(session, team.id)
-            
-            # Create a basic player data structure
-            test_players = []
-            for p in players_from_db:
-                test_players.append({
-                    "id": p.id,
-                    "name": f"{p.first_name} {p.last_name}",
-                    "jersey": p.jersey_number,
-                    "positions": ["1B", "2B", "3B", "SS", "Catcher", "RF", "LF"],
-                    "available": True,
-                    "can_play_catcher": True
-                })
-            
-            # Override missing data for testing
-            data['players'] = test_players
-            
-    # Continue with normal validation - but now we have test data if needed
-    if not isinstance(data['players'], list) or len(data['players']) == 0:
-        return standardize_error_response('At least one player is required', 400)
-    
     try:
-        # Using read_only mode since this is just a verification and AI computation
+        # One read-only session covers the feature check, the fallback player
+        # lookup and game verification; it is released before the AI call
         with db_session(read_only=True) as session:
+            user = session.query(User).filter(User.id == user_id).first()
+            
+            if not user:
+                return standardize_error_response('User not found', 404)
+            
+            # Skip feature check for admins
+            if user.role != 'admin':
+                if not has_feature(user.subscription_tier, 'ai_lineup_generation'):
+                    return standardize_error_response(
+                        'Subscription required',
+                        403,
+                        {
+                            'message': 'AI lineup generation requires a Pro subscription',
+                            'current_tier': user.subscription_tier,
+                            'required_feature': 'ai_lineup_generation',
+                            'upgrade_url': '/account/billing'
+                        }
+                    )
+            
             # Verify game belongs to user's team via service
             game = GameService.get_game(session, game_id, user_id)
             if not game:
                 return standardize_error_response('Game not found or unauthorized', 404)
             
-            # Get required parameters from request data
-            players = data['players']
-            innings = data.get('innings', game.innings) or 6  # Default to game innings or fallback to 6
-            required_positions = data.get('required_positions', [])
-            infield_positions = data.get('infield_positions', [])
-            outfield_positions = data.get('outfield_positions', [])
-            
-            # Get customization options with defaults
-            options = data.get('options', {})
-            no_consecutive_innings = options.get('noConsecutiveInnings', True)
-            balance_playing_time = options.get('balancePlayingTime', True)
-            allow_same_position = options.get('allowSamePositionMultipleTimes', False)
-            strict_position_balance = options.get('strictPositionBalance', True)
-            temperature = options.get('temperature', 0.7)  # Add temperature parameter with default
-            
-            try:
-                # Use the AI service to generate fielding rotation with timeout handling
-                rotation_result = AIService.generate_fielding_rotation(
-                    game_id, 
-                    players, 
-                    innings,
-                    required_positions,
-                    infield_positions,
-                    outfield_positions,
-                    no_consecutive_innings,
-                    balance_playing_time,
-                    allow_same_position,
-                    strict_position_balance,
-                    temperature  # Pass temperature to the AI service
-                )
+            # For the testing endpoint, create a basic structure if not provided
+            if 'players' not in data or not isinstance(data['players'], list):
+                print(f"AI Endpoint: Missing players data, creating dummy data for testing")
+                # Create a test structure - normally this would come from the client
+                from services.player_service import PlayerService
+                players_from_db = PlayerService.get_players_by_team(session, game.team_id)
                 
-                return jsonify(rotation_result), 200
-            except ValueError as ve:
-                if "timeout" in str(ve).lower():
-                    # If timeout occurs, return an informative message
-                    return standardize_error_response(
-                        'AI Rotation Timeout',
-                        202,  # Accepted but not completed
-                        {
-                            'message': 'The AI fielding rotation could not be generated in time. Please try again later or create a manual rotation.',
-                            'error': str(ve),
-                            'success': False
-                        }
-                    )
-                else:
-                    # For other ValueErrors, pass through to the general error handler
-                    raise ve
+                # Create a basic player data structure
+                test_players = []
+                for p in players_from_db:
+                    test_players.append({
+                        "id": p.id,
+                        "name": f"{p.first_name} {p.last_name}",
+                        "jersey": p.jersey_number,
+                        "positions": ["1B", "2B", "3B", "SS", "Catcher", "RF", "LF"],
+                        "available": True,
+                        "can_play_catcher": True
+                    })
+                
+                # Override missing data for testing
+                data['players'] = test_players
+            
+            game_innings = game.innings
+        
+        # Continue with normal validation - but now we have test data if needed
+        if not isinstance(data['players'], list) or len(data['players']) == 0:
+            return standardize_error_response('At least one player is required', 400)
+        
+        # Get required parameters from request data
+        players = data['players']
+        innings = data.get('innings', game_innings) or 6  # Default to game innings or fallback to 6
+        required_positions = data.get('required_positions', [])
+        infield_positions = data.get('infield_positions', [])
+        outfield_positions = data.get('outfield_positions', [])
+        
+        # Get customization options with defaults
+        options = data.get('options', {})
+        no_consecutive_innings = options.get('noConsecutiveInnings', True)
+        balance_playing_time = options.get('balancePlayingTime', True)
+        allow_same_position = options.get('allowSamePositionMultipleTimes', False)
+        strict_position_balance = options.get('strictPositionBalance', True)
+        temperature = options.get('temperature', 0.7)  # Add temperature parameter with default
+        regenerate = options.get('regenerate', False)  # Skip cached results when asking for a new rotation
+        
+        try:
+            # Use the AI service to generate fielding rotation with timeout handling
+            rotation_result = AIService.generate_fielding_rotation(
+                game_id, 
+                players, 
+                innings,
+                required_positions,
+                infield_positions,
+                outfield_positions,
+                no_consecutive_innings,
+                balance_playing_time,
+                allow_same_position,
+                strict_position_balance,
+                temperature,  # Pass temperature to the AI service
+                use_cache=not regenerate
+            )
+            
+            return jsonify(rotation_result), 200
+        except ValueError as ve:
+            if "timeout" in str(ve).lower():
+                # If timeout occurs, return an informative message
+                return standardize_error_response(
+                    'AI Rotation Timeout',
+                    202,  # Accepted but not completed
+                    {
+                        'message': 'The AI fielding rotation could not be generated in time. Please try again later or create a manual rotation.',
+                        'error': str(ve),
+                        'success': False
+                    }
+                )
+            else:
+                # For other ValueErrors, pass through to the general error handler
+                raise ve
     except ValueError as e:
         return standardize_error_response('Invalid request data', 400, str(e))
     except Exception as e:
@@ -5,10 +5,9 @@ from shared.database import db_session, db_error_response, db_get_or_404
 from services.team_service import TeamService
 from services.player_service import PlayerService
 from shared.models import Player, Team
+from backend.utils import render_csv
 import csv
 import io
-import os
-import tempfile
 
 # Main players blueprint
 players = Blueprint("players", __name__)
@@ -16,6 +15,13 @@ players = Blueprint("players", __name__)
 # Nested routes blueprint for team-specific player operations
 players_nested = Blueprint("players_nested", __name__)
 
+# Sample roster offered for download; it is static, so encode it once at import
+PLAYERS_CSV_TEMPLATE = render_csv([
+    ["first_name", "last_name", "jersey_number"],
+    ["John", "Smith", "7"],
+    ["Sarah", "Johnson", "15"],
+])
+
 @players_nested.route('/<int:team_id>/players/csv-template', methods=['GET'])
 @jwt_required()
 def download_csv_template(team_id):
@@ -41,38 +47,14 @@ def download_csv_template(team_id):
             if not team:
                 return jsonify({'error': 'Team not found or unauthorized'}), 404
             
-            # Create CSV template in memory
-            csv_data = io.StringIO()
-            writer = csv.writer(csv_data)
-            
-            # Write headers
-            writer.writerow(["first_name", "last_name", "jersey_number"])
-            
-            # Write sample data
-            writer.writerow(["John", "Smith", "7"])
-            writer.writerow(["Sarah", "Johnson", "15"])
-            
-            # Prepare file for download
-            csv_data.seek(0)
-            
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False)
-            temp_file.write(csv_data.getvalue().encode('utf-8'))
-            temp_file_path = temp_file.name
-            temp_file.close()
-            
             file_name = f"{team.name.replace(' ', '_')}_players_template.csv"
             
-            try:
-                return send_file(
-                    temp_file_path,
-                    mimetype='text/csv',
-                    as_attachment=True,
-                    download_name=file_name
-                )
-            finally:
-                # Clean up temp file after response is sent
-                os.remove(temp_file_path)
+            return send_file(
+                io.BytesIO(PLAYERS_CSV_TEMPLATE),
+                mimetype='text/csv',
+                as_attachment=True,
+                download_name=file_name
+            )
                 
     except Exception as e:
         print(f"Error creating CSV template: {str(e)}")
@@ -201,13 +183,14 @@ def create_player(team_id):
             return jsonify({'error': 'File must be a CSV file'}), 400
         
         try:
-            # Parse CSV file
-            csv_file = io.StringIO(file.read().decode('utf-8'))
+            # Parse the CSV straight from the upload stream, decoding rows as
+            # they are read instead of buffering the whole file as bytes and text
+            csv_file = io.TextIOWrapper(file.stream, encoding='utf-8', newline='')
             csv_reader = csv.DictReader(csv_file)
             
             # Check for required headers
             required_fields = ['first_name', 'last_name', 'jersey_number']
-            if not all(field in csv_reader.fieldnames for field in required_fields):
+            if not all(field in (csv_reader.fieldnames or []) for field in required_fields):
                 return jsonify({'error': 'CSV file must include headers: first_name, last_name, jersey_number'}), 400
             
             # Using commit=True to automatically commit successful operations
@@ -225,23 +208,20 @@ def create_player(team_id):
                         session.delete(player)
                     session.flush()
                 
-                players_imported = 0
                 errors = []
+                valid_rows = []
                 
-                # Process each row in the CSV file
+                # Validate each row in the CSV file
                 for idx, row in enumerate(csv_reader, start=2):  # start=2 for 1-based indexing and skipping header
-                    try:
-                        # Validate row data
-                        for field in required_fields:
-                            if not row.get(field, '').strip():
-                                errors.append(f"Row {idx}: Missing {field}")
-                                continue
-                        
-                        # Create player using service
-                        player = PlayerService.create_player(session, row, team_id)
-                        players_imported += 1
-                    except Exception as e:
-                        errors.append(f"Row {idx}: {str(e)}")
+                    missing = [field for field in required_fields if not (row.get(field) or '').strip()]
+                    if missing:
+                        errors.extend(f"Row {idx}: Missing {field}" for field in missing)
+                        continue
+                    valid_rows.append(row)
+                
+                # Create all valid players in a single flush
+                created_players = PlayerService.create_players(session, valid_rows, team_id)
+                players_imported = len(created_players)
                 
                 if not errors:
                     return jsonify({
@@ -3,6 +3,7 @@ System API endpoints for LineupBoss.
 
 This module provides system-wide API endpoints and utilities.
 """
+import time
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from shared.database import db_session, db_error_response
@@ -10,6 +11,12 @@ from shared.models import User
 
 system = Blueprint('system', __name__)
 
+# A successful database probe is reused for this many seconds, so frequent
+# health checks (load balancer, uptime monitor) don't each hit the database.
+# Failures are never cached.
+DB_HEALTH_CACHE_SECONDS = 30
+_last_db_healthy_at = None
+
 @system.route('/', methods=['GET'])
 def hello():
     """Root endpoint for the API."""
@@ -54,14 +61,18 @@ def health_check():
         db_status = "healthy"
         db_message = "Database is connected"
         
-        try:
-            with db_session(read_only=True) as session:
-                # Just run a simple query to verify database connection
-                from sqlalchemy import text
-                session.execute(text("SELECT 1")).scalar()
-        except Exception as e:
-            db_status = "unhealthy"
-            db_message = f"Database error: {str(e)}"
+        global _last_db_healthy_at
+        if _last_db_healthy_at is None or time.monotonic() - _last_db_healthy_at > DB_HEALTH_CACHE_SECONDS:
+            try:
+                with db_session(read_only=True) as session:
+                    # Just run a simple query to verify database connection
+                    from sqlalchemy import text
+                    session.execute(text("SELECT 1")).scalar()
+                _last_db_healthy_at = time.monotonic()
+            except Exception as e:
+                _last_db_healthy_at = None
+                db_status = "unhealthy"
+                db_message = f"Database error: {str(e)}"
         
         # Add other health checks as needed (cache, external services, etc.)
         
@@ -38,12 +38,9 @@ def get_teams():
             # Log for debugging
             print(f"Getting teams for user ID: {user_id}")
             
-            # Get all teams for the current user via service
-            teams_list = TeamService.get_teams_by_user(session, user_id)
-            print(f"Found {len(teams_list)} teams")
-            
-            # Serialize team objects
-            result = [TeamService.serialize_team(team) for team in teams_list]
+            # Get the serialized teams for the current user via service
+            result = TeamService.get_team_summaries_by_user(session, user_id)
+            print(f"Found {len(result)} teams")
             
             return jsonify(result), 200
     except Exception as e:
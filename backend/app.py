@@ -54,6 +54,11 @@ app.config["JWT_ALGORITHM"] = "HS256"
 app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL", "sqlite:///lineup.db")
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+# Keep API responses small and cheap to encode: never indent JSON (Flask does
+# in debug mode) and don't sort keys, since clients read them by name
+app.json.compact = True
+app.json.sort_keys = False
+
 # If DATABASE_URL starts with postgres://, replace with postgresql://
 # This is needed for SQLAlchemy 1.4+ with Heroku
 db_url = app.config["SQLALCHEMY_DATABASE_URI"]
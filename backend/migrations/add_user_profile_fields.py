@@ -73,6 +73,14 @@ def create_engine_with_retry(database_url, max_retries=3):
     
     return engine
 
+# Column name -> definition for every field this migration adds
+PROFILE_COLUMNS = {
+    'first_name': 'VARCHAR',
+    'last_name': 'VARCHAR',
+    'location': 'VARCHAR',
+    'subscription_tier': "VARCHAR DEFAULT 'rookie' NOT NULL",
+}
+
 def add_user_profile_fields():
     """Add profile fields to users table."""
     try:
@@ -80,48 +88,35 @@ def add_user_profile_fields():
         database_url = get_database_url()
         engine = create_engine_with_retry(database_url)
         
-        # Get engine and connection
-        with engine.connect() as conn:
-            # Check if first_name column exists in users table
-            result = conn.execute(text("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'users' AND column_name = 'first_name'
-            """))
-            
-            has_first_name = result.rowcount > 0
-            
-            # Check if subscription_tier column exists
+        # Run the check and the schema change in one transaction
+        with engine.begin() as conn:
+            # Find which of the profile columns already exist in one query
             result = conn.execute(text("""
             SELECT column_name 
             FROM information_schema.columns 
-            WHERE table_name = 'users' AND column_name = 'subscription_tier'
-            """))
+            WHERE table_name = 'users' AND column_name = ANY(:columns)
+            """), {"columns": list(PROFILE_COLUMNS)})
             
-            has_subscription_tier = result.rowcount > 0
+            existing_columns = {row[0] for row in result}
+            missing_columns = [name for name in PROFILE_COLUMNS if name not in existing_columns]
             
-            # Add columns if they don't exist
-            if not has_first_name:
-                conn.execute(text("""
-                ALTER TABLE users 
-                ADD COLUMN first_name VARCHAR,
-                ADD COLUMN last_name VARCHAR,
-                ADD COLUMN location VARCHAR
-                """))
-                logger.info("Added name and location fields to users table")
-            else:
-                logger.info("Name and location fields already exist in users table")
+            # update_user_address_fields.py later moves location into state and
+            # drops it, so only add location alongside the name fields; a re-run
+            # after that migration must not bring the column back
+            if 'first_name' in existing_columns and 'location' in missing_columns:
+                missing_columns.remove('location')
             
-            if not has_subscription_tier:
-                conn.execute(text("""
-                ALTER TABLE users 
-                ADD COLUMN subscription_tier VARCHAR DEFAULT 'rookie' NOT NULL
-                """))
-                logger.info("Added subscription_tier field to users table")
+            # Add all missing columns with a single ALTER TABLE, so the table
+            # is only locked once
+            if missing_columns:
+                add_clauses = ",\n".join(
+                    f"ADD COLUMN IF NOT EXISTS {name} {PROFILE_COLUMNS[name]}"
+                    for name in missing_columns
+                )
+                conn.execute(text(f"ALTER TABLE users\n{add_clauses}"))
+                logger.info(f"Added {', '.join(missing_columns)} to users table")
             else:
-                logger.info("Subscription_tier field already exists in users table")
-            
-            conn.commit()
+                logger.info("Profile and subscription fields already exist in users table")
             
         return True
     except Exception as e:
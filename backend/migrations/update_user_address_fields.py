@@ -78,79 +78,56 @@ def update_user_address_fields():
         database_url = get_database_url()
         engine = create_engine_with_retry(database_url)
         
-        # Create a fresh connection with autocommit mode
-        connection = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
-        
-        try:
-            # Check if location column exists in users table
+        # Run the whole migration in one transaction, so a failure part way
+        # through (e.g. after adding the new columns but before dropping
+        # location) rolls back instead of leaving a half-migrated table
+        with engine.begin() as connection:
+            # Check for the location and city columns in a single query
             result = connection.execute(text("""
             SELECT column_name 
             FROM information_schema.columns 
-            WHERE table_name = 'users' AND column_name = 'location'
+            WHERE table_name = 'users' AND column_name IN ('location', 'city')
             """))
             
-            rows = result.fetchall()
-            has_location = len(rows) > 0
+            existing_columns = {row[0] for row in result}
+            has_location = 'location' in existing_columns
+            has_city = 'city' in existing_columns
             logger.info(f"Location column exists: {has_location}")
-            
-            # Check if city column exists
-            result = connection.execute(text("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'users' AND column_name = 'city'
-            """))
-            
-            rows = result.fetchall()
-            has_city = len(rows) > 0
             logger.info(f"City column exists: {has_city}")
             
-            # Process based on what we found
-            if has_location and not has_city:
+            if has_city:
+                logger.info("Address fields already exist in users table")
+            else:
                 # Add new columns
                 logger.info("Adding city, state, country, and zip_code columns")
                 connection.execute(text("""
                 ALTER TABLE users 
-                ADD COLUMN city VARCHAR,
-                ADD COLUMN state VARCHAR,
-                ADD COLUMN country VARCHAR DEFAULT 'USA',
-                ADD COLUMN zip_code VARCHAR
+                ADD COLUMN IF NOT EXISTS city VARCHAR,
+                ADD COLUMN IF NOT EXISTS state VARCHAR,
+                ADD COLUMN IF NOT EXISTS country VARCHAR DEFAULT 'USA',
+                ADD COLUMN IF NOT EXISTS zip_code VARCHAR
                 """))
                 logger.info("Added city, state, country, and zip_code fields to users table")
                 
-                # Move location data to state as a temporary measure
-                logger.info("Copying location data to state field")
-                connection.execute(text("""
-                UPDATE users 
-                SET state = location
-                WHERE location IS NOT NULL
-                """))
-                logger.info("Copied location data to state field")
-                
-                # Remove the old location column
-                logger.info("Dropping location column")
-                connection.execute(text("""
-                ALTER TABLE users 
-                DROP COLUMN location
-                """))
-                logger.info("Removed location field from users table")
-            elif not has_location and not has_city:
-                # Add new columns if neither location nor city exists
-                logger.info("Adding city, state, country, and zip_code columns")
-                connection.execute(text("""
-                ALTER TABLE users 
-                ADD COLUMN city VARCHAR,
-                ADD COLUMN state VARCHAR,
-                ADD COLUMN country VARCHAR DEFAULT 'USA',
-                ADD COLUMN zip_code VARCHAR
-                """))
-                logger.info("Added city, state, country, and zip_code fields to users table")
-            elif has_city:
-                logger.info("Address fields already exist in users table")
+                if has_location:
+                    # Move location data to state as a temporary measure
+                    logger.info("Copying location data to state field")
+                    connection.execute(text("""
+                    UPDATE users 
+                    SET state = location
+                    WHERE location IS NOT NULL
+                    """))
+                    logger.info("Copied location data to state field")
+                    
+                    # Remove the old location column
+                    logger.info("Dropping location column")
+                    connection.execute(text("""
+                    ALTER TABLE users 
+                    DROP COLUMN location
+                    """))
+                    logger.info("Removed location field from users table")
             
             logger.info("Migration executed successfully")
-        finally:
-            # Always close the connection
-            connection.close()
             
         return True
     except Exception as e:
@@ -3,16 +3,283 @@ AI service for generating fielding rotations.
 """
 import os
 import json
+import hashlib
+import threading
 import random
 import time
-from typing import Dict, List, Any
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import logging
-from anthropic import Anthropic
+from anthropic import Anthropic, APIConnectionError, APIStatusError
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed rotations are kept for this many seconds so that a retried or
+# resubmitted request with identical inputs is not billed twice
+RESPONSE_CACHE_TTL = int(os.getenv("AI_ROTATION_CACHE_TTL", "3600"))
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+_response_cache: Dict[str, Tuple[float, Dict[int, Dict[str, int]]]] = {}
+_response_cache_lock = threading.Lock()
+
+# Requests currently being sent to the API, keyed like the response cache.
+# Identical requests that arrive meanwhile wait on the same future instead
+# of making a second (billed) call.
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Anthropic clients keyed by API key. The client holds an HTTP connection
+# pool, so reusing it keeps TLS connections alive across requests and retries.
+_clients: Dict[str, Anthropic] = {}
+_clients_lock = threading.Lock()
+
+# Cap on concurrent Anthropic requests from this process, so simultaneous
+# generate clicks queue briefly instead of tripping the API's concurrency limit
+_ANTHROPIC_SEM = threading.BoundedSemaphore(int(os.getenv("ANTHROPIC_MAX_CONCURRENT", "2")))
+# Seconds to wait for a free request slot before giving up
+ANTHROPIC_SLOT_WAIT = 10.0
+
+# Retry policy for transient Anthropic API failures
+MAX_API_RETRIES = int(os.getenv("ANTHROPIC_MAX_RETRIES", "3"))
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504, 529}
+# Total time budget for all attempts; Heroku cuts requests off at 30 seconds
+RETRY_DEADLINE = 25.0
+
+
+@lru_cache(maxsize=64)
+def _build_rules(
+    required_positions: Tuple[str, ...],
+    infield_positions: Tuple[str, ...],
+    outfield_positions: Tuple[str, ...],
+    no_consecutive_innings: bool,
+    balance_playing_time: bool,
+    allow_same_position: bool,
+    strict_position_balance: bool
+) -> str:
+    """
+    Build the rules section of the fielding rotation prompt.
+    
+    Arguments are tuples so results can be cached; the rules only change
+    when the positions or customization options change.
+    
+    Returns:
+        The numbered rules joined into a single string
+    """
+    # Format the list of required positions for the prompt
+    required_positions_str = ', '.join(required_positions)
+    
+    rule_components = [
+        f"1. MOST CRITICAL: In EVERY inning, ALL of these positions MUST be filled EXACTLY ONCE: {required_positions_str}",
+        f"2. Unavailable players (marked \"available\": false) MUST be marked as \"OUT\" in ALL innings",
+        f"3. \"Catcher\" position can ONLY be assigned to players marked as \"can_play_catcher\": true",
+        f"4. ALL positions must be assigned EXACTLY ONE player - no position can be left unfilled",
+        f"5. NO duplicate position assignments within the same inning",
+    ]
+    
+    # Rule about playing the same position multiple times
+    if not allow_same_position:
+        rule_components.append(f"6. NO player should play the SAME position more than once across ALL innings of a game")
+    else:
+        rule_components.append(f"6. Players MAY play the same position multiple times across innings")
+    
+    # Rule about consecutive innings in infield/outfield
+    if no_consecutive_innings:
+        rule_components.append(f"""7. NO player should play infield or outfield in CONSECUTIVE innings (they must alternate or have bench time in between)
+               - Infield positions are: {', '.join(infield_positions)}
+               - Outfield positions are: {', '.join(outfield_positions)}""")
+    else:
+        rule_components.append(f"""7. Players MAY play infield or outfield in consecutive innings
+               - Infield positions are: {', '.join(infield_positions)}
+               - Outfield positions are: {', '.join(outfield_positions)}""")
+    
+    # Rule about balancing playing time
+    if balance_playing_time:
+        playing_time_lines = ["8. BALANCE playing time:"]
+        if strict_position_balance:
+            playing_time_lines += [
+                "               - Every available player should have nearly equal infield time (within 1 inning difference)",
+                "               - Every available player should have nearly equal outfield time (within 1 inning difference)",
+            ]
+        playing_time_lines += [
+            "               - Only use bench if necessary (when there are more players than field positions)",
+            "               - Bench time should be evenly distributed across players (within 1 inning difference)",
+        ]
+        rule_components.append("\n".join(playing_time_lines))
+    else:
+        rule_components.append("8. Even distribution of playing time is NOT required, but try to give everyone some playing time")
+    
+    # Final verification rule
+    rule_components.append(f"9. DOUBLE CHECK that ALL of these positions are assigned in EVERY inning: {required_positions_str}")
+    
+    # Join all rules into a full ruleset
+    return "\n\n".join(rule_components)
+
+
+def _request_cache_key(
+    game_id: int,
+    players: List[Dict[str, Any]],
+    innings: int,
+    all_rules: str,
+    temperature: float
+) -> str:
+    """Hash the inputs that determine a rotation request."""
+    payload = json.dumps(
+        [game_id, players, innings, all_rules, temperature],
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_response(key: str):
+    """Return the cached rotations for key, or None if missing or expired."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, rotations = entry
+        if time.monotonic() - stored_at > RESPONSE_CACHE_TTL:
+            del _response_cache[key]
+            return None
+        return rotations
+
+
+def _store_cached_response(key: str, rotations: Dict[int, Dict[str, int]]) -> None:
+    """Store parsed rotations, dropping expired entries when the cache is full."""
+    with _response_cache_lock:
+        now = time.monotonic()
+        if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+            expired = [k for k, (stored_at, _) in _response_cache.items()
+                       if now - stored_at > RESPONSE_CACHE_TTL]
+            for k in expired:
+                del _response_cache[k]
+            if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                # Still full - drop the oldest entry
+                oldest = min(_response_cache, key=lambda k: _response_cache[k][0])
+                del _response_cache[oldest]
+        _response_cache[key] = (now, rotations)
+
+
+
+def _get_client(api_key: str) -> Anthropic:
+    """Return a shared Anthropic client for api_key, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            # Retries are handled by _call_with_backoff, not the SDK
+            client = Anthropic(api_key=api_key, max_retries=0)
+            _clients[api_key] = client
+        return client
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Work out how long to wait before retrying a failed API call.
+    
+    Honors a Retry-After header when the API sends one, otherwise uses
+    exponential backoff with jitter.
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_DELAY)
+            except ValueError:
+                pass
+    return min(RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 0.5), RETRY_MAX_DELAY)
+
+
+def _call_with_backoff(call, timeout: float, max_retries: int = MAX_API_RETRIES):
+    """
+    Run an API call, retrying rate limits, server errors and network errors.
+    
+    Client errors such as 400 and 401 are raised immediately. A retry is only
+    attempted if it can finish within RETRY_DEADLINE. Each attempt holds one
+    of the process-wide request slots in _ANTHROPIC_SEM.
+    
+    Args:
+        call: Zero-argument function making the API request
+        timeout: Per-request timeout, used to budget the remaining attempts
+        max_retries: Maximum number of retries after the first attempt
+        
+    Returns:
+        The result of call()
+    """
+    started = time.monotonic()
+    for attempt in range(max_retries + 1):
+        # Hold a request slot only while the call is in flight, not while backing off
+        if not _ANTHROPIC_SEM.acquire(timeout=ANTHROPIC_SLOT_WAIT):
+            raise ValueError("Request timeout: all AI request slots are busy. Please try again.")
+        try:
+            return call()
+        except (APIStatusError, APIConnectionError) as e:
+            error = e
+        finally:
+            _ANTHROPIC_SEM.release()
+        
+        status_code = getattr(error, "status_code", None)
+        if status_code is not None and status_code not in RETRYABLE_STATUS_CODES:
+            raise error
+        if attempt == max_retries:
+            raise error
+        delay = _retry_delay(error, attempt)
+        if time.monotonic() - started + delay + timeout > RETRY_DEADLINE:
+            raise error
+        logger.warning(f"Anthropic API call failed ({str(error)}), retrying in {delay:.1f}s "
+                       f"(attempt {attempt + 1} of {max_retries})")
+        time.sleep(delay)
+
+
+# Assignments that don't put a player on the field
+NON_FIELD_POSITIONS = frozenset({"Bench", "OUT"})
+
+
+def _find_first_violation(
+    rotations: Dict[int, Dict[str, int]],
+    required_positions: List[str],
+    players: List[Dict[str, Any]]
+) -> Optional[str]:
+    """
+    Check a parsed rotation against the hard rules, stopping at the first problem.
+    
+    Args:
+        rotations: Parsed rotations mapping innings to position assignments
+        required_positions: Positions that must be filled every inning
+        players: Player objects sent with the request
+        
+    Returns:
+        A description of the first violation found, or None if the rotation is valid
+    """
+    required = set(required_positions)
+    available_ids = {p.get('id') for p in players if p.get('available', True) is not False}
+    catcher_ids = {p.get('id') for p in players if p.get('can_play_catcher')}
+    
+    for inning, positions in rotations.items():
+        missing = required - positions.keys()
+        if missing:
+            return f"Inning {inning} is missing {', '.join(sorted(missing))}"
+        
+        seen = set()
+        for position, player_id in positions.items():
+            if position in NON_FIELD_POSITIONS:
+                continue
+            if player_id not in available_ids:
+                return f"Inning {inning} assigns unknown or unavailable player {player_id} to {position}"
+            if player_id in seen:
+                return f"Inning {inning} assigns player {player_id} to more than one position"
+            if position == "Catcher" and player_id not in catcher_ids:
+                return f"Inning {inning} assigns player {player_id} to Catcher"
+            seen.add(player_id)
+    
+    return None
+
+
 class AIService:
     """Service for AI-related operations."""
     
@@ -28,7 +295,8 @@ class AIService:
         balance_playing_time: bool = True,
         allow_same_position: bool = False,
         strict_position_balance: bool = True,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        use_cache: bool = True
     ) -> Dict[int, Dict[str, int]]:
         """
         Generate a fielding rotation using the Anthropic API.
@@ -40,6 +308,83 @@ class AIService:
             required_positions: List of required positions
             infield_positions: List of infield positions
             outfield_positions: List of outfield positions
+            use_cache: Return a recent result for identical inputs instead of
+                calling the API again. Pass False to force a new rotation.
+            
+        Returns:
+            Dictionary mapping innings to position assignments
+        """
+        # Build the ruleset; this part is deterministic for a given set of
+        # positions and options, so it is cached across generate requests
+        all_rules = _build_rules(
+            tuple(required_positions),
+            tuple(infield_positions),
+            tuple(outfield_positions),
+            no_consecutive_innings,
+            balance_playing_time,
+            allow_same_position,
+            strict_position_balance
+        )
+        
+        # Serve identical requests from the response cache to avoid re-billing
+        cache_key = _request_cache_key(game_id, players, innings, all_rules, temperature)
+        if use_cache:
+            cached = _get_cached_response(cache_key)
+            if cached is not None:
+                logger.info(f"Returning cached fielding rotation for game_id: {game_id}")
+                return cached
+        
+        # Join an identical request that is already in flight, e.g. from a
+        # double-clicked Generate button
+        with _inflight_lock:
+            pending = _inflight.get(cache_key)
+            is_owner = pending is None
+            if is_owner:
+                pending = Future()
+                _inflight[cache_key] = pending
+        
+        if not is_owner:
+            logger.info(f"Waiting on in-flight fielding rotation request for game_id: {game_id}")
+            try:
+                return pending.result(timeout=ANTHROPIC_SLOT_WAIT + RETRY_DEADLINE)
+            except FutureTimeoutError:
+                raise ValueError("Request timeout: an identical request is still in progress")
+        
+        try:
+            rotations = AIService._request_fielding_rotation(
+                game_id, players, innings, required_positions, all_rules, cache_key, temperature
+            )
+        except Exception as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(rotations)
+            return rotations
+        finally:
+            with _inflight_lock:
+                _inflight.pop(cache_key, None)
+    
+    @staticmethod
+    def _request_fielding_rotation(
+        game_id: int,
+        players: List[Dict[str, Any]],
+        innings: int,
+        required_positions: List[str],
+        all_rules: str,
+        cache_key: str,
+        temperature: float
+    ) -> Dict[int, Dict[str, int]]:
+        """
+        Call the Anthropic API for a fielding rotation and parse the response.
+        
+        Args:
+            game_id: Game ID
+            players: List of player objects sent with the request
+            innings: Number of innings
+            required_positions: List of required positions
+            all_rules: Ruleset text built by _build_rules
+            cache_key: Response cache key for these inputs
+            temperature: Sampling temperature
             
         Returns:
             Dictionary mapping innings to position assignments
@@ -61,18 +406,14 @@ class AIService:
             
             logger.info(f"Using Anthropic API key starting with: {api_key[:8]}...")
             
-            # Initialize Anthropic client with better error handling
+            # Get the shared Anthropic client with better error handling
             try:
-                anthropic = Anthropic(api_key=api_key)
-                # Make a minimal test request to validate the API key
-                logger.info("Initializing Anthropic client and testing connection...")
+                anthropic = _get_client(api_key)
+                logger.info("Using shared Anthropic client...")
             except Exception as e:
                 logger.error(f"Failed to initialize Anthropic client: {str(e)}")
                 raise ValueError(f"Anthropic client initialization failed: {str(e)}")
             
-            # Format the list of required positions for the prompt
-            required_positions_str = ', '.join(required_positions)
-            
             # Prepare the data for the prompt
             players_json = json.dumps(players, indent=2)
             
@@ -80,52 +421,6 @@ class AIService:
             random_seed = random.randint(1, 10000)
             timestamp = int(time.time())
             
-            # Create the prompt
-            # Building the prompt with customization options
-            rule_components = [
-                f"1. MOST CRITICAL: In EVERY inning, ALL of these positions MUST be filled EXACTLY ONCE: {required_positions_str}",
-                f"2. Unavailable players (marked \"available\": false) MUST be marked as \"OUT\" in ALL innings",
-                f"3. \"Catcher\" position can ONLY be assigned to players marked as \"can_play_catcher\": true",
-                f"4. ALL positions must be assigned EXACTLY ONE player - no position can be left unfilled",
-                f"5. NO duplicate position assignments within the same inning",
-            ]
-            
-            # Rule about playing the same position multiple times
-            if not allow_same_position:
-                rule_components.append(f"6. NO player should play the SAME position more than once across ALL innings of a game")
-            else:
-                rule_components.append(f"6. Players MAY play the same position multiple times across innings")
-            
-            # Rule about consecutive innings in infield/outfield
-            if no_consecutive_innings:
-                rule_components.append(f"""7. NO player should play infield or outfield in CONSECUTIVE innings (they must alternate or have bench time in between)
-               - Infield positions are: {', '.join(infield_positions)}
-               - Outfield positions are: {', '.join(outfield_positions)}""")
-            else:
-                rule_components.append(f"""7. Players MAY play infield or outfield in consecutive innings
-               - Infield positions are: {', '.join(infield_positions)}
-               - Outfield positions are: {', '.join(outfield_positions)}""")
-            
-            # Rule about balancing playing time
-            if balance_playing_time:
-                playing_time_rule = "8. BALANCE playing time:"
-                if strict_position_balance:
-                    playing_time_rule += """
-               - Every available player should have nearly equal infield time (within 1 inning difference)
-               - Every available player should have nearly equal outfield time (within 1 inning difference)"""
-                playing_time_rule += """
-               - Only use bench if necessary (when there are more players than field positions)
-               - Bench time should be evenly distributed across players (within 1 inning difference)"""
-                rule_components.append(playing_time_rule)
-            else:
-                rule_components.append("8. Even distribution of playing time is NOT required, but try to give everyone some playing time")
-            
-            # Final verification rule
-            rule_components.append(f"9. DOUBLE CHECK that ALL of these positions are assigned in EVERY inning: {required_positions_str}")
-            
-            # Join all rules into a full ruleset
-            all_rules = "\n\n".join(rule_components)
-            
             prompt = f"""
             You are an expert baseball coach assistant that specializes in creating fair and balanced fielding rotations.
             
@@ -165,15 +460,18 @@ class AIService:
                 timeout = 8.0  # 8 seconds timeout to stay within Heroku's limits
                 
                 # Use the user-provided temperature parameter
-                response = anthropic.messages.create(
-                    model="claude-3-5-sonnet-20240620",  # Use the latest model directly
-                    max_tokens=4000,
-                    temperature=temperature,  # Use the temperature parameter passed from the frontend
-                    system="You are an expert baseball coach assistant that creates fielding rotations. Respond only with JSON.",
-                    messages=[
-                        {"role": "user", "content": prompt}
-                    ],
-                    timeout=timeout  # Add timeout parameter
+                response = _call_with_backoff(
+                    lambda: anthropic.messages.create(
+                        model="claude-3-5-sonnet-20240620",  # Use the latest model directly
+                        max_tokens=4000,
+                        temperature=temperature,  # Use the temperature parameter passed from the frontend
+                        system="You are an expert baseball coach assistant that creates fielding rotations. Respond only with JSON.",
+                        messages=[
+                            {"role": "user", "content": prompt}
+                        ],
+                        timeout=timeout  # Add timeout parameter
+                    ),
+                    timeout
                 )
                 logger.info(f"Successfully received response with ID: {response.id}")
                 
@@ -250,6 +548,14 @@ class AIService:
                 if not rotations:
                     logger.warning("No valid rotations parsed, generating a simple default")
                     rotations = {1: {"error": "Failed to parse response"}}
+                else:
+                    # Only cache rotations that pass the hard rules so a bad
+                    # response is not replayed for the whole TTL
+                    violation = _find_first_violation(rotations, required_positions, players)
+                    if violation:
+                        logger.warning(f"AI rotation for game_id {game_id} failed validation: {violation}")
+                    else:
+                        _store_cached_response(cache_key, rotations)
                 
                 # Ensure consistent output format with rotations at top level
                 logger.info(f"Returning rotation result with {len(rotations)} innings")
@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 
 # Safe imports with fallbacks
 try:
-    from sqlalchemy import func
+    from sqlalchemy import exists
     from sqlalchemy.dialects.postgresql import JSONB
     # Update to use the correct database module paths
     from database import db_session
@@ -47,6 +47,11 @@ except ImportError as e:
         logger.error(f"Database error: {message} - {str(error)}")
         return {"error": message}, 500
 
+# Position categories used when classifying fielding assignments
+INFIELD = frozenset({"Pitcher", "1B", "2B", "3B", "SS"})
+OUTFIELD = frozenset({"Catcher", "LF", "RF", "LC", "RC"})
+BENCH = "Bench"
+
 class AnalyticsService:
     """Service for analytics operations."""
     
@@ -110,6 +115,20 @@ class AnalyticsService:
             
             logger.info(f"Created batting order map with {len(game_to_batting)} entries")
             
+            # Player ID -> 1-based batting position for each game, so each player
+            # is a dict lookup rather than a list scan plus .index() per game.
+            # Built in reverse so a duplicated ID keeps its first position.
+            game_batting_positions = {
+                game_id: {player_id: index + 1 for index, player_id in reversed(list(enumerate(order)))}
+                for game_id, order in game_to_batting.items()
+            }
+            
+            # Format each game's date once rather than once per player
+            game_dates = {
+                game.id: game.game_date.strftime("%Y-%m-%d") if getattr(game, 'game_date', None) else None
+                for game in games
+            }
+            
             # Process stats for each player
             for player in players:
                 stats = {
@@ -128,9 +147,9 @@ class AnalyticsService:
                 positions = []
                 
                 for game in games:
-                    if game.id in game_to_batting and player.id in game_to_batting[game.id]:
+                    position = game_batting_positions.get(game.id, {}).get(player.id)
+                    if position is not None:
                         # Player was in the batting order for this game
-                        position = game_to_batting[game.id].index(player.id) + 1
                         positions.append(position)
                         
                         # Increment the count for this position
@@ -139,7 +158,7 @@ class AnalyticsService:
                         # Add to history
                         stats["batting_position_history"].append({
                             "game_id": game.id,
-                            "game_date": game.game_date.strftime("%Y-%m-%d") if hasattr(game, 'game_date') and game.game_date else None,
+                            "game_date": game_dates[game.id],
                             "opponent": game.opponent,
                             "position": position
                         })
@@ -155,7 +174,7 @@ class AnalyticsService:
                 
                 # Always return stats for players, even if empty
                 player_stats.append(stats)
-                logger.info(f"Player {player.id} ({player.full_name()}): found {len(positions)} batting positions")
+                logger.info(f"Player {player.id} ({stats['name']}): found {len(positions)} batting positions")
         
         return player_stats
     
@@ -205,13 +224,24 @@ class AnalyticsService:
             ).all()
             logger.info(f"Found {len(availability_data)} player availability records for team {team_id}")
             
-            # Create a map of game_id and inning to positions
+            # Create a map of game_id and inning to {player_id: position}. Stored
+            # player IDs may be ints or digit strings, so they are converted once
+            # here instead of being re-checked for every player and inning.
             game_inning_positions = {}
             for rotation in fielding_rotations:
                 if rotation.positions:
+                    player_positions = {}
+                    for pos, player_id in rotation.positions.items():
+                        if isinstance(player_id, str) and player_id.isdigit():
+                            player_id = int(player_id)
+                        elif not isinstance(player_id, int):
+                            logger.warning(f"Invalid player ID format: {player_id} for position {pos}")
+                            continue
+                        # Keep the first position if a player appears twice
+                        player_positions.setdefault(player_id, pos)
                     if rotation.game_id not in game_inning_positions:
                         game_inning_positions[rotation.game_id] = {}
-                    game_inning_positions[rotation.game_id][rotation.inning] = rotation.positions
+                    game_inning_positions[rotation.game_id][rotation.inning] = player_positions
                     logger.info(f"Game {rotation.game_id}, Inning {rotation.inning} has positions: {rotation.positions}")
                 else:
                     logger.info(f"Game {rotation.game_id}, Inning {rotation.inning} has empty positions data")
@@ -225,10 +255,11 @@ class AnalyticsService:
                     game_player_availability[availability.game_id] = {}
                 game_player_availability[availability.game_id][availability.player_id] = availability.available
             
-            # Constants for position categories
-            INFIELD = ["Pitcher", "1B", "2B", "3B", "SS"]
-            OUTFIELD = ["Catcher", "LF", "RF", "LC", "RC"]
-            BENCH = "Bench"
+            # Format each game's date once rather than once per player
+            game_dates = {
+                game.id: game.game_date.strftime("%Y-%m-%d") if getattr(game, 'game_date', None) else None
+                for game in games
+            }
             
             # Process stats for each player
             for player in players:
@@ -267,23 +298,11 @@ class AnalyticsService:
                     # Track positions for each inning
                     game_positions = []
                     
-                    for inning, positions in game_inning_positions[game.id].items():
+                    for inning, player_positions in game_inning_positions[game.id].items():
                         stats["total_innings"] += 1
                         
-                        # Find this player's position in this inning
-                        position = BENCH  # Default to bench
-                        for pos, player_id in positions.items():
-                            try:
-                                # Handle case where player_id might be a string or number
-                                if isinstance(player_id, int) and player_id == player.id:
-                                    position = pos
-                                    break
-                                elif isinstance(player_id, str) and player_id.isdigit() and int(player_id) == player.id:
-                                    position = pos
-                                    break
-                            except (ValueError, TypeError):
-                                logger.warning(f"Invalid player ID format: {player_id} for position {pos}")
-                                continue
+                        # Find this player's position in this inning, defaulting to bench
+                        position = player_positions.get(player.id, BENCH)
                         
                         # Count by position category
                         if position in INFIELD:
@@ -306,7 +325,7 @@ class AnalyticsService:
                     if game_positions:
                         stats["position_history"].append({
                             "game_id": game.id,
-                            "game_date": game.game_date.strftime("%Y-%m-%d") if hasattr(game, 'game_date') and game.game_date else None,
+                            "game_date": game_dates[game.id],
                             "opponent": game.opponent,
                             "innings": game_positions
                         })
@@ -317,7 +336,7 @@ class AnalyticsService:
                 
                 # Always return stats for players, even if empty
                 player_stats.append(stats)
-                logger.info(f"Player {player.id} ({player.full_name()}): found {stats['infield_innings'] + stats['outfield_innings']} fielding assignments")
+                logger.info(f"Player {player.id} ({stats['name']}): found {stats['infield_innings'] + stats['outfield_innings']} fielding assignments")
         
         return player_stats
     
@@ -347,8 +366,18 @@ class AnalyticsService:
                 "error": "Missing database dependencies"
             }
         with db_session(read_only=True) as session:
-            # Get all games for this team
-            games = session.query(Game).filter_by(team_id=team_id).all()
+            # Get all games for this team along with their batting order and
+            # whether they have any fielding rotation, in a single round trip
+            # (each game has at most one batting order)
+            has_fielding = exists().where(FieldingRotation.game_id == Game.id)
+            rows = session.query(
+                Game,
+                BattingOrder.order_data,
+                has_fielding.label('has_fielding')
+            ).outerjoin(
+                BattingOrder, BattingOrder.game_id == Game.id
+            ).filter(Game.team_id == team_id).all()
+            games = [row.Game for row in rows]
             logger.info(f"Found {len(games)} games for team {team_id}")
             
             # Basic team stats
@@ -377,31 +406,20 @@ class AnalyticsService:
                 logger.info(f"No games found for team {team_id}")
                 return stats
             
-            # Get batting orders for these games
-            game_ids = [g.id for g in games_with_dates]
-            batting_orders = session.query(BattingOrder).filter(
-                BattingOrder.game_id.in_(game_ids)
-            ).all()
-            logger.info(f"Found {len(batting_orders)} batting orders for team {team_id}")
-            
             # Create a map of game_id to batting order
             game_to_batting = {}
-            for bo in batting_orders:
-                if bo.order_data:
+            for row in rows:
+                order_data = row.order_data
+                if order_data:
                     # Handle both possible formats of batting order data
-                    if isinstance(bo.order_data, list):
-                        game_to_batting[bo.game_id] = bo.order_data
-                    elif isinstance(bo.order_data, dict) and 'order_data' in bo.order_data:
-                        game_to_batting[bo.game_id] = bo.order_data['order_data']
-            
-            # Get fielding rotations for these games
-            fielding_query = session.query(FieldingRotation.game_id, 
-                                          func.count(FieldingRotation.id).label('count')
-                                         ).filter(
-                FieldingRotation.game_id.in_(game_ids)
-            ).group_by(FieldingRotation.game_id).all()
+                    if isinstance(order_data, list):
+                        game_to_batting[row.Game.id] = order_data
+                    elif isinstance(order_data, dict) and 'order_data' in order_data:
+                        game_to_batting[row.Game.id] = order_data['order_data']
+            logger.info(f"Found {len(game_to_batting)} batting orders for team {team_id}")
             
-            fielding_games = {game_id: count for game_id, count in fielding_query}
+            # Games with at least one fielding rotation
+            fielding_games = {row.Game.id for row in rows if row.has_fielding}
             logger.info(f"Found {len(fielding_games)} games with fielding rotations for team {team_id}")
             
             # Find games with both batting and fielding data
@@ -1,7 +1,7 @@
 """
 Game service for handling game-related business logic.
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import text
 from models.models import Game, Team, BattingOrder, FieldingRotation, PlayerAvailability, Player
 
@@ -67,6 +67,36 @@ class GameService:
         
         return game
     
+    @staticmethod
+    def create_games(db: Session, games_data: list, team_id: int):
+        """
+        Create several games in one flush.
+        
+        Args:
+            db: Database session
+            games_data: List of dictionaries containing game data
+            team_id: Team ID to assign the games to
+            
+        Returns:
+            List of newly created games
+        """
+        games = [
+            Game(
+                team_id=team_id,
+                game_number=game_data['game_number'],
+                date=game_data.get('date'),
+                time=game_data.get('time'),
+                opponent=game_data.get('opponent', ''),
+                innings=game_data.get('innings', 6)
+            )
+            for game_data in games_data
+        ]
+        
+        db.add_all(games)
+        db.flush()  # Single flush for the whole batch
+        
+        return games
+    
     @staticmethod
     def update_game(db: Session, game: Game, game_data: dict):
         """
@@ -158,8 +188,70 @@ class GameService:
         Returns:
             Created or updated BattingOrder object
         """
-        batting_order = db.query(BattingOrder).filter(BattingOrder.game_id == game_id).first()
+        batting_order = GameService.get_batting_order(db, game_id)
+        return GameService.save_batting_order(db, game_id, order_data, batting_order)
+    
+    @staticmethod
+    def normalize_batting_order(order_data: list):
+        """
+        Convert submitted batting order entries to player IDs in one pass.
         
+        Args:
+            order_data: List of player IDs in batting order
+            
+        Returns:
+            List of integer player IDs, in batting order
+            
+        Raises:
+            ValueError: If an entry is not a positive integer (or a string of
+                digits) or repeats a player already in the order
+        """
+        seen = set()
+        normalized = []
+        invalid = []
+        repeated = []
+        for entry in order_data:
+            if isinstance(entry, int) and not isinstance(entry, bool):
+                player_id = entry
+            elif isinstance(entry, str) and entry.isdecimal():
+                player_id = int(entry)
+            else:
+                invalid.append(entry)
+                continue
+            if player_id <= 0:
+                invalid.append(entry)
+            elif player_id in seen:
+                repeated.append(entry)
+            else:
+                seen.add(player_id)
+                normalized.append(player_id)
+        
+        problems = []
+        if invalid:
+            problems.append(f"invalid player IDs {invalid!r}")
+        if repeated:
+            problems.append(f"repeated player IDs {repeated!r}")
+        if problems:
+            raise ValueError(f"Batting order has {' and '.join(problems)}")
+        return normalized
+    
+    @staticmethod
+    def save_batting_order(db: Session, game_id: int, order_data: list, batting_order: BattingOrder = None):
+        """
+        Write a batting order the caller has already looked up, or create one.
+        
+        Lets callers that loaded the existing row (e.g. to pick a status code)
+        save without querying for it again.
+        
+        Args:
+            db: Database session
+            game_id: Game ID
+            order_data: List of player IDs in batting order
+            batting_order: Existing BattingOrder for the game, or None to create one
+            
+        Returns:
+            Created or updated BattingOrder object
+        """
         if batting_order:
             batting_order.order_data = order_data
         else:
@@ -231,6 +323,44 @@ class GameService:
         
         return rotation
     
+    @staticmethod
+    def batch_create_or_update_fielding_rotations(db: Session, game_id: int, rotations_data: dict):
+        """
+        Create or update fielding rotations for several innings at once.
+        
+        Existing rotations are loaded with a single query and all changes are
+        flushed together.
+        
+        Args:
+            db: Database session
+            game_id: Game ID
+            rotations_data: Dictionary mapping inning numbers to position assignments
+            
+        Returns:
+            List of created or updated FieldingRotation objects, in input order
+        """
+        existing = {
+            rotation.inning: rotation
+            for rotation in db.query(FieldingRotation).filter(
+                FieldingRotation.game_id == game_id,
+                FieldingRotation.inning.in_(list(rotations_data.keys()))
+            ).all()
+        }
+        
+        result = []
+        for inning, positions in rotations_data.items():
+            rotation = existing.get(inning)
+            if rotation:
+                rotation.positions = positions
+            else:
+                rotation = FieldingRotation(game_id=game_id, inning=inning, positions=positions)
+                db.add(rotation)
+            result.append(rotation)
+        
+        db.flush()  # Flush changes without committing
+        
+        return result
+    
     @staticmethod
     def get_player_availability(db: Session, game_id: int):
         """
@@ -241,9 +371,31 @@ class GameService:
             game_id: Game ID
             
         Returns:
-            List of PlayerAvailability objects
+            List of PlayerAvailability objects, with their players loaded
+        """
+        # Load players in the same query; serializing each record's player
+        # details would otherwise lazy-load them one query per record
+        return db.query(PlayerAvailability).options(
+            joinedload(PlayerAvailability.player)
+        ).filter(PlayerAvailability.game_id == game_id).all()
+    
+    @staticmethod
+    def get_unavailable_player_ids(db: Session, game_id: int):
+        """
+        Get the IDs of players explicitly marked unavailable for a game.
+        
+        Args:
+            db: Database session
+            game_id: Game ID
+            
+        Returns:
+            Set of player IDs
         """
-        return db.query(PlayerAvailability).filter(PlayerAvailability.game_id == game_id).all()
+        rows = db.query(PlayerAvailability.player_id).filter(
+            PlayerAvailability.game_id == game_id,
+            PlayerAvailability.available.is_(False)
+        ).all()
+        return {row.player_id for row in rows}
     
     @staticmethod
     def get_player_availability_by_player(db: Session, game_id: int, player_id: int):
@@ -320,6 +472,9 @@ class GameService:
         """
         Set availability status for multiple players in a game.
         
+        Existing availability records are loaded with a single query and all
+        changes are flushed together.
+        
         Args:
             db: Database session
             game_id: Game ID
@@ -328,21 +483,38 @@ class GameService:
         Returns:
             List of created or updated PlayerAvailability objects
         """
-        result = []
+        player_ids = [data['player_id'] for data in availability_data]
+        existing = {
+            availability.player_id: availability
+            for availability in db.query(PlayerAvailability).filter(
+                PlayerAvailability.game_id == game_id,
+                PlayerAvailability.player_id.in_(player_ids)
+            ).all()
+        }
         
+        result = []
         for data in availability_data:
             player_id = data['player_id']
             available = data.get('available', True)
             can_play_catcher = data.get('can_play_catcher', False)
             
-            availability = GameService.set_player_availability(
-                db, game_id, player_id, available, can_play_catcher
-            )
+            availability = existing.get(player_id)
+            if availability:
+                availability.available = available
+                availability.can_play_catcher = can_play_catcher
+            else:
+                availability = PlayerAvailability(
+                    game_id=game_id,
+                    player_id=player_id,
+                    available=available,
+                    can_play_catcher=can_play_catcher
+                )
+                db.add(availability)
+                existing[player_id] = availability
             
             result.append(availability)
         
-        # No need to commit here, as the db_session in the controller will handle it
-        # Each set_player_availability call will flush its changes
+        db.flush()  # Flush changes without committing
         
         return result
     
@@ -403,6 +575,17 @@ class GameService:
             'positions': rotation.positions
         }
     
+    @staticmethod
+    def _serialize_availability_player(player):
+        """Serialize the player details nested in an availability record."""
+        return {
+            'id': player.id,
+            'first_name': player.first_name,
+            'last_name': player.last_name,
+            'jersey_number': player.jersey_number,
+            'full_name': player.full_name()
+        }
+    
     @staticmethod
     def serialize_player_availability(availability: PlayerAvailability, include_player: bool = False):
         """
@@ -424,12 +607,30 @@ class GameService:
         }
         
         if include_player and availability.player:
-            result['player'] = {
-                'id': availability.player.id,
-                'first_name': availability.player.first_name,
-                'last_name': availability.player.last_name,
-                'jersey_number': availability.player.jersey_number,
-                'full_name': availability.player.full_name()
-            }
+            result['player'] = GameService._serialize_availability_player(availability.player)
+        
+        return result
+    
+    @staticmethod
+    def default_player_availability(game_id: int, player):
+        """
+        Serialize the default availability for a player with no stored record.
+        
+        Matches serialize_player_availability(..., include_player=True) with the
+        defaults the batch endpoints assume (available, not catching).
         
+        Args:
+            game_id: Game ID
+            player: Player object
+            
+        Returns:
+            Dictionary representing the player availability
+        """
+        # Serialize an unsaved record so both shapes share one serializer; the
+        # player is attached to the dict, not the record, to keep it out of the session
+        default = PlayerAvailability(
+            game_id=game_id, player_id=player.id, available=True, can_play_catcher=False
+        )
+        result = GameService.serialize_player_availability(default)
+        result['player'] = GameService._serialize_availability_player(player)
         return result
\ No newline at end of file
@@ -39,6 +39,27 @@ class PlayerService:
             Team.user_id == user_id
         ).first()
     
+    @staticmethod
+    def get_owned_player_ids(db: Session, player_ids: list, user_id: int):
+        """
+        Find which of the given players belong to one of the user's teams.
+        
+        Checks the whole list with a single query instead of one lookup per player.
+        
+        Args:
+            db: Database session
+            player_ids: Player IDs to check
+            user_id: User ID to verify ownership
+            
+        Returns:
+            Set of the player IDs owned by the user
+        """
+        rows = db.query(Player.id).join(Team).filter(
+            Player.id.in_(player_ids),
+            Team.user_id == user_id
+        ).all()
+        return {row.id for row in rows}
+    
     @staticmethod
     def create_player(db: Session, player_data: dict, team_id: int):
         """
@@ -70,6 +91,40 @@ class PlayerService:
         
         return player
     
+    @staticmethod
+    def create_players(db: Session, players_data: list, team_id: int):
+        """
+        Create several players in one flush.
+        
+        Args:
+            db: Database session
+            players_data: List of dictionaries containing player data
+            team_id: Team ID to assign the players to
+            
+        Returns:
+            List of newly created players
+            
+        Note:
+            This method doesn't commit changes to the database.
+            The caller is responsible for committing the transaction.
+        """
+        players = [
+            Player(
+                team_id=team_id,
+                first_name=player_data['first_name'],
+                last_name=player_data['last_name'],
+                jersey_number=player_data['jersey_number']
+            )
+            for player_data in players_data
+        ]
+        
+        # Add to session but don't commit - caller will commit
+        db.add_all(players)
+        # Single flush for the whole batch
+        db.flush()
+        
+        return players
+    
     @staticmethod
     def update_player(db: Session, player: Player, player_data: dict):
         """
@@ -22,6 +22,31 @@ class TeamService:
         """
         return db.query(Team).filter(Team.user_id == user_id).all()
     
+    @staticmethod
+    def get_team_summaries_by_user(db: Session, user_id: int):
+        """
+        Get serialized teams owned by a user.
+        
+        Selects only the serialized columns, so rows come back as plain
+        tuples instead of being built into tracked Team objects first.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            List of dictionaries shaped like serialize_team output
+        """
+        rows = db.query(
+            Team.id,
+            Team.name,
+            Team.league,
+            Team.head_coach,
+            Team.assistant_coach1,
+            Team.assistant_coach2
+        ).filter(Team.user_id == user_id).all()
+        return [dict(row._mapping) for row in rows]
+    
     @staticmethod
     def get_team(db: Session, team_id: int, user_id: int):
         """
@@ -1,6 +1,8 @@
 """
 Utility functions for the backend.
 """
+import csv
+import io
 import json
 import re
 from functools import wraps
@@ -192,4 +194,19 @@ def standardize_error_response(error_message, status_code=400, details=None):
     if details:
         response['details'] = details
         
-    return jsonify(response), status_code
\ No newline at end of file
+    return jsonify(response), status_code
+
+
+def render_csv(rows):
+    """
+    Encode rows as UTF-8 CSV bytes.
+    
+    Args:
+        rows: Iterable of rows, each a list of cell values
+        
+    Returns:
+        CSV content as bytes
+    """
+    csv_data = io.StringIO()
+    csv.writer(csv_data).writerows(rows)
+    return csv_data.getvalue().encode('utf-8')
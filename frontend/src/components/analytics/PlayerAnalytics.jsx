@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useMemo } from "react";
 import { getBattingAnalytics, getFieldingAnalytics } from "../../services/api";
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
 
@@ -48,15 +48,21 @@ const PlayerAnalytics = ({ teamId }) => {
     fetchData();
   }, [teamId]);
   
+  // Player ID -> analytics record for each tab, so selecting a player is a
+  // lookup rather than a search through the list
+  const battingById = useMemo(
+    () => new Map(battingAnalytics.map(p => [p.player_id, p])),
+    [battingAnalytics]
+  );
+  const fieldingById = useMemo(
+    () => new Map(fieldingAnalytics.map(p => [p.player_id, p])),
+    [fieldingAnalytics]
+  );
+  
   // Function to handle player selection
   const handlePlayerSelect = (playerId) => {
-    if (activeTab === "batting") {
-      const player = battingAnalytics.find(p => p.player_id === playerId);
-      setSelectedPlayer(player);
-    } else {
-      const player = fieldingAnalytics.find(p => p.player_id === playerId);
-      setSelectedPlayer(player);
-    }
+    const playersById = activeTab === "batting" ? battingById : fieldingById;
+    setSelectedPlayer(playersById.get(playerId));
   };
   
   // Update selected player when tab changes
@@ -82,10 +88,15 @@ const PlayerAnalytics = ({ teamId }) => {
   const prepareBattingPositionData = (player) => {
     if (!player || !player.batting_positions) return [];
     
-    return Object.entries(player.batting_positions).map(([position, count]) => ({
-      position: `#${position}`,
-      count
-    })).sort((a, b) => parseInt(a.position.substring(1)) - parseInt(b.position.substring(1)));
+    // Sort on the numeric position before labelling, rather than parsing the
+    // "#n" label back into a number on every comparison
+    return Object.entries(player.batting_positions)
+      .map(([position, count]) => [Number(position), count])
+      .sort((a, b) => a[0] - b[0])
+      .map(([position, count]) => ({
+        position: `#${position}`,
+        count
+      }));
   };
   
   // Function to transform fielding position data for charts
@@ -135,6 +146,12 @@ const PlayerAnalytics = ({ teamId }) => {
     ];
   };
   
+  // Chart data for the selected player, derived once per selection instead of
+  // on every render (the category data was also built twice per render)
+  const battingPositionData = useMemo(() => prepareBattingPositionData(selectedPlayer), [selectedPlayer]);
+  const fieldingCategoryData = useMemo(() => prepareFieldingCategoryData(selectedPlayer), [selectedPlayer]);
+  const fieldingPositionData = useMemo(() => prepareFieldingPositionData(selectedPlayer), [selectedPlayer]);
+  
   // Render loading state
   if (loading) {
     return <div className="text-center my-5"><div className="spinner-border"></div></div>;
@@ -255,7 +272,7 @@ const PlayerAnalytics = ({ teamId }) => {
                         <div className="col-md-6">
                           <h6>Batting Position Distribution</h6>
                           <ResponsiveContainer width="100%" height={200}>
-                            <BarChart data={prepareBattingPositionData(selectedPlayer)}>
+                            <BarChart data={battingPositionData}>
                               <CartesianGrid strokeDasharray="3 3" />
                               <XAxis dataKey="position" />
                               <YAxis allowDecimals={false} />
@@ -334,7 +351,7 @@ const PlayerAnalytics = ({ teamId }) => {
                           <ResponsiveContainer width="100%" height={200}>
                             <PieChart>
                               <Pie
-                                data={prepareFieldingCategoryData(selectedPlayer)}
+                                data={fieldingCategoryData}
                                 cx="50%"
                                 cy="50%"
                                 outerRadius={80}
@@ -343,7 +360,7 @@ const PlayerAnalytics = ({ teamId }) => {
                                 nameKey="name"
                                 label={({name, percent}) => `${name}: ${(percent * 100).toFixed(0)}%`}
                               >
-                                {prepareFieldingCategoryData(selectedPlayer).map((entry, index) => (
+                                {fieldingCategoryData.map((entry, index) => (
                                   <Cell key={`cell-${index}`} fill={COLORS[index % COLORS.length]} />
                                 ))}
                               </Pie>
@@ -375,7 +392,7 @@ const PlayerAnalytics = ({ teamId }) => {
                       <div className="mt-4">
                         <h6>Positions Played</h6>
                         <ResponsiveContainer width="100%" height={300}>
-                          <BarChart data={prepareFieldingPositionData(selectedPlayer)}>
+                          <BarChart data={fieldingPositionData}>
                             <CartesianGrid strokeDasharray="3 3" />
                             <XAxis dataKey="position" />
                             <YAxis allowDecimals={false} />
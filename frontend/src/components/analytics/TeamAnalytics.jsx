@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useMemo } from "react";
 import { getTeamAnalytics } from "../../services/api";
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
 
@@ -31,17 +31,21 @@ const TeamAnalytics = ({ teamId }) => {
   const prepareMonthlyData = (data) => {
     if (!data || !data.games_by_month) return [];
     
-    return Object.entries(data.games_by_month).map(([month, count]) => {
-      // Transform YYYY-MM to a more readable format
-      const [year, monthNum] = month.split('-');
-      const date = new Date(parseInt(year), parseInt(monthNum) - 1, 1);
-      const monthName = date.toLocaleString('default', { month: 'short' });
-      
-      return {
-        month: `${monthName} ${year}`,
-        count
-      };
-    }).sort((a, b) => new Date(a.month) - new Date(b.month));
+    // Sort on the YYYY-MM keys, which order chronologically as strings,
+    // before turning them into display labels
+    return Object.entries(data.games_by_month)
+      .sort(([a], [b]) => a.localeCompare(b))
+      .map(([month, count]) => {
+        // Transform YYYY-MM to a more readable format
+        const [year, monthNum] = month.split('-');
+        const date = new Date(parseInt(year), parseInt(monthNum) - 1, 1);
+        const monthName = date.toLocaleString('default', { month: 'short' });
+        
+        return {
+          month: `${monthName} ${year}`,
+          count
+        };
+      });
   };
   
   // Function to transform day of week data for charts
@@ -59,6 +63,10 @@ const TeamAnalytics = ({ teamId }) => {
       .sort((a, b) => dayOrder.indexOf(a.day) - dayOrder.indexOf(b.day));
   };
   
+  // Chart data only changes when the analytics reload
+  const monthlyData = useMemo(() => prepareMonthlyData(analytics), [analytics]);
+  const dailyData = useMemo(() => prepareDailyData(analytics), [analytics]);
+  
   // Render loading state
   if (loading) {
     return <div className="text-center my-5"><div className="spinner-border"></div></div>;
@@ -129,7 +137,7 @@ const TeamAnalytics = ({ teamId }) => {
             </div>
             <div className="card-body">
               <ResponsiveContainer width="100%" height={300}>
-                <BarChart data={prepareMonthlyData(analytics)}>
+                <BarChart data={monthlyData}>
                   <CartesianGrid strokeDasharray="3 3" />
                   <XAxis dataKey="month" />
                   <YAxis allowDecimals={false} />
@@ -149,7 +157,7 @@ const TeamAnalytics = ({ teamId }) => {
             </div>
             <div className="card-body">
               <ResponsiveContainer width="100%" height={300}>
-                <BarChart data={prepareDailyData(analytics)}>
+                <BarChart data={dailyData}>
                   <CartesianGrid strokeDasharray="3 3" />
                   <XAxis dataKey="day" />
                   <YAxis allowDecimals={false} />
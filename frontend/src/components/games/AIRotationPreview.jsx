@@ -0,0 +1,171 @@
+import React, { useMemo } from "react";
+import { INFIELD_SET, OUTFIELD_SET } from "../../constants";
+
+// Preview of an AI-generated rotation. Memoized so changes elsewhere in the
+// AI modal (options, temperature, loading state) don't rebuild the tables;
+// it only re-renders when the rotation, players, batting order or innings change.
+const AIRotationPreview = ({ aiRotations, availablePlayers, battingOrder, innings }) => {
+  // Generate array of innings
+  const inningsArray = useMemo(
+    () => Array.from({ length: innings }, (_, i) => i + 1),
+    [innings]
+  );
+
+  // Sort players by batting order, then by jersey number
+  const sortedPlayers = useMemo(() => {
+    // Player ID -> 1-based batting position, built once instead of a findIndex per player
+    const battingPositions = new Map(battingOrder.map((id, index) => [id, index + 1]));
+
+    return [...availablePlayers]
+      .map(player => ({ ...player, battingPosition: battingPositions.get(player.id) ?? null }))
+      .sort((a, b) => {
+        const aOrder = a.battingPosition;
+        const bOrder = b.battingPosition;
+
+        // If both have batting positions, sort by batting order
+        if (aOrder !== null && bOrder !== null) {
+          return aOrder - bOrder;
+        }
+
+        // If only one has a batting position, put that one first
+        if (aOrder !== null) return -1;
+        if (bOrder !== null) return 1;
+
+        // If neither has a batting position, sort by jersey number
+        return a.jersey_number - b.jersey_number;
+      });
+  }, [availablePlayers, battingOrder]);
+
+  // Invert each inning once into player ID -> position, so building a row is a
+  // lookup per inning instead of a scan over every position
+  const positionsByInning = useMemo(() => {
+    const byInning = {};
+    inningsArray.forEach(inning => {
+      const playerPositions = new Map();
+      for (const [pos, pid] of Object.entries(aiRotations[inning] || {})) {
+        // Keep the first position if a player appears twice
+        if (!playerPositions.has(pid)) {
+          playerPositions.set(pid, pos);
+        }
+      }
+      byInning[inning] = playerPositions;
+    });
+    return byInning;
+  }, [inningsArray, aiRotations]);
+
+  // Per-player positions by inning plus infield/outfield/bench totals, shared by both tables
+  const playerRows = useMemo(() => {
+    return sortedPlayers.map(player => {
+      const summary = {
+        infield: 0,
+        outfield: 0,
+        bench: 0,
+        positions: {}
+      };
+      const inningPositions = {};
+
+      inningsArray.forEach(inning => {
+        const position = positionsByInning[inning].get(player.id) ?? null;
+        inningPositions[inning] = position;
+
+        if (position === null) {
+          summary.bench++;
+          return;
+        }
+
+        if (INFIELD_SET.has(position)) {
+          summary.infield++;
+        } else if (OUTFIELD_SET.has(position)) {
+          summary.outfield++;
+        }
+
+        summary.positions[position] = (summary.positions[position] || 0) + 1;
+      });
+
+      const positionsPlayed = Object.entries(summary.positions)
+        .map(([position, count]) => `${position}${count > 1 ? ` (${count}×)` : ''}`)
+        .join(', ');
+
+      return { player, summary, inningPositions, positionsPlayed };
+    });
+  }, [sortedPlayers, inningsArray, positionsByInning]);
+
+  return (
+    <div className="ai-rotations-preview">
+      <h5 className="mb-3">AI-Generated Fielding Rotation</h5>
+
+      {/* Player-centric view (similar to main table) */}
+      <div className="table-responsive mb-4">
+        <table className="table table-striped" style={{ fontSize: '0.875rem' }}>
+          <thead>
+            <tr>
+              <th className="text-nowrap">Batting</th>
+              <th className="text-nowrap">#</th>
+              <th className="text-nowrap">Player</th>
+              <th className="text-nowrap">Summary</th>
+              {inningsArray.map(inning => (
+                <th key={inning} className="text-nowrap">
+                  Inning {inning}
+                </th>
+              ))}
+            </tr>
+          </thead>
+          <tbody>
+            {playerRows.map(({ player, summary, inningPositions }) => (
+              <tr key={player.id}>
+                <td className="text-nowrap">
+                  {player.battingPosition ? player.battingPosition : '-'}
+                </td>
+                <td className="text-nowrap">{player.jersey_number}</td>
+                <td className="text-nowrap">{player.name}</td>
+                <td className="text-nowrap">
+                  <small>
+                    IF: {summary.infield} &middot;
+                    OF: {summary.outfield} &middot;
+                    Bench: {summary.bench}
+                  </small>
+                </td>
+                {inningsArray.map(inning => (
+                  <td key={inning} className="text-nowrap text-center">
+                    {inningPositions[inning] || <span className="text-muted">Bench</span>}
+                  </td>
+                ))}
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+
+      {/* Position Summary Table */}
+      <h5 className="mb-3">AI-Generated Position Summaries</h5>
+      <div className="table-responsive">
+        <table className="table table-sm" style={{ fontSize: '0.875rem' }}>
+          <thead>
+            <tr>
+              <th className="text-nowrap">#</th>
+              <th className="text-nowrap">Player</th>
+              <th className="text-nowrap">Infield</th>
+              <th className="text-nowrap">Outfield</th>
+              <th className="text-nowrap">Bench</th>
+              <th className="text-nowrap">Positions Played</th>
+            </tr>
+          </thead>
+          <tbody>
+            {playerRows.map(({ player, summary, positionsPlayed }) => (
+              <tr key={player.id}>
+                <td className="text-nowrap">{player.jersey_number}</td>
+                <td className="text-nowrap">{player.name}</td>
+                <td className="text-nowrap">{summary.infield}</td>
+                <td className="text-nowrap">{summary.outfield}</td>
+                <td className="text-nowrap">{summary.bench}</td>
+                <td><small>{positionsPlayed || 'None'}</small></td>
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+    </div>
+  );
+};
+
+export default React.memo(AIRotationPreview);
@@ -16,16 +16,21 @@ const BattingOrderTab = ({ gameId, players }) => {
       
       // Get player availability
       const availabilityResponse = await getPlayerAvailability(gameId);
-      const availabilityMap = {};
-      availabilityResponse.data.forEach(item => {
-        availabilityMap[item.player_id] = item.available;
-      });
+      // Only players explicitly marked unavailable are left out
+      const unavailableIds = new Set(
+        availabilityResponse.data
+          .filter(item => item.available === false)
+          .map(item => item.player_id)
+      );
       
       // Filter available players
       const availablePlayers = players.filter(player => 
-        availabilityMap[player.id] !== false
+        !unavailableIds.has(player.id)
       ).map(player => ({
         id: player.id,
+        // String form of the ID for drag-and-drop, converted once here rather
+        // than twice per card on every render during a drag
+        draggableId: String(player.id),
         name: player.full_name,
         jersey_number: player.jersey_number
       }));
@@ -37,19 +42,21 @@ const BattingOrderTab = ({ gameId, players }) => {
         // Extract player order from the response
         const savedOrder = orderResponse.data.order_data || [];
         
-        // Create an array of available players not in the batting order
-        const playerMap = availablePlayers.reduce((map, player) => {
-          map[player.id] = player;
-          return map;
-        }, {});
+        // Available players by ID, in roster order. Taking each ordered player
+        // out as it's placed leaves exactly the players not in the batting
+        // order, still in roster order, without a second pass or set.
+        const unplacedPlayers = new Map(availablePlayers.map(player => [player.id, player]));
         
         // Convert order to player objects
-        const orderWithDetails = savedOrder.map(playerId => playerMap[playerId]).filter(Boolean);
-        
-        // Remove ordered players from available list
-        const remainingPlayers = availablePlayers.filter(player => 
-          !savedOrder.includes(player.id)
-        );
+        const orderWithDetails = [];
+        savedOrder.forEach(playerId => {
+          const player = unplacedPlayers.get(playerId);
+          if (player) {
+            orderWithDetails.push(player);
+            unplacedPlayers.delete(playerId);
+          }
+        });
+        const remainingPlayers = [...unplacedPlayers.values()];
         
         setBattingOrder(orderWithDetails);
         setAvailablePlayers(remainingPlayers);
@@ -186,8 +193,8 @@ const BattingOrderTab = ({ gameId, players }) => {
                     ) : (
                       availablePlayers.map((player, index) => (
                         <Draggable 
-                          key={player.id.toString()} 
-                          draggableId={player.id.toString()} 
+                          key={player.draggableId} 
+                          draggableId={player.draggableId} 
                           index={index}
                         >
                           {(provided) => (
@@ -234,8 +241,8 @@ const BattingOrderTab = ({ gameId, players }) => {
                     ) : (
                       battingOrder.map((player, index) => (
                         <Draggable 
-                          key={player.id.toString()} 
-                          draggableId={player.id.toString()} 
+                          key={player.draggableId} 
+                          draggableId={player.draggableId} 
                           index={index}
                         >
                           {(provided) => (
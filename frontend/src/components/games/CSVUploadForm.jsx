@@ -1,6 +1,6 @@
 import React, { useState, useRef } from "react";
 import axios from "axios";
-import { getApiUrl } from "../../services/api";
+import { getApiUrl, invalidateGamesCache } from "../../services/api";
 
 const CSVUploadForm = ({ teamId, onUploadComplete, onCancel, hasExistingGames }) => {
   const [file, setFile] = useState(null);
@@ -87,12 +87,12 @@ const CSVUploadForm = ({ teamId, onUploadComplete, onCancel, hasExistingGames })
       // Get API URL
       const url = getApiUrl(`teams/${teamId}/games`);
       
-      // Use axios to make the request
+      // Use axios to make the request; the cached schedule is stale afterwards
       const response = await axios.post(url, formData, {
         headers: {
           'Content-Type': 'multipart/form-data'
         }
-      });
+      }).finally(() => invalidateGamesCache(teamId));
       
       const data = response.data;
       
@@ -1,7 +1,7 @@
 import React, { useState } from "react";
 
 // Constants from constants.js
-import { POSITIONS } from "../../constants";
+import { FIELD_POSITIONS } from "../../constants";
 
 const FieldPositionEditor = ({ positions, availablePlayers, onPositionChange }) => {
   const [selectedPosition, setSelectedPosition] = useState(null);
@@ -169,7 +169,7 @@ const FieldPositionEditor = ({ positions, availablePlayers, onPositionChange })
       </div>
       
       {/* Position markers */}
-      {POSITIONS.filter(pos => pos !== "Bench").map(position => (
+      {FIELD_POSITIONS.map(position => (
         <div 
           key={position}
           style={getPositionStyle(position)}
@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useCallback } from "react";
+import React, { useState, useEffect, useCallback, useRef, useMemo } from "react";
 import { 
   getFieldingRotations, 
   saveFieldingRotation, 
@@ -7,12 +7,123 @@ import {
   getBattingOrder, 
   generateAIFieldingRotation 
 } from "../../services/api";
+import AIRotationPreview from "./AIRotationPreview";
+import RotationGrid from "./RotationGrid";
+import { INFIELD, OUTFIELD, INFIELD_SET, OUTFIELD_SET, FIELD_POSITIONS } from "../../constants";
 
-// Constants from constants.js
-const POSITIONS = ["Pitcher", "Catcher", "1B", "2B", "3B", "SS", "LF", "RF", "LC", "RC", "Bench"];
-const INFIELD = ["Pitcher", "1B", "2B", "3B", "SS"];
-const OUTFIELD = ["Catcher", "LF", "RF", "LC", "RC"];
-const FIELD_POSITIONS = POSITIONS.filter(pos => pos !== "Bench");
+// Order auto-assign fills an inning in: catcher first, then infield, then the
+// rest of the outfield. Built once rather than on every fill.
+const AUTO_ASSIGN_ORDER = [
+  "Catcher",
+  ...INFIELD,
+  ...OUTFIELD.filter(position => position !== "Catcher")
+];
+
+// True if at least one inning of an AI response assigns a field position.
+// Anything else (e.g. the server's parse-failure placeholder) isn't worth previewing.
+const hasFieldAssignments = (rotationsData) =>
+  Object.values(rotationsData).some(inningRotation =>
+    inningRotation && typeof inningRotation === 'object' &&
+    FIELD_POSITIONS.some(pos => pos in inningRotation)
+  );
+
+// Keep only what a saved rotation needs: real field positions mapped to real
+// player IDs, for the game's innings. AI results can carry "Bench"/"OUT" keys
+// and -1 placeholder IDs that are only meaningful in the preview.
+const toSavableRotations = (rotations, innings) => {
+  const savable = {};
+  for (let inning = 1; inning <= innings; inning++) {
+    const inningRotation = rotations[inning] || {};
+    savable[inning] = Object.fromEntries(
+      Object.entries(inningRotation).filter(([position, playerId]) =>
+        position !== "Bench" && position !== "OUT" && Number(playerId) > 0
+      )
+    );
+  }
+  return savable;
+};
+
+// Fill an inning's open positions with players not already assigned in it:
+// catcher first, then infield, then the rest of the outfield. Membership is
+// checked against a Set and players are taken in order by index, instead of
+// scanning the assigned list per player and shifting the unassigned list.
+const fillOpenPositions = (currentRotation, availablePlayers) => {
+  const assignedPlayerIds = new Set(Object.values(currentRotation));
+  const unassignedPlayers = availablePlayers.filter(
+    player => !assignedPlayerIds.has(player.id)
+  );
+  let next = 0;
+  
+  // Generate default assignments
+  const newRotation = { ...currentRotation };
+  const fillPosition = (position) => {
+    if (!newRotation[position] && next < unassignedPlayers.length) {
+      newRotation[position] = unassignedPlayers[next].id;
+      next++;
+    }
+  };
+  
+  // For now, assume any player can play catcher
+  AUTO_ASSIGN_ORDER.forEach(fillPosition);
+  
+  return newRotation;
+};
+
+// "infield" or "outfield" for a field position, null for bench or no position
+const positionArea = (position) => {
+  if (INFIELD_SET.has(position)) return "infield";
+  if (OUTFIELD_SET.has(position)) return "outfield";
+  return null;
+};
+
+// Order-independent fingerprint of one inning's assignments, for telling
+// whether an inning differs from what was last loaded from or saved to the server
+const rotationFingerprint = (positions) =>
+  Object.entries(positions || {})
+    .map(([position, playerId]) => `${position}:${playerId}`)
+    .sort()
+    .join('|');
+
+// Count infield/outfield/bench innings and positions played for every player
+// in one pass over the rotation, rather than rescanning each inning per player.
+// A player's first position in an inning counts; innings without one are bench.
+const summarizePlayerPositions = (rotations, innings, playerIds) => {
+  const summaries = new Map(playerIds.map(playerId => [playerId, {
+    infield: 0,
+    outfield: 0,
+    bench: 0,
+    positions: {}
+  }]));
+  
+  for (let inning = 1; inning <= innings; inning++) {
+    const placed = new Set();
+    
+    for (const [position, pid] of Object.entries(rotations[inning] || {})) {
+      const summary = summaries.get(pid);
+      if (!summary || placed.has(pid)) continue;
+      placed.add(pid);
+      
+      // Count by position type
+      if (INFIELD_SET.has(position)) {
+        summary.infield++;
+      } else if (OUTFIELD_SET.has(position)) {
+        summary.outfield++;
+      }
+      
+      // Count specific positions
+      summary.positions[position] = (summary.positions[position] || 0) + 1;
+    }
+    
+    // Players not found in any position in this inning are on the bench
+    summaries.forEach((summary, pid) => {
+      if (!placed.has(pid)) {
+        summary.bench++;
+      }
+    });
+  }
+  
+  return summaries;
+};
 
 const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
   const [rotations, setRotations] = useState({});
@@ -21,12 +132,20 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
   const [saving, setSaving] = useState(false);
   const [error, setError] = useState("");
   const [success, setSuccess] = useState("");
-  const [validationErrors, setValidationErrors] = useState({});
+  // Validation is derived from the rotation; issues are shown once the user edits or saves
+  const [showValidation, setShowValidation] = useState(false);
   const [battingOrder, setBattingOrder] = useState([]);
   const [showAIModal, setShowAIModal] = useState(false);
   const [aiRotations, setAIRotations] = useState({});
   const [generatingAI, setGeneratingAI] = useState(false);
   const [aiError, setAIError] = useState("");
+  // Generated rotations keyed by the request inputs, so returning to inputs
+  // that were already generated does not go back to the server
+  const aiResultCache = useRef({});
+  const displayedAIKey = useRef(null);
+  // Fingerprint of each inning as last loaded or saved, so saving only sends
+  // the innings that were edited since
+  const persistedRotations = useRef({});
 
   const fetchData = useCallback(async () => {
     try {
@@ -34,18 +153,20 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
       
       // Get player availability
       const availabilityResponse = await getPlayerAvailability(gameId);
-      const availabilityMap = {};
-      availabilityResponse.data.forEach(item => {
-        availabilityMap[item.player_id] = item.available;
-      });
+      // Player ID -> availability record, so each player's available and
+      // catcher flags are a single lookup
+      const availabilityMap = new Map(
+        availabilityResponse.data.map(item => [item.player_id, item])
+      );
       
       // Filter available players
       const availPlayers = players.filter(player => 
-        availabilityMap[player.id] !== false
+        availabilityMap.get(player.id)?.available !== false
       ).map(player => ({
         id: player.id,
         name: player.full_name,
-        jersey_number: player.jersey_number
+        jersey_number: player.jersey_number,
+        can_play_catcher: availabilityMap.get(player.id)?.can_play_catcher ?? false
       }));
       
       setAvailablePlayers(availPlayers);
@@ -70,13 +191,17 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
         
         // Create a map of inning to positions
         const rotationsMap = {};
+        const fingerprints = {};
         rotationsResponse.data.forEach(rotation => {
           rotationsMap[rotation.inning] = rotation.positions || {};
+          fingerprints[rotation.inning] = rotationFingerprint(rotation.positions);
         });
         
+        persistedRotations.current = fingerprints;
         setRotations(rotationsMap);
       } catch (err) {
         // If no rotations exist yet, initialize an empty object
+        persistedRotations.current = {};
         setRotations({});
       }
       
@@ -93,92 +218,99 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
     fetchData();
   }, [fetchData]);
 
-  // Get position count summary for a player
-  const getPlayerPositionSummary = (playerId) => {
-    const summary = {
-      infield: 0,
-      outfield: 0,
-      bench: 0,
-      positions: {}
-    };
-    
-    // Generate array of innings
-    const inningsArray = Array.from({ length: innings }, (_, i) => i + 1);
-    
+  // Innings 1..N, shared by validation, saving, auto-assign and the grid
+  const inningsArray = useMemo(
+    () => Array.from({ length: innings }, (_, i) => i + 1),
+    [innings]
+  );
+
+  // Player ID -> player, for labelling validation messages without scanning the list
+  const playersById = useMemo(
+    () => new Map(availablePlayers.map(player => [player.id, player])),
+    [availablePlayers]
+  );
+
+  // Invert each inning once into player ID -> position, so each grid cell is a
+  // lookup for its own, the previous and the next inning instead of three scans
+  const positionsByInning = useMemo(() => {
+    const byInning = {};
     inningsArray.forEach(inning => {
-      const inningRotation = rotations[inning] || {};
-      let found = false;
-      
-      // Look for the player in this inning
-      for (const [position, pid] of Object.entries(inningRotation)) {
-        if (pid === playerId) {
-          // Count by position type
-          if (INFIELD.includes(position)) {
-            summary.infield++;
-          } else if (OUTFIELD.includes(position)) {
-            summary.outfield++;
-          }
-          
-          // Count specific positions
-          if (!summary.positions[position]) {
-            summary.positions[position] = 0;
-          }
-          summary.positions[position]++;
-          
-          found = true;
-          break;
+      const playerPositions = new Map();
+      for (const [pos, pid] of Object.entries(rotations[inning] || {})) {
+        // Keep the first position if a player appears twice
+        if (!playerPositions.has(pid)) {
+          playerPositions.set(pid, pos);
         }
       }
-      
-      // If player is not found in any position in this inning, they're on the bench
-      if (!found) {
-        summary.bench++;
-      }
+      byInning[inning] = playerPositions;
     });
-    
-    return summary;
-  };
-  
-  // Validate rotations before saving
-  // Note: We're still using the same validation logic, but now we only use it to update
-  // the validation state for visual cues, not to prevent selections
-  const validateRotations = () => {
+    return byInning;
+  }, [inningsArray, rotations]);
+
+  // Position summaries for both tables and for validation, rebuilt only when the
+  // rotation, innings or players change instead of twice per player on every render
+  const positionSummaries = useMemo(() => {
+    const summaries = summarizePlayerPositions(rotations, innings, availablePlayers.map(player => player.id));
+    summaries.forEach(summary => {
+      summary.positionsPlayed = Object.entries(summary.positions)
+        .map(([position, count]) => `${position}${count > 1 ? ` (${count}×)` : ''}`)
+        .join(', ');
+    });
+    return summaries;
+  }, [availablePlayers, rotations, innings]);
+
+  // Validate rotations for visual cues and the save check. Derived from the
+  // rotation, so it is recomputed only when the rotation, innings or players
+  // change, and never runs against a stale copy of the state.
+  const validation = useMemo(() => {
     const errors = {};
     const playerErrors = {};
     
-    // Generate array of innings
-    const inningsArray = Array.from({ length: innings }, (_, i) => i + 1);
-    
     // Check each inning
     inningsArray.forEach(inning => {
       const inningErrors = [];
       const inningRotation = rotations[inning] || {};
       
+      // Single pass over the inning: collect assigned positions and note any
+      // player who has already been seen in this inning
+      const inningEntries = Object.entries(inningRotation);
+      const assignedPositions = new Set();
+      const seenPlayers = new Set();
+      const repeatedPlayers = new Set();
+      for (const [position, playerId] of inningEntries) {
+        assignedPositions.add(position);
+        if (seenPlayers.has(playerId)) {
+          repeatedPlayers.add(playerId);
+        } else {
+          seenPlayers.add(playerId);
+        }
+      }
+      
       // 1. Check for missing positions
-      const assignedPositions = Object.keys(inningRotation);
-      const missingPositions = FIELD_POSITIONS.filter(pos => !assignedPositions.includes(pos));
+      const missingPositions = FIELD_POSITIONS.filter(pos => !assignedPositions.has(pos));
       
       if (missingPositions.length > 0) {
         inningErrors.push(`Missing positions: ${missingPositions.join(', ')}`);
       }
       
-      // 2. Check for duplicate player assignments in an inning
-      const positionsByPlayer = {};
-      Object.entries(inningRotation).forEach(([position, playerId]) => {
-        if (!positionsByPlayer[playerId]) {
-          positionsByPlayer[playerId] = [];
+      // 2. Check for duplicate player assignments in an inning. Innings
+      // without a repeat skip this; otherwise positions are grouped only for
+      // the repeated players.
+      if (repeatedPlayers.size > 0) {
+        const duplicatePositions = new Map();
+        for (const [position, playerId] of inningEntries) {
+          if (repeatedPlayers.has(playerId)) {
+            if (!duplicatePositions.has(playerId)) {
+              duplicatePositions.set(playerId, []);
+            }
+            duplicatePositions.get(playerId).push(position);
+          }
         }
-        positionsByPlayer[playerId].push(position);
-      });
-      
-      const duplicates = Object.entries(positionsByPlayer)
-        .filter(([_, positions]) => positions.length > 1)
-        .map(([playerId, positions]) => {
-          const player = availablePlayers.find(p => p.id === parseInt(playerId));
+        const duplicates = Array.from(duplicatePositions, ([playerId, positions]) => {
+          const player = playersById.get(Number(playerId));
           return `#${player?.jersey_number} ${player?.name}: ${positions.join(', ')}`;
         });
-      
-      if (duplicates.length > 0) {
+        
         inningErrors.push(`Players assigned multiple positions: ${duplicates.join('; ')}`);
       }
       
@@ -190,7 +322,7 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
     // 3. Check if players play the same position more than once in the game
     availablePlayers.forEach(player => {
       const playerErrs = [];
-      const positionSummary = getPlayerPositionSummary(player.id);
+      const positionSummary = positionSummaries.get(player.id);
       
       // Check for duplicate positions
       const repeatPositions = Object.entries(positionSummary.positions)
@@ -201,41 +333,15 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
         playerErrs.push(`Plays same position multiple times: ${repeatPositions.join(', ')}`);
       }
       
-      // 4. Check for consecutive infield or outfield innings
+      // 4. Check for consecutive infield or outfield innings. Each inning's
+      // area is looked up once, then adjacent innings are compared.
+      let previousArea = positionArea(positionsByInning[1]?.get(player.id));
       for (let i = 1; i < innings; i++) {
-        const currentInning = rotations[i] || {};
-        const nextInning = rotations[i + 1] || {};
-        
-        let currentPosition = null;
-        let nextPosition = null;
-        
-        // Find position in current inning
-        for (const [pos, pid] of Object.entries(currentInning)) {
-          if (pid === player.id) {
-            currentPosition = pos;
-            break;
-          }
-        }
-        
-        // Find position in next inning
-        for (const [pos, pid] of Object.entries(nextInning)) {
-          if (pid === player.id) {
-            nextPosition = pos;
-            break;
-          }
-        }
-        
-        // Check for consecutive infield innings
-        if (currentPosition && nextPosition) {
-          if (INFIELD.includes(currentPosition) && INFIELD.includes(nextPosition)) {
-            playerErrs.push(`Plays infield in consecutive innings (${i} and ${i+1})`);
-          }
-          
-          // Check for consecutive outfield innings
-          if (OUTFIELD.includes(currentPosition) && OUTFIELD.includes(nextPosition)) {
-            playerErrs.push(`Plays outfield in consecutive innings (${i} and ${i+1})`);
-          }
+        const nextArea = positionArea(positionsByInning[i + 1].get(player.id));
+        if (previousArea && previousArea === nextArea) {
+          playerErrs.push(`Plays ${previousArea} in consecutive innings (${i} and ${i+1})`);
         }
+        previousArea = nextArea;
       }
       
       if (playerErrs.length > 0) {
@@ -243,17 +349,21 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
       }
     });
     
-    // Combine inning errors and player errors
-    setValidationErrors({ innings: errors, players: playerErrors });
-    
-    // Return validation status (used only for save functionality now, not for reverting selections)
-    return Object.keys(errors).length === 0 && Object.keys(playerErrors).length === 0;
-  };
+    // Combine inning errors and player errors; isValid is used by the save check only
+    return {
+      innings: errors,
+      players: playerErrors,
+      isValid: Object.keys(errors).length === 0 && Object.keys(playerErrors).length === 0
+    };
+  }, [inningsArray, rotations, innings, availablePlayers, playersById, positionsByInning, positionSummaries]);
+  
+  const validationErrors = showValidation ? validation : {};
 
   const handleSaveRotation = async (forceIgnoreValidation = false) => {
     try {
       // Validate rotations
-      const isValid = validateRotations();
+      setShowValidation(true);
+      const isValid = validation.isValid;
       
       // Show validation errors but don't block saving if forceIgnoreValidation is true
       if (!isValid && !forceIgnoreValidation) {
@@ -261,16 +371,32 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
         return;
       }
       
+      // Strip preview-only entries so they are never written to the database
+      const savableRotations = toSavableRotations(rotations, innings);
+      
+      // Only send innings that differ from the last loaded or saved state
+      const dirtyInnings = inningsArray.filter(inning =>
+        rotationFingerprint(savableRotations[inning]) !== (persistedRotations.current[inning] ?? '')
+      );
+      
+      if (dirtyInnings.length === 0) {
+        setError("");
+        setSuccess("No changes to save.");
+        return;
+      }
+      
       setSaving(true);
       setSuccess("");
       setError("");
       
       // First try the batch save approach (much more efficient)
       try {
-        console.log("[FieldingRotation] Attempting batch save:", rotations);
-        
         // Convert rotations to the format expected by the batch API
-        const batchData = { ...rotations };
+        const batchData = Object.fromEntries(
+          dirtyInnings.map(inning => [inning, savableRotations[inning]])
+        );
+        
+        console.log("[FieldingRotation] Attempting batch save:", batchData);
         
         // Invoke the batch API
         const result = await batchSaveFieldingRotations(gameId, batchData);
@@ -281,8 +407,19 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
           "Fielding rotations saved successfully." :
           "Fielding rotations saved with validation issues.");
           
-        // Refresh data to ensure UI is in sync with server
-        await fetchData();
+        // The batch response carries every saved inning, so sync from it
+        // instead of reloading availability, batting order and rotations
+        const savedInnings = result.data.rotations || [];
+        savedInnings.forEach(rotation => {
+          persistedRotations.current[rotation.inning] = rotationFingerprint(rotation.positions);
+        });
+        setRotations(prevRotations => {
+          const savedRotations = { ...prevRotations };
+          savedInnings.forEach(rotation => {
+            savedRotations[rotation.inning] = rotation.positions || {};
+          });
+          return savedRotations;
+        });
         
         // Exit early after successful batch save
         return;
@@ -293,41 +430,34 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
         // Don't set an error yet, try individual saves next
       }
       
-      // Generate array of innings
-      const inningsArray = Array.from({ length: innings }, (_, i) => i + 1);
-      
       // Fall back to saving each inning individually
-      console.log("[FieldingRotation] Falling back to individual saves for innings:", inningsArray);
+      console.log("[FieldingRotation] Falling back to individual saves for innings:", dirtyInnings);
+      
+      // Each inning is its own row, so the saves are independent and can be
+      // sent together rather than one round trip (plus a delay) after another
+      const outcomes = await Promise.allSettled(
+        dirtyInnings.map(inning => saveFieldingRotation(gameId, inning, savableRotations[inning]))
+      );
       
       const saveResults = [];
       const saveErrors = [];
-      
-      for (const inning of inningsArray) {
-        try {
-          // Log more details for debugging
-          console.log(`Saving rotation for inning ${inning}:`, rotations[inning] || {});
-          
-          // Add a small delay between saves to avoid race conditions
-          if (inning > 1) {
-            await new Promise(resolve => setTimeout(resolve, 100));
-          }
-          
-          const result = await saveFieldingRotation(gameId, inning, rotations[inning] || {});
-          saveResults.push(result);
-          console.log(`Successfully saved inning ${inning}:`, result);
-        } catch (inningError) {
-          console.error(`Error saving inning ${inning}:`, inningError);
+      outcomes.forEach((outcome, index) => {
+        const inning = dirtyInnings[index];
+        if (outcome.status === "fulfilled") {
+          saveResults.push(outcome.value);
+          console.log(`Successfully saved inning ${inning}:`, outcome.value);
+        } else {
+          console.error(`Error saving inning ${inning}:`, outcome.reason);
           // Capture the specific error and inning
-          saveErrors.push({ inning, error: inningError });
-          // Continue trying to save other innings
+          saveErrors.push({ inning, error: outcome.reason });
         }
-      }
+      });
       
       // Check for errors
       if (saveErrors.length > 0) {
         // If some innings failed but others succeeded
         if (saveResults.length > 0) {
-          setError(`Saved ${saveResults.length} of ${innings} innings. Some innings failed to save.`);
+          setError(`Saved ${saveResults.length} of ${dirtyInnings.length} innings. Some innings failed to save.`);
           console.error("Save errors:", saveErrors);
         } else {
           // If all innings failed
@@ -351,137 +481,85 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
     }
   };
 
-  const handlePositionChange = (player, inning, position) => {
-    // Create a new rotation for the specified inning if it doesn't exist
-    const inningRotation = rotations[inning] || {};
-    
-    // Check if another player is assigned to this position already
-    const existingPlayerId = inningRotation[position];
-    
-    // Clear the old position for this player if they had one
-    let updatedRotation = { ...inningRotation };
-    
-    // Remove player from any other position in this inning
-    Object.entries(updatedRotation).forEach(([pos, playerId]) => {
-      if (playerId === player.id) {
-        delete updatedRotation[pos];
-      }
-    });
-    
-    // Assign player to the new position
-    updatedRotation[position] = player.id;
-    
-    // Update the rotations state
-    setRotations({
-      ...rotations,
-      [inning]: updatedRotation
+  // The grid handlers use functional updates so they stay stable across
+  // renders and the memoized grid isn't re-rendered just because they changed
+  const handlePositionChange = useCallback((player, inning, position) => {
+    setRotations(prevRotations => {
+      // Create a new rotation for the specified inning if it doesn't exist
+      const updatedRotation = { ...(prevRotations[inning] || {}) };
+      
+      // Remove player from any other position in this inning
+      Object.entries(updatedRotation).forEach(([pos, playerId]) => {
+        if (playerId === player.id) {
+          delete updatedRotation[pos];
+        }
+      });
+      
+      // Assign player to the new position
+      updatedRotation[position] = player.id;
+      
+      return {
+        ...prevRotations,
+        [inning]: updatedRotation
+      };
     });
     
-    // Run validation to update the validation errors state immediately
-    // but don't revert the selection
-    setTimeout(() => validateRotations(), 0);
-  };
+    // Show validation issues for the new selection, but don't revert it
+    setShowValidation(true);
+  }, []);
 
-  const handleClearPosition = (inning, position) => {
-    // Create a copy of current rotations
-    const inningRotation = { ...rotations[inning] };
-    
-    // Delete the position from the rotation
-    delete inningRotation[position];
-    
-    // Update the rotations state
-    setRotations({
-      ...rotations,
-      [inning]: inningRotation
+  const handleClearPosition = useCallback((inning, position) => {
+    setRotations(prevRotations => {
+      // Delete the position from a copy of the inning's rotation
+      const inningRotation = { ...prevRotations[inning] };
+      delete inningRotation[position];
+      
+      return {
+        ...prevRotations,
+        [inning]: inningRotation
+      };
     });
     
-    // Run validation to update the validation errors state immediately
-    setTimeout(() => validateRotations(), 0);
-  };
+    // Show validation issues for the updated rotation
+    setShowValidation(true);
+  }, []);
 
-  const autoAssignPositions = (inning) => {
-    // Get current rotation
-    const currentRotation = rotations[inning] || {};
-    
-    // Get unassigned players
-    const assignedPlayerIds = Object.values(currentRotation);
-    const unassignedPlayers = availablePlayers.filter(
-      player => !assignedPlayerIds.includes(player.id)
-    );
-    
-    // Generate default assignments
-    const newRotation = { ...currentRotation };
-    
-    // First, try to assign catchers
-    const catcherPosition = POSITIONS.find(pos => pos === "Catcher");
-    if (!newRotation[catcherPosition] && unassignedPlayers.length > 0) {
-      // Find a player that can play catcher
-      const catcherPlayer = unassignedPlayers.find(player => {
-        // Check if player can play catcher (would need to extend player data)
-        return true; // For now, assume any player can play catcher
-      });
-      
-      if (catcherPlayer) {
-        newRotation[catcherPosition] = catcherPlayer.id;
-        // Remove from unassigned
-        const index = unassignedPlayers.findIndex(p => p.id === catcherPlayer.id);
-        unassignedPlayers.splice(index, 1);
-      }
-    }
-    
-    // Then assign infield positions
-    for (const position of INFIELD) {
-      if (!newRotation[position] && unassignedPlayers.length > 0) {
-        newRotation[position] = unassignedPlayers[0].id;
-        unassignedPlayers.shift();
-      }
-    }
-    
-    // Then assign outfield positions
-    for (const position of OUTFIELD) {
-      if (position !== "Catcher" && !newRotation[position] && unassignedPlayers.length > 0) {
-        newRotation[position] = unassignedPlayers[0].id;
-        unassignedPlayers.shift();
-      }
-    }
-    
-    // Update rotations
-    setRotations({
-      ...rotations,
-      [inning]: newRotation
-    });
+  const autoAssignPositions = useCallback((inning) => {
+    // Fill from the latest state so consecutive updates don't overwrite each other
+    setRotations(prevRotations => ({
+      ...prevRotations,
+      [inning]: fillOpenPositions(prevRotations[inning] || {}, availablePlayers)
+    }));
     
-    // Run validation to update the validation errors state immediately
-    setTimeout(() => validateRotations(), 0);
-  };
+    // Show validation issues for the updated rotation
+    setShowValidation(true);
+  }, [availablePlayers]);
 
   const autoAssignAllInnings = () => {
-    // Generate array of innings
-    const inningsArray = Array.from({ length: innings }, (_, i) => i + 1);
-    
-    // Auto-assign each inning
-    inningsArray.forEach(inning => {
-      autoAssignPositions(inning);
+    // Auto-assign every inning in one state update
+    setRotations(prevRotations => {
+      const nextRotations = { ...prevRotations };
+      inningsArray.forEach(inning => {
+        nextRotations[inning] = fillOpenPositions(prevRotations[inning] || {}, availablePlayers);
+      });
+      return nextRotations;
     });
     
-    // Run validation after all assignments are complete
-    setTimeout(() => validateRotations(), 0);
+    // Show validation issues once all assignments are complete
+    setShowValidation(true);
   };
 
-  const copyFromPreviousInning = (inning) => {
+  const copyFromPreviousInning = useCallback((inning) => {
     if (inning > 1) {
-      const previousInning = inning - 1;
-      const previousRotation = rotations[previousInning] || {};
-      
-      setRotations({
-        ...rotations,
-        [inning]: { ...previousRotation }
-      });
+      setRotations(prevRotations => ({
+        ...prevRotations,
+        [inning]: { ...(prevRotations[inning - 1] || {}) }
+      }));
       
-      // Run validation to update the validation errors state immediately
-      setTimeout(() => validateRotations(), 0);
+      // Show validation issues for the updated rotation
+      setShowValidation(true);
     }
-  };
+  }, []);
   
   // State for AI customization options
   const [aiOptions, setAiOptions] = useState({
@@ -534,22 +612,53 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
         console.log("Token exists:", token.substring(0, 10) + "...");
       }
       
-      // Prepare player data for AI
+      // Prepare player data for AI. Catcher flags come from the availability
+      // tab; if nobody has been marked, anyone may catch as before.
+      const anyMarkedCatcher = availablePlayers.some(player => player.can_play_catcher);
       const playersData = availablePlayers.map(player => {
         return {
           id: player.id,
           name: player.name,
           jersey_number: player.jersey_number,
           available: true, // We already filter unavailable players
-          can_play_catcher: true // Assuming all can play catcher for now
+          can_play_catcher: anyMarkedCatcher ? player.can_play_catcher : true
         };
       });
       
       // Prepare required positions
       const requiredPositions = FIELD_POSITIONS;
       
-      // Show a user-friendly message about AI generation
-      setAIError("AI is generating rotations. This may take 1-2 minutes...");
+      // Asking again with the inputs of the rotation already on screen means the
+      // user wants a different rotation, so skip both client and server caches
+      const cacheKey = JSON.stringify({ playersData, innings, aiOptions });
+      const isRegenerating = Object.keys(aiRotations).length > 0 && displayedAIKey.current === cacheKey;
+      if (!isRegenerating && aiResultCache.current[cacheKey]) {
+        console.log("Using cached AI rotation for unchanged inputs");
+        setAIRotations(aiResultCache.current[cacheKey]);
+        displayedAIKey.current = cacheKey;
+        setAIError("");
+        return;
+      }
+      
+      // Show a generated rotation and remember it for these inputs. Responses
+      // without any field assignments are rejected before building the preview.
+      const showAIResult = (rotationsData) => {
+        if (!hasFieldAssignments(rotationsData)) {
+          console.error("AI response has no field assignments:", rotationsData);
+          setAIError("AI returned an incomplete rotation. Please try again.");
+          return;
+        }
+        setAIRotations(rotationsData);
+        aiResultCache.current[cacheKey] = rotationsData;
+        displayedAIKey.current = cacheKey;
+      };
+      
+      // Show a user-friendly message about AI generation. When regenerating, the
+      // previous rotation stays on screen (and can still be applied) until the
+      // new one arrives, with a banner above it instead of this message.
+      if (Object.keys(aiRotations).length === 0) {
+        setAIError("AI is generating rotations. This may take 1-2 minutes...");
+      }
       
       // Try using API function first (using axios with special manual endpoint)
       try {
@@ -565,7 +674,8 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
             balancePlayingTime: aiOptions.balancePlayingTime,
             allowSamePositionMultipleTimes: aiOptions.allowSamePositionMultipleTimes,
             strictPositionBalance: aiOptions.strictPositionBalance,
-            temperature: aiOptions.temperature
+            temperature: aiOptions.temperature,
+            regenerate: isRegenerating
           }
         };
         
@@ -581,14 +691,14 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
         if (axiosResponse.data && typeof axiosResponse.data === 'object') {
           if (axiosResponse.data.rotations) {
             console.log("Response contains rotations property - using it");
-            setAIRotations(axiosResponse.data.rotations);
+            showAIResult(axiosResponse.data.rotations);
           } else if (Object.keys(axiosResponse.data).length > 0) {
             // The API might be returning the rotations directly at the top level
             // Check if the data looks like a rotation object with numeric keys
             const hasNumericKeys = Object.keys(axiosResponse.data).some(key => !isNaN(parseInt(key)));
             if (hasNumericKeys) {
               console.log("Response has numeric keys at top level - using as rotations");
-              setAIRotations(axiosResponse.data);
+              showAIResult(axiosResponse.data);
             } else if (axiosResponse.data.error) {
               // Handle error response
               console.error("API returned error:", axiosResponse.data.error);
@@ -645,7 +755,8 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
               balancePlayingTime: aiOptions.balancePlayingTime,
               allowSamePositionMultipleTimes: aiOptions.allowSamePositionMultipleTimes,
               strictPositionBalance: aiOptions.strictPositionBalance,
-              temperature: aiOptions.temperature
+              temperature: aiOptions.temperature,
+              regenerate: isRegenerating
             }
           }),
           // Add these options to handle redirects properly
@@ -683,7 +794,8 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
                 balancePlayingTime: aiOptions.balancePlayingTime,
                 allowSamePositionMultipleTimes: aiOptions.allowSamePositionMultipleTimes,
                 strictPositionBalance: aiOptions.strictPositionBalance,
-                temperature: aiOptions.temperature
+                temperature: aiOptions.temperature,
+                regenerate: isRegenerating
               }
             }),
             redirect: 'manual',
@@ -716,14 +828,14 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
       if (data && typeof data === 'object') {
         if (data.rotations) {
           console.log("Response contains rotations property - using it");
-          setAIRotations(data.rotations);
+          showAIResult(data.rotations);
         } else if (Object.keys(data).length > 0) {
           // The API might be returning the rotations directly at the top level
           // Check if the data looks like a rotation object with numeric keys
           const hasNumericKeys = Object.keys(data).some(key => !isNaN(parseInt(key)));
           if (hasNumericKeys) {
             console.log("Response has numeric keys at top level - using as rotations");
-            setAIRotations(data);
+            showAIResult(data);
           } else if (data.error) {
             // Handle error response
             console.error("API returned error:", data.error);
@@ -768,13 +880,39 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
     // Close the modal
     setShowAIModal(false);
     
-    // Run validation
-    setTimeout(() => validateRotations(), 0);
+    // Show validation issues for the applied rotation
+    setShowValidation(true);
     
     // Show success message
     setSuccess("AI-generated rotations applied successfully. Review and save to confirm.");
   };
 
+  // Sort players by batting order, then by jersey number. Only recomputed when
+  // the players or batting order change, not on every edit to the rotation.
+  const sortedPlayers = useMemo(() => {
+    // Player ID -> 1-based batting position, built once instead of a lookup per comparison
+    const battingPositions = new Map(battingOrder.map((id, index) => [id, index + 1]));
+
+    return availablePlayers
+      .map(player => ({ ...player, battingPosition: battingPositions.get(player.id) ?? null }))
+      .sort((a, b) => {
+        const aOrder = a.battingPosition;
+        const bOrder = b.battingPosition;
+
+        // If both have batting positions, sort by batting order
+        if (aOrder !== null && bOrder !== null) {
+          return aOrder - bOrder;
+        }
+
+        // If only one has a batting position, put that one first
+        if (aOrder !== null) return -1;
+        if (bOrder !== null) return 1;
+
+        // If neither has a batting position, sort by jersey number
+        return a.jersey_number - b.jersey_number;
+      });
+  }, [availablePlayers, battingOrder]);
+
   if (loading) {
     return <div className="text-center mt-3"><div className="spinner-border"></div></div>;
   }
@@ -787,33 +925,6 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
     );
   }
 
-  // Generate array of innings
-  const inningsArray = Array.from({ length: innings }, (_, i) => i + 1);
-
-  // Get player batting order position
-  const getPlayerBattingPosition = (playerId) => {
-    const index = battingOrder.findIndex(id => id === playerId);
-    return index !== -1 ? index + 1 : null;
-  };
-  
-  // Sort players by batting order, then by jersey number
-  const sortedPlayers = [...availablePlayers].sort((a, b) => {
-    const aOrder = getPlayerBattingPosition(a.id);
-    const bOrder = getPlayerBattingPosition(b.id);
-    
-    // If both have batting positions, sort by batting order
-    if (aOrder !== null && bOrder !== null) {
-      return aOrder - bOrder;
-    }
-    
-    // If only one has a batting position, put that one first
-    if (aOrder !== null) return -1;
-    if (bOrder !== null) return 1;
-    
-    // If neither has a batting position, sort by jersey number
-    return a.jersey_number - b.jersey_number;
-  });
-
   return (
     <div>
       <div className="d-flex justify-content-between align-items-center mb-3">
@@ -855,166 +966,18 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
       {/* Position Assignment Table */}
       <div className="card mb-4">
         <div className="card-body">
-          <div className="table-responsive">
-            <table className="table table-striped" style={{ fontSize: '0.875rem' }}>
-              <thead>
-                <tr>
-                  <th className="text-nowrap">Batting</th>
-                  <th className="text-nowrap">#</th>
-                  <th className="text-nowrap">Player</th>
-                  <th className="text-nowrap">Summary</th>
-                  {inningsArray.map(inning => (
-                    <th key={inning} className="text-nowrap" style={{ minWidth: '140px' }}>
-                      Inning {inning}
-                      <div className="btn-group btn-group-sm ms-2">
-                        <button 
-                          className="btn btn-outline-secondary btn-sm"
-                          onClick={() => autoAssignPositions(inning)}
-                          title="Auto-assign positions for this inning"
-                        >
-                          <i className="bi bi-lightning"></i>
-                        </button>
-                        {inning > 1 && (
-                          <button 
-                            className="btn btn-outline-secondary btn-sm"
-                            onClick={() => copyFromPreviousInning(inning)}
-                            title="Copy from previous inning"
-                          >
-                            <i className="bi bi-arrow-left"></i>
-                          </button>
-                        )}
-                      </div>
-                    </th>
-                  ))}
-                </tr>
-              </thead>
-              <tbody>
-                {sortedPlayers.map(player => {
-                  const positionSummary = getPlayerPositionSummary(player.id);
-                  return (
-                  <tr key={player.id}>
-                    <td className="text-nowrap">
-                      {getPlayerBattingPosition(player.id) ? 
-                        getPlayerBattingPosition(player.id) : 
-                        '-'}
-                    </td>
-                    <td className="text-nowrap">{player.jersey_number}</td>
-                    <td className="text-nowrap">{player.name}</td>
-                    <td className="text-nowrap">
-                      <small>
-                        IF: {positionSummary.infield} &middot; 
-                        OF: {positionSummary.outfield} &middot; 
-                        Bench: {positionSummary.bench}
-                      </small>
-                    </td>
-                    {inningsArray.map(inning => {
-                      // Find the position for this player in this inning
-                      let position = null;
-                      const inningRotation = rotations[inning] || {};
-                      for (const [pos, playerId] of Object.entries(inningRotation)) {
-                        if (playerId === player.id) {
-                          position = pos;
-                          break;
-                        }
-                      }
-                      
-                      // Check if this is a problematic position (consecutive infield or outfield)
-                      let isProblematic = false;
-                      if (position) {
-                        // Check previous inning
-                        if (inning > 1) {
-                          const prevInningRotation = rotations[inning - 1] || {};
-                          let prevPosition = null;
-                          
-                          for (const [pos, pid] of Object.entries(prevInningRotation)) {
-                            if (pid === player.id) {
-                              prevPosition = pos;
-                              break;
-                            }
-                          }
-                          
-                          if (prevPosition) {
-                            if (INFIELD.includes(position) && INFIELD.includes(prevPosition)) {
-                              isProblematic = true;
-                            } else if (OUTFIELD.includes(position) && OUTFIELD.includes(prevPosition)) {
-                              isProblematic = true;
-                            }
-                          }
-                        }
-                        
-                        // Check next inning
-                        if (inning < innings) {
-                          const nextInningRotation = rotations[inning + 1] || {};
-                          let nextPosition = null;
-                          
-                          for (const [pos, pid] of Object.entries(nextInningRotation)) {
-                            if (pid === player.id) {
-                              nextPosition = pos;
-                              break;
-                            }
-                          }
-                          
-                          if (nextPosition) {
-                            if (INFIELD.includes(position) && INFIELD.includes(nextPosition)) {
-                              isProblematic = true;
-                            } else if (OUTFIELD.includes(position) && OUTFIELD.includes(nextPosition)) {
-                              isProblematic = true;
-                            }
-                          }
-                        }
-                      }
-                      
-                      return (
-                        <td key={inning} className="text-nowrap">
-                          <select 
-                            className={`form-select form-select-sm ${isProblematic ? 'border-danger' : ''}`}
-                            value={position || ""}
-                            style={{ fontSize: '0.875rem', minWidth: '120px' }}
-                            onChange={(e) => {
-                              const newPosition = e.target.value;
-                              if (newPosition === "") {
-                                // If empty, clear any existing position for this player in this inning
-                                if (position) {
-                                  handleClearPosition(inning, position);
-                                }
-                              } else {
-                                // Assign the player to the new position
-                                handlePositionChange(player, inning, newPosition);
-                              }
-                              // Run validation immediately
-                              validateRotations();
-                            }}
-                          >
-                            <option value="">Bench</option>
-                            {FIELD_POSITIONS.map(pos => {
-                              // Check if this position already appears for this player in the game
-                              const isDuplicatePosition = positionSummary.positions[pos] && 
-                                                        (position !== pos || positionSummary.positions[pos] > 1);
-                              
-                              // Check if this position is currently occupied by someone else
-                              const isOccupied = inningRotation[pos] && inningRotation[pos] !== player.id;
-                              
-                              return (
-                                <option 
-                                  key={pos} 
-                                  value={pos}
-                                  className={`${isDuplicatePosition ? 'text-danger' : ''} ${isOccupied ? 'text-warning' : ''}`}
-                                >
-                                  {pos}
-                                  {isDuplicatePosition ? ` (${positionSummary.positions[pos]}×)` : ''}
-                                  {isOccupied ? ' (occupied)' : ''}
-                                </option>
-                              );
-                            })}
-                          </select>
-                        </td>
-                      );
-                    })}
-                  </tr>
-                )})}
-              </tbody>
-            </table>
-          </div>
+          <RotationGrid
+            sortedPlayers={sortedPlayers}
+            inningsArray={inningsArray}
+            innings={innings}
+            rotations={rotations}
+            positionsByInning={positionsByInning}
+            positionSummaries={positionSummaries}
+            onPositionChange={handlePositionChange}
+            onClearPosition={handleClearPosition}
+            onAutoAssign={autoAssignPositions}
+            onCopyPrevious={copyFromPreviousInning}
+          />
         </div>
       </div>
       
@@ -1038,10 +1001,8 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
               </thead>
               <tbody>
                 {sortedPlayers.map(player => {
-                  const positionSummary = getPlayerPositionSummary(player.id);
-                  const positionsPlayed = Object.entries(positionSummary.positions)
-                    .map(([position, count]) => `${position}${count > 1 ? ` (${count}×)` : ''}`)
-                    .join(', ');
+                  const positionSummary = positionSummaries.get(player.id);
+                  const positionsPlayed = positionSummary.positionsPlayed;
                     
                   return (
                     <tr key={player.id}>
@@ -1096,7 +1057,7 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
                   <h6>Player Issues:</h6>
                   <ul>
                     {Object.entries(validationErrors.players).map(([playerId, errors]) => {
-                      const player = availablePlayers.find(p => p.id.toString() === playerId);
+                      const player = playersById.get(Number(playerId));
                       return (
                         <li key={playerId}>
                           <strong>#{player?.jersey_number} {player?.name}:</strong>
@@ -1283,168 +1244,22 @@ const FieldingRotationTab = ({ gameId, players, innings = 6 }) => {
                       )}
                     </div>
                   ) : (
-                    <div className="ai-rotations-preview">
-                      <h5 className="mb-3">AI-Generated Fielding Rotation</h5>
-                      
-                      {/* Player-centric view (similar to main table) */}
-                      <div className="table-responsive mb-4">
-                        <table className="table table-striped" style={{ fontSize: '0.875rem' }}>
-                          <thead>
-                            <tr>
-                              <th className="text-nowrap">Batting</th>
-                              <th className="text-nowrap">#</th>
-                              <th className="text-nowrap">Player</th>
-                              <th className="text-nowrap">Summary</th>
-                              {inningsArray.map(inning => (
-                                <th key={inning} className="text-nowrap">
-                                  Inning {inning}
-                                </th>
-                              ))}
-                            </tr>
-                          </thead>
-                          <tbody>
-                            {sortedPlayers.map(player => {
-                              // Calculate position summary for this player in AI rotation
-                              const summary = {
-                                infield: 0,
-                                outfield: 0,
-                                bench: 0,
-                                positions: {}
-                              };
-                              
-                              inningsArray.forEach(inning => {
-                                const inningRotation = aiRotations[inning] || {};
-                                let found = false;
-                                let position = null;
-                                
-                                for (const [pos, pid] of Object.entries(inningRotation)) {
-                                  if (pid === player.id) {
-                                    position = pos;
-                                    found = true;
-                                    
-                                    if (INFIELD.includes(pos)) {
-                                      summary.infield++;
-                                    } else if (OUTFIELD.includes(pos)) {
-                                      summary.outfield++;
-                                    }
-                                    
-                                    summary.positions[pos] = (summary.positions[pos] || 0) + 1;
-                                    
-                                    break;
-                                  }
-                                }
-                                
-                                if (!found) {
-                                  summary.bench++;
-                                }
-                              });
-                              
-                              return (
-                                <tr key={player.id}>
-                                  <td className="text-nowrap">
-                                    {getPlayerBattingPosition(player.id) ? 
-                                      getPlayerBattingPosition(player.id) : 
-                                      '-'}
-                                  </td>
-                                  <td className="text-nowrap">{player.jersey_number}</td>
-                                  <td className="text-nowrap">{player.name}</td>
-                                  <td className="text-nowrap">
-                                    <small>
-                                      IF: {summary.infield} &middot; 
-                                      OF: {summary.outfield} &middot; 
-                                      Bench: {summary.bench}
-                                    </small>
-                                  </td>
-                                  {inningsArray.map(inning => {
-                                    const inningRotation = aiRotations[inning] || {};
-                                    let position = null;
-                                    
-                                    for (const [pos, pid] of Object.entries(inningRotation)) {
-                                      if (pid === player.id) {
-                                        position = pos;
-                                        break;
-                                      }
-                                    }
-                                    
-                                    return (
-                                      <td key={inning} className="text-nowrap text-center">
-                                        {position || <span className="text-muted">Bench</span>}
-                                      </td>
-                                    );
-                                  })}
-                                </tr>
-                              );
-                            })}
-                          </tbody>
-                        </table>
-                      </div>
-                      
-                      {/* Position Summary Table */}
-                      <h5 className="mb-3">AI-Generated Position Summaries</h5>
-                      <div className="table-responsive">
-                        <table className="table table-sm" style={{ fontSize: '0.875rem' }}>
-                          <thead>
-                            <tr>
-                              <th className="text-nowrap">#</th>
-                              <th className="text-nowrap">Player</th>
-                              <th className="text-nowrap">Infield</th>
-                              <th className="text-nowrap">Outfield</th>
-                              <th className="text-nowrap">Bench</th>
-                              <th className="text-nowrap">Positions Played</th>
-                            </tr>
-                          </thead>
-                          <tbody>
-                            {sortedPlayers.map(player => {
-                              // Calculate position summary for this player in AI rotation
-                              const summary = {
-                                infield: 0,
-                                outfield: 0,
-                                bench: 0,
-                                positions: {}
-                              };
-                              
-                              inningsArray.forEach(inning => {
-                                const inningRotation = aiRotations[inning] || {};
-                                let found = false;
-                                
-                                for (const [pos, pid] of Object.entries(inningRotation)) {
-                                  if (pid === player.id) {
-                                    if (INFIELD.includes(pos)) {
-                                      summary.infield++;
-                                    } else if (OUTFIELD.includes(pos)) {
-                                      summary.outfield++;
-                                    }
-                                    
-                                    summary.positions[pos] = (summary.positions[pos] || 0) + 1;
-                                    found = true;
-                                    break;
-                                  }
-                                }
-                                
-                                if (!found) {
-                                  summary.bench++;
-                                }
-                              });
-                              
-                              const positionsPlayed = Object.entries(summary.positions)
-                                .map(([position, count]) => `${position}${count > 1 ? ` (${count}×)` : ''}`)
-                                .join(', ');
-                              
-                              return (
-                                <tr key={player.id}>
-                                  <td className="text-nowrap">{player.jersey_number}</td>
-                                  <td className="text-nowrap">{player.name}</td>
-                                  <td className="text-nowrap">{summary.infield}</td>
-                                  <td className="text-nowrap">{summary.outfield}</td>
-                                  <td className="text-nowrap">{summary.bench}</td>
-                                  <td><small>{positionsPlayed || 'None'}</small></td>
-                                </tr>
-                              );
-                            })}
-                          </tbody>
-                        </table>
+                    <>
+                      {generatingAI && (
+                        <div className="alert alert-info">
+                          <span className="spinner-border spinner-border-sm me-2" role="status" aria-hidden="true"></span>
+                          Generating a new rotation. The current one is shown below until it's ready.
+                        </div>
+                      )}
+                      <div style={generatingAI ? { opacity: 0.6 } : undefined} aria-busy={generatingAI}>
+                        <AIRotationPreview
+                          aiRotations={aiRotations}
+                          availablePlayers={availablePlayers}
+                          battingOrder={battingOrder}
+                          innings={innings}
+                        />
                       </div>
-                    </div>
+                    </>
                   )}
                 </div>
                 <div className="modal-footer">
@@ -1,10 +1,55 @@
 import React, { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
-import { get, post, put, del as deleteMethod } from "../../services/api";
+import { getGames, createGame, updateGame, deleteGame } from "../../services/api";
 import GameForm from "./GameForm";
 import CSVUploadForm from "./CSVUploadForm";
 import "./GameList.css";
 
+// Formatters are created once and reused; toLocale*String builds a new one per call
+const DATE_FORMAT = new Intl.DateTimeFormat(undefined, { year: 'numeric', month: 'short', day: 'numeric' });
+const TIME_FORMAT = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit' });
+
+// Helper function to format date
+const formatDate = (dateString) => {
+  if (!dateString) return "N/A";
+  
+  // Fix for timezone issue: parse date parts directly to avoid timezone offset
+  const [year, month, day] = dateString.split('-').map(num => parseInt(num, 10));
+  // Month is 0-indexed in JavaScript Date
+  const date = new Date(year, month - 1, day);
+  
+  return DATE_FORMAT.format(date);
+};
+
+// Helper function to format time
+const formatTime = (timeString) => {
+  if (!timeString) return "N/A";
+  
+  try {
+    // Handle ISO format or time-only string
+    let time;
+    if (timeString.includes("T")) {
+      time = new Date(timeString);
+    } else {
+      // For time-only string in format HH:MM:SS
+      const [hours, minutes] = timeString.split(":");
+      time = new Date();
+      time.setHours(hours, minutes);
+    }
+    
+    return TIME_FORMAT.format(time);
+  } catch (e) {
+    return timeString;
+  }
+};
+
+// Add the display-ready date and time strings to a game from the API
+const toDisplayGame = (game) => ({
+  ...game,
+  displayDate: formatDate(game.date),
+  displayTime: formatTime(game.time)
+});
+
 const GameList = ({ teamId }) => {
   const [games, setGames] = useState([]);
   const [loading, setLoading] = useState(true);
@@ -20,12 +65,14 @@ const GameList = ({ teamId }) => {
   const fetchGames = async () => {
     try {
       setLoading(true);
-      const response = await get(`/teams/${teamId}/games`);
+      const response = await getGames(teamId);
       
-      // Sort games by game_number
-      const sortedGames = [...response.data].sort((a, b) => {
-        return parseInt(a.game_number) - parseInt(b.game_number);
-      });
+      // Sort games by game_number and format dates once per fetch rather than on every render
+      const sortedGames = [...response.data]
+        .sort((a, b) => {
+          return parseInt(a.game_number) - parseInt(b.game_number);
+        })
+        .map(toDisplayGame);
       
       setGames(sortedGames);
       setError("");
@@ -39,10 +86,19 @@ const GameList = ({ teamId }) => {
 
   const handleAddGame = async (gameData) => {
     try {
-      // Use the RESTful endpoint format
-      await post(`/teams/${teamId}/games`, gameData);
+      const response = await createGame(teamId, gameData);
       setShowAddForm(false);
-      fetchGames();
+      
+      // Slot the created game into the already sorted list instead of
+      // refetching and re-sorting every game for the team
+      const { message, ...createdGame } = response.data;
+      const newGame = toDisplayGame(createdGame);
+      const newNumber = parseInt(newGame.game_number);
+      setGames(prevGames => {
+        const insertAt = prevGames.findIndex(game => parseInt(game.game_number) > newNumber);
+        if (insertAt === -1) return [...prevGames, newGame];
+        return [...prevGames.slice(0, insertAt), newGame, ...prevGames.slice(insertAt)];
+      });
     } catch (err) {
       setError("Failed to add game. Please try again.");
       console.error(err);
@@ -54,14 +110,22 @@ const GameList = ({ teamId }) => {
     try {
       setError("");
       console.log("Updating game with data:", gameData);
-      const response = await put(`/games/${gameId}`, gameData);
+      const response = await updateGame(gameId, gameData);
       console.log("Update response:", response);
       
       // Close the modal first
       setEditingGame(null);
       
-      // Then refresh the games list
-      setTimeout(() => fetchGames(), 100);
+      // Swap in the updated game from the response rather than refetching
+      // and reformatting the whole schedule; only re-sort if its number changed
+      const { message, ...savedGame } = response.data;
+      const updatedGame = toDisplayGame(savedGame);
+      setGames(prevGames => {
+        const nextGames = prevGames.map(game => game.id === updatedGame.id ? updatedGame : game);
+        const previous = prevGames.find(game => game.id === updatedGame.id);
+        if (previous && previous.game_number === updatedGame.game_number) return nextGames;
+        return nextGames.sort((a, b) => parseInt(a.game_number) - parseInt(b.game_number));
+      });
     } catch (err) {
       setError("Failed to update game. Please try again.");
       console.error("Update game error:", err);
@@ -73,7 +137,7 @@ const GameList = ({ teamId }) => {
     if (window.confirm("Are you sure you want to delete this game? This action cannot be undone.")) {
       try {
         console.log(`Attempting to delete game with ID: ${gameId}`);
-        const response = await deleteMethod(`/games/${gameId}`);
+        const response = await deleteGame(gameId);
         console.log('Delete game response:', response);
         
         // Show success message
@@ -93,41 +157,6 @@ const GameList = ({ teamId }) => {
     }
   };
 
-  // Helper function to format date
-  const formatDate = (dateString) => {
-    if (!dateString) return "N/A";
-    const options = { year: 'numeric', month: 'short', day: 'numeric' };
-    
-    // Fix for timezone issue: parse date parts directly to avoid timezone offset
-    const [year, month, day] = dateString.split('-').map(num => parseInt(num, 10));
-    // Month is 0-indexed in JavaScript Date
-    const date = new Date(year, month - 1, day);
-    
-    return date.toLocaleDateString(undefined, options);
-  };
-
-  // Helper function to format time
-  const formatTime = (timeString) => {
-    if (!timeString) return "N/A";
-    
-    try {
-      // Handle ISO format or time-only string
-      let time;
-      if (timeString.includes("T")) {
-        time = new Date(timeString);
-      } else {
-        // For time-only string in format HH:MM:SS
-        const [hours, minutes] = timeString.split(":");
-        time = new Date();
-        time.setHours(hours, minutes);
-      }
-      
-      return time.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
-    } catch (e) {
-      return timeString;
-    }
-  };
-
   if (loading) {
     return <div className="text-center mt-3"><div className="spinner-border"></div></div>;
   }
@@ -214,8 +243,8 @@ const GameList = ({ teamId }) => {
                 <tr key={game.id}>
                   <td>{game.game_number}</td>
                   <td>{game.opponent}</td>
-                  <td>{formatDate(game.date)}</td>
-                  <td>{formatTime(game.time)}</td>
+                  <td>{game.displayDate}</td>
+                  <td>{game.displayTime}</td>
                   <td>{game.innings}</td>
                   <td className="text-center">
                     <div className="btn-group">
@@ -1,28 +1,115 @@
-import React, { useState, useEffect, useRef } from "react";
-import { getBattingOrder, getFieldingRotations, getPlayerAvailability, getTeam } from "../../services/api";
-import html2pdf from "html2pdf.js";
+import React, { useState, useEffect, useRef, useMemo } from "react";
+import { getBattingOrder, getFieldingRotations, getPlayerAvailability } from "../../services/api";
 
-// Helper function to format date properly without timezone issues
-const formatDate = (dateString) => {
-  if (!dateString) return "N/A";
-  const options = { year: 'numeric', month: 'long', day: 'numeric' };
-  
-  // Fix for timezone issue: parse date parts directly to avoid timezone offset
-  const [year, month, day] = dateString.split('-').map(num => parseInt(num, 10));
-  // Month is 0-indexed in JavaScript Date
-  const date = new Date(year, month - 1, day);
-  
-  return date.toLocaleDateString(undefined, options);
+// html2pdf (with html2canvas and jsPDF) is by far the largest thing on this
+// tab and only needed when exporting, so load it on the first export and
+// reuse the same module afterwards
+let html2pdfModule = null;
+const loadHtml2pdf = () => {
+  if (!html2pdfModule) {
+    html2pdfModule = import("html2pdf.js")
+      .then(module => module.default)
+      .catch(error => {
+        // Let the next export try again
+        html2pdfModule = null;
+        throw error;
+      });
+  }
+  return html2pdfModule;
 };
 
-const GameSummaryTab = ({ gameId, players, game, innings }) => {
+// Every row in the table is an available player (see summaryRows), so
+// anyone without a position in an inning that has a rotation is on the bench;
+// there's no need to check availability again for each cell
+const getPlayerPosition = (positionsByInning, playerId, inning) => {
+  const playerPositions = positionsByInning.get(inning);
+  if (!playerPositions) return "";
+
+  return playerPositions.get(playerId) || "Bench";
+};
+
+// The printable summary: game header and lineup table. Memoized so state
+// changes in the tab, such as the export button's progress, don't rebuild the
+// table; it only re-renders when the loaded data changes.
+const SummarySheet = React.memo(({
+  sheetRef,
+  game,
+  gameLabels,
+  teamLabels,
+  inningNumbers,
+  summaryRows
+}) => (
+  <div ref={sheetRef} className="pdf-content" style={{ maxWidth: '1050px', margin: '0 auto', fontSize: '0.9em' }}>
+    <div className="card mb-3">
+      <div className="card-header bg-primary text-white py-1">
+        <h5 className="mb-0">Game #{game.game_number}: {teamLabels.title} vs {game.opponent}</h5>
+      </div>
+      <div className="card-body py-2">
+        <div className="row">
+          <div className="col-md-3">
+            <p className="mb-1"><small><strong>Team:</strong> {teamLabels.name}</small></p>
+            <p className="mb-1"><small><strong>League:</strong> {teamLabels.league}</small></p>
+          </div>
+          <div className="col-md-3">
+            <p className="mb-1"><small><strong>Head Coach:</strong> {teamLabels.headCoach}</small></p>
+            <p className="mb-1"><small><strong>Asst1:</strong> {teamLabels.assistantCoach1}</small></p>
+            <p className="mb-1"><small><strong>Asst2:</strong> {teamLabels.assistantCoach2}</small></p>
+          </div>
+          <div className="col-md-3">
+            <p className="mb-1"><small><strong>Date:</strong> {gameLabels.date}</small></p>
+            <p className="mb-1"><small><strong>Time:</strong> {gameLabels.time}</small></p>
+          </div>
+          <div className="col-md-3">
+            <p className="mb-1"><small><strong>Opponent:</strong> {game.opponent}</small></p>
+            <p className="mb-1"><small><strong>Innings:</strong> {game.innings}</small></p>
+          </div>
+        </div>
+      </div>
+    </div>
+
+    <div className="table-responsive">
+      <table className="table table-bordered table-striped table-sm small">
+        <thead>
+          <tr className="bg-primary text-white">
+            <th className="py-1">Bat</th>
+            <th className="py-1">#</th>
+            <th className="py-1">Player</th>
+            <th className="py-1">Avail</th>
+            {inningNumbers.map(inning => (
+              <th key={inning} className="py-1">Inn {inning}</th>
+            ))}
+          </tr>
+        </thead>
+        <tbody>
+          {summaryRows.map(row => (
+            <tr key={row.id}>
+              <td className="py-1">{row.battingLabel}</td>
+              <td className="py-1">{row.jersey_number}</td>
+              <td className="py-1">{row.name}</td>
+              <td className="py-1">Y</td>
+              {row.positions.map((position, i) => (
+                <td key={i} className={`py-1 ${position === 'Bench' ? 'text-muted fst-italic' : ''}`}>
+                  {position}
+                </td>
+              ))}
+            </tr>
+          ))}
+        </tbody>
+      </table>
+    </div>
+  </div>
+));
+
+const GameSummaryTab = ({ gameId, players, playerLookup, game, team, gameLabels, innings }) => {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
   const [battingOrder, setBattingOrder] = useState([]);
   const [fieldingRotations, setFieldingRotations] = useState([]);
   const [playerAvailability, setPlayerAvailability] = useState([]);
-  const [teamDetails, setTeamDetails] = useState(null);
+  const [exporting, setExporting] = useState(false);
   const summaryRef = useRef(null);
+  // Last exported PDF and the data it was rendered from
+  const pdfCache = useRef(null);
 
   useEffect(() => {
     fetchData();
@@ -33,92 +120,49 @@ const GameSummaryTab = ({ gameId, players, game, innings }) => {
       setLoading(true);
       setError("");
       
-      // Fetch team details
-      const teamResponse = await getTeam(game.team_id);
-      setTeamDetails(teamResponse.data);
-      
-      // IMPORTANT: First get player availability to know who's available
+      // IMPORTANT: First get player availability to know who's available.
+      // If it fails, carry on with no records so everyone counts as available
+      // and the rest of the summary still loads.
+      let availabilityRecords = [];
       try {
         const availabilityResponse = await getPlayerAvailability(gameId);
-        setPlayerAvailability(availabilityResponse.data);
-        
-        // Load the rest of the data AFTER we know player availability
-        // This ensures we don't have UI flickering or inconsistencies
-        
-        // Get batting order
-        try {
-          const battingOrderResponse = await getBattingOrder(gameId);
-          const orderData = battingOrderResponse.data.order_data || [];
-          
-          // Create an array of player objects in batting order
-          const playerMap = players.reduce((map, player) => {
-            map[player.id] = player;
-            return map;
-          }, {});
-          
-          // Get availability map for filtering
-          const availabilityMap = {};
-          availabilityResponse.data.forEach(item => {
-            availabilityMap[item.player_id] = item.available;
-          });
-          
-          // Filter ordered players to only include available players
-          const orderedPlayers = orderData
-            .map(playerId => playerMap[playerId])
-            .filter(player => {
-              if (!player) return false;
-              // Only exclude explicitly unavailable players
-              return availabilityMap[player.id] !== false;
-            });
-            
-          setBattingOrder(orderedPlayers);
-        } catch (err) {
-          console.error("Failed to load batting order:", err);
-          setBattingOrder([]);
-        }
-  
-        // Get fielding rotations
-        try {
-          const rotationsResponse = await getFieldingRotations(gameId);
-          setFieldingRotations(rotationsResponse.data);
-        } catch (err) {
-          console.error("Failed to load fielding rotations:", err);
-          setFieldingRotations([]);
-        }
-        
+        availabilityRecords = availabilityResponse.data;
       } catch (err) {
         console.error("Failed to load player availability:", err);
-        setPlayerAvailability([]);
+      }
+      setPlayerAvailability(availabilityRecords);
+      
+      // Get batting order
+      try {
+        const battingOrderResponse = await getBattingOrder(gameId);
+        const orderData = battingOrderResponse.data.order_data || [];
         
-        // Even if availability failed, still try to load other data
-        try {
-          const battingOrderResponse = await getBattingOrder(gameId);
-          const orderData = battingOrderResponse.data.order_data || [];
-          
-          // Create an array of player objects in batting order
-          const playerMap = players.reduce((map, player) => {
-            map[player.id] = player;
-            return map;
-          }, {});
+        // Only explicitly unavailable players are excluded
+        const unavailableIds = new Set(
+          availabilityRecords
+            .filter(item => item.available === false)
+            .map(item => item.player_id)
+        );
+        
+        // Filter ordered players to only include available players
+        // Create an array of player objects in batting order
+        const orderedPlayers = orderData
+          .map(playerId => playerLookup.get(playerId))
+          .filter(player => player && !unavailableIds.has(player.id));
           
-          const orderedPlayers = orderData
-            .map(playerId => playerMap[playerId])
-            .filter(Boolean);
-            
-          setBattingOrder(orderedPlayers);
-        } catch (batchErr) {
-          console.error("Failed to load batting order:", batchErr);
-          setBattingOrder([]);
-        }
-  
-        // Get fielding rotations
-        try {
-          const rotationsResponse = await getFieldingRotations(gameId);
-          setFieldingRotations(rotationsResponse.data);
-        } catch (rotErr) {
-          console.error("Failed to load fielding rotations:", rotErr);
-          setFieldingRotations([]);
-        }
+        setBattingOrder(orderedPlayers);
+      } catch (err) {
+        console.error("Failed to load batting order:", err);
+        setBattingOrder([]);
+      }
+
+      // Get fielding rotations
+      try {
+        const rotationsResponse = await getFieldingRotations(gameId);
+        setFieldingRotations(rotationsResponse.data);
+      } catch (err) {
+        console.error("Failed to load fielding rotations:", err);
+        setFieldingRotations([]);
       }
     } catch (err) {
       setError("Failed to load game summary data. Please try again.");
@@ -128,40 +172,78 @@ const GameSummaryTab = ({ gameId, players, game, innings }) => {
     }
   };
 
-  const getPlayerPosition = (playerId, inning) => {
-    const rotation = fieldingRotations.find(r => r.inning === inning);
-    if (!rotation || !rotation.positions) return "";
+  // Header text from the team details GameDetail loaded with the roster
+  const teamLabels = useMemo(
+    () => ({
+      title: team?.name || 'Team',
+      name: team?.name || 'N/A',
+      league: team?.league || 'N/A',
+      headCoach: team?.head_coach || 'N/A',
+      assistantCoach1: team?.assistant_coach1 || 'N/A',
+      assistantCoach2: team?.assistant_coach2 || 'N/A'
+    }),
+    [team]
+  );
+
+  // Inning numbers for the table columns, shared by the header and every row
+  const inningNumbers = useMemo(
+    () => Array.from({ length: innings }, (_, i) => i + 1),
+    [innings]
+  );
+
+  // Inning -> (player id -> position), inverted once per load so each table
+  // cell is a single Map lookup instead of a scan of that inning's positions
+  const positionsByInning = useMemo(() => {
+    const byInning = new Map();
+    fieldingRotations.forEach(rotation => {
+      if (!rotation.positions) return;
+      const playerPositions = new Map();
+      Object.entries(rotation.positions).forEach(([position, posPlayerId]) => {
+        // Keep the first position listed for a player, as the scan did
+        if (!playerPositions.has(posPlayerId)) {
+          playerPositions.set(posPlayerId, position);
+        }
+      });
+      byInning.set(rotation.inning, playerPositions);
+    });
+    return byInning;
+  }, [fieldingRotations]);
 
-    for (const [position, posPlayerId] of Object.entries(rotation.positions)) {
-      if (posPlayerId === playerId) {
-        return position;
+  // The summary table as plain rows, built once per load rather than on every
+  // render: the available players in batting order if there is one, otherwise
+  // every available player on the roster, each with its display name and
+  // position for every inning already resolved
+  const summaryRows = useMemo(() => {
+    const availablePlayerIds = new Set();
+    playerAvailability.forEach(record => {
+      if (record.available !== false) {
+        availablePlayerIds.add(record.player_id);
       }
-    }
+    });
     
-    // Check if player is available for this game before showing "Bench"
-    if (isPlayerAvailable(playerId)) {
-      return "Bench";
-    }
-    return "";
-  };
-
-  const isPlayerAvailable = (playerId) => {
-    // Only check for explicitly unavailable players
-    // If we don't have data yet, assume available to avoid flicker during loading
-    if (!playerAvailability || playerAvailability.length === 0) {
-      return true;
-    }
+    const availableBattingOrder = battingOrder.filter(player =>
+      availablePlayerIds.has(player.id)
+    );
+    const inBattingOrder = availableBattingOrder.length > 0;
+    const shownPlayers = inBattingOrder
+      ? availableBattingOrder
+      : players.filter(player => availablePlayerIds.has(player.id));
     
-    const availability = playerAvailability.find(a => a.player_id === playerId);
-    // If we have a record and available is explicitly false, player is unavailable
-    // Otherwise assume available (includes null/undefined availability records)
-    return availability ? availability.available !== false : true;
-  };
+    return shownPlayers.map((player, index) => ({
+      id: player.id,
+      battingLabel: inBattingOrder ? index + 1 : '-',
+      jersey_number: player.jersey_number,
+      name: player.full_name || `${player.first_name} ${player.last_name}`,
+      positions: inningNumbers.map(inning =>
+        getPlayerPosition(positionsByInning, player.id, inning)
+      )
+    }));
+  }, [players, battingOrder, playerAvailability, inningNumbers, positionsByInning]);
 
   // Removed unused getPlayerById function
 
-  const generatePDF = () => {
-    if (!summaryRef.current) return;
+  const generatePDF = async () => {
+    if (!summaryRef.current || exporting) return;
     
     const title = `Game_${game.game_number}_vs_${game.opponent.replace(/\s+/g, '_')}`;
     
@@ -184,8 +266,36 @@ const GameSummaryTab = ({ gameId, players, game, innings }) => {
       pagebreak: { mode: ['avoid-all', 'css', 'legacy'] }
     };
     
-    // Generate PDF from the summary content
-    html2pdf().from(summaryRef.current).set(options).save();
+    try {
+      setExporting(true);
+      
+      // Rendering the summary to canvas and laying out the PDF is slow, so
+      // reuse the last PDF if none of the data shown in it has changed
+      const sources = [game, gameLabels, teamLabels, inningNumbers, summaryRows];
+      const cached = pdfCache.current;
+      let blob;
+      if (cached && cached.sources.every((source, i) => source === sources[i])) {
+        blob = cached.blob;
+      } else {
+        // Generate PDF from the summary content
+        const html2pdf = await loadHtml2pdf();
+        blob = await html2pdf().set(options).from(summaryRef.current).outputPdf('blob');
+        pdfCache.current = { sources, blob };
+      }
+      
+      const downloadUrl = window.URL.createObjectURL(blob);
+      const link = document.createElement('a');
+      link.href = downloadUrl;
+      link.setAttribute('download', `${title}.pdf`);
+      document.body.appendChild(link);
+      link.click();
+      link.parentNode.removeChild(link);
+      window.URL.revokeObjectURL(downloadUrl);
+    } catch (err) {
+      console.error("Failed to generate PDF:", err);
+    } finally {
+      setExporting(false);
+    }
   };
 
   if (loading) {
@@ -203,119 +313,20 @@ const GameSummaryTab = ({ gameId, players, game, innings }) => {
         <button 
           className="btn btn-primary"
           onClick={generatePDF}
+          disabled={exporting}
         >
-          <i className="bi bi-file-earmark-pdf me-2"></i>Export as PDF
+          <i className="bi bi-file-earmark-pdf me-2"></i>{exporting ? "Exporting..." : "Export as PDF"}
         </button>
       </div>
       
-      <div ref={summaryRef} className="pdf-content" style={{ maxWidth: '1050px', margin: '0 auto', fontSize: '0.9em' }}>
-
-      <div className="card mb-3">
-        <div className="card-header bg-primary text-white py-1">
-          <h5 className="mb-0">Game #{game.game_number}: {teamDetails?.name || 'Team'} vs {game.opponent}</h5>
-        </div>
-        <div className="card-body py-2">
-          <div className="row">
-            <div className="col-md-3">
-              <p className="mb-1"><small><strong>Team:</strong> {teamDetails?.name || 'N/A'}</small></p>
-              <p className="mb-1"><small><strong>League:</strong> {teamDetails?.league || 'N/A'}</small></p>
-            </div>
-            <div className="col-md-3">
-              <p className="mb-1"><small><strong>Head Coach:</strong> {teamDetails?.head_coach || 'N/A'}</small></p>
-              <p className="mb-1"><small><strong>Asst1:</strong> {teamDetails?.assistant_coach1 || 'N/A'}</small></p>
-              <p className="mb-1"><small><strong>Asst2:</strong> {teamDetails?.assistant_coach2 || 'N/A'}</small></p>
-            </div>
-            <div className="col-md-3">
-              <p className="mb-1"><small><strong>Date:</strong> {game.date ? formatDate(game.date) : 'N/A'}</small></p>
-              <p className="mb-1"><small><strong>Time:</strong> {game.time ? new Date(`2022-01-01T${game.time}`).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }) : 'N/A'}</small></p>
-            </div>
-            <div className="col-md-3">
-              <p className="mb-1"><small><strong>Opponent:</strong> {game.opponent}</small></p>
-              <p className="mb-1"><small><strong>Innings:</strong> {game.innings}</small></p>
-            </div>
-          </div>
-        </div>
-      </div>
-
-      <div className="table-responsive">
-        <table className="table table-bordered table-striped table-sm small">
-          <thead>
-            <tr className="bg-primary text-white">
-              <th className="py-1">Bat</th>
-              <th className="py-1">#</th>
-              <th className="py-1">Player</th>
-              <th className="py-1">Avail</th>
-              {Array.from({ length: innings }).map((_, i) => (
-                <th key={i+1} className="py-1">Inn {i+1}</th>
-              ))}
-            </tr>
-          </thead>
-          <tbody>
-            {/* Get the list of actually available players */}
-            {
-              (() => {
-                // First, get a list of only available players
-                const availablePlayerIds = new Set();
-                playerAvailability.forEach(record => {
-                  if (record.available !== false) {
-                    availablePlayerIds.add(record.player_id);
-                  }
-                });
-                
-                // Filter the players list to only include available players
-                const availablePlayers = players.filter(player => 
-                  availablePlayerIds.has(player.id)
-                );
-                
-                // Filter the batting order to only include available players
-                const availableBattingOrder = battingOrder.filter(player => 
-                  availablePlayerIds.has(player.id)
-                );
-                
-                // If we have a batting order with available players, show it
-                if (availableBattingOrder.length > 0) {
-                  return availableBattingOrder.map((player, index) => (
-                    <tr key={player.id}>
-                      <td className="py-1">{index + 1}</td>
-                      <td className="py-1">{player.jersey_number}</td>
-                      <td className="py-1">{player.full_name || `${player.first_name} ${player.last_name}`}</td>
-                      <td className="py-1">Y</td>
-                      {Array.from({ length: innings }).map((_, i) => {
-                        const position = getPlayerPosition(player.id, i+1);
-                        return (
-                          <td key={i+1} className={`py-1 ${position === 'Bench' ? 'text-muted fst-italic' : ''}`}>
-                            {position}
-                          </td>
-                        );
-                      })}
-                    </tr>
-                  ));
-                } else {
-                  // Otherwise show all available players without batting order
-                  return availablePlayers.map((player) => (
-                    <tr key={player.id}>
-                      <td className="py-1">-</td>
-                      <td className="py-1">{player.jersey_number}</td>
-                      <td className="py-1">{player.full_name || `${player.first_name} ${player.last_name}`}</td>
-                      <td className="py-1">Y</td>
-                      {Array.from({ length: innings }).map((_, i) => {
-                        const position = getPlayerPosition(player.id, i+1);
-                        return (
-                          <td key={i+1} className={`py-1 ${position === 'Bench' ? 'text-muted fst-italic' : ''}`}>
-                            {position}
-                          </td>
-                        );
-                      })}
-                    </tr>
-                  ));
-                }
-              })()
-            }
-          </tbody>
-        </table>
-      </div>
-      
-      </div>
+      <SummarySheet
+        sheetRef={summaryRef}
+        game={game}
+        gameLabels={gameLabels}
+        teamLabels={teamLabels}
+        inningNumbers={inningNumbers}
+        summaryRows={summaryRows}
+      />
       
       <div className="mt-4 mb-4">
         <div className="alert alert-info">
@@ -1,6 +1,54 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useMemo, useCallback } from "react";
 import { getPlayerAvailability, batchSavePlayerAvailability } from "../../services/api";
 
+// Merge availability records into one row per player, defaulting players
+// without a record to available and not catching
+const buildAvailabilityRows = (players, records) => {
+  const recordsByPlayer = new Map(records.map(item => [item.player_id, item]));
+  return players.map(player => {
+    const record = recordsByPlayer.get(player.id);
+    return {
+      player_id: player.id,
+      name: player.full_name,
+      jersey_number: player.jersey_number,
+      available: record?.available ?? true,
+      can_play_catcher: record?.can_play_catcher ?? false
+    };
+  });
+};
+
+// One table row. Memoized so toggling a checkbox re-renders only the row that
+// changed; the handlers passed in are stable across renders.
+const AvailabilityRow = React.memo(({ player, onAvailabilityChange, onCatcherChange }) => (
+  <tr>
+    <td>{player.jersey_number}</td>
+    <td>{player.name}</td>
+    <td className="text-center">
+      <div className="form-check d-flex justify-content-center">
+        <input
+          className="form-check-input"
+          type="checkbox"
+          id={`available-${player.player_id}`}
+          checked={player.available}
+          onChange={(e) => onAvailabilityChange(player.player_id, e.target.checked)}
+        />
+      </div>
+    </td>
+    <td className="text-center">
+      <div className="form-check d-flex justify-content-center">
+        <input
+          className="form-check-input"
+          type="checkbox"
+          id={`catcher-${player.player_id}`}
+          checked={player.can_play_catcher}
+          onChange={(e) => onCatcherChange(player.player_id, e.target.checked)}
+          disabled={!player.available}
+        />
+      </div>
+    </td>
+  </tr>
+));
+
 const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
   const [availabilityData, setAvailabilityData] = useState([]);
   const [loading, setLoading] = useState(true);
@@ -16,26 +64,7 @@ const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
     try {
       setLoading(true);
       const response = await getPlayerAvailability(gameId);
-      
-      // Create a map of player availability
-      const availabilityMap = {};
-      response.data.forEach(item => {
-        availabilityMap[item.player_id] = {
-          available: item.available,
-          can_play_catcher: item.can_play_catcher
-        };
-      });
-      
-      // Merge with player list
-      const mergedData = players.map(player => ({
-        player_id: player.id,
-        name: player.full_name,
-        jersey_number: player.jersey_number,
-        available: availabilityMap[player.id]?.available ?? true,
-        can_play_catcher: availabilityMap[player.id]?.can_play_catcher ?? false
-      }));
-      
-      setAvailabilityData(mergedData);
+      setAvailabilityData(buildAvailabilityRows(players, response.data));
       setError("");
     } catch (err) {
       setError("Failed to load player availability. Please try again.");
@@ -45,7 +74,7 @@ const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
     }
   };
 
-  const handleAvailabilityChange = (playerId, available) => {
+  const handleAvailabilityChange = useCallback((playerId, available) => {
     setAvailabilityData(prevData => 
       prevData.map(item => 
         item.player_id === playerId 
@@ -53,9 +82,9 @@ const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
           : item
       )
     );
-  };
+  }, []);
 
-  const handleCatcherChange = (playerId, canPlayCatcher) => {
+  const handleCatcherChange = useCallback((playerId, canPlayCatcher) => {
     setAvailabilityData(prevData => 
       prevData.map(item => 
         item.player_id === playerId 
@@ -63,7 +92,7 @@ const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
           : item
       )
     );
-  };
+  }, []);
 
   const handleSaveAvailability = async () => {
     try {
@@ -86,8 +115,9 @@ const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
         const result = await batchSavePlayerAvailability(gameId, apiData);
         console.log("[PlayerAvailability] Save successful:", result);
         
-        // Refresh data to ensure UI is in sync with server
-        await fetchPlayerAvailability();
+        // Sync the UI from the saved records the server echoed back
+        // rather than fetching the availability list again
+        setAvailabilityData(buildAvailabilityRows(players, result.data.records || []));
         
         setSuccess("Player availability saved successfully.");
       } catch (saveError) {
@@ -125,6 +155,23 @@ const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
     );
   };
 
+  // Tally the summary counts in a single pass over the rows
+  const availabilitySummary = useMemo(() => {
+    let availableCount = 0;
+    let catcherCount = 0;
+    availabilityData.forEach(item => {
+      if (item.available) {
+        availableCount += 1;
+        if (item.can_play_catcher) catcherCount += 1;
+      }
+    });
+    return {
+      available: availableCount,
+      unavailable: availabilityData.length - availableCount,
+      catchers: catcherCount
+    };
+  }, [availabilityData]);
+
   if (loading) {
     return <div className="text-center mt-3"><div className="spinner-border"></div></div>;
   }
@@ -167,6 +214,11 @@ const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
       {error && <div className="alert alert-danger">{error}</div>}
       {success && <div className="alert alert-success">{success}</div>}
 
+      <p className="text-muted">
+        {availabilitySummary.available} available, {availabilitySummary.unavailable} unavailable,{" "}
+        {availabilitySummary.catchers} available to catch
+      </p>
+
       <div className="table-responsive">
         <table className="table table-striped">
           <thead>
@@ -179,33 +231,12 @@ const PlayerAvailabilityTab = ({ gameId, players, refreshPlayers }) => {
           </thead>
           <tbody>
             {availabilityData.map(player => (
-              <tr key={player.player_id}>
-                <td>{player.jersey_number}</td>
-                <td>{player.name}</td>
-                <td className="text-center">
-                  <div className="form-check d-flex justify-content-center">
-                    <input
-                      className="form-check-input"
-                      type="checkbox"
-                      id={`available-${player.player_id}`}
-                      checked={player.available}
-                      onChange={(e) => handleAvailabilityChange(player.player_id, e.target.checked)}
-                    />
-                  </div>
-                </td>
-                <td className="text-center">
-                  <div className="form-check d-flex justify-content-center">
-                    <input
-                      className="form-check-input"
-                      type="checkbox"
-                      id={`catcher-${player.player_id}`}
-                      checked={player.can_play_catcher}
-                      onChange={(e) => handleCatcherChange(player.player_id, e.target.checked)}
-                      disabled={!player.available}
-                    />
-                  </div>
-                </td>
-              </tr>
+              <AvailabilityRow
+                key={player.player_id}
+                player={player}
+                onAvailabilityChange={handleAvailabilityChange}
+                onCatcherChange={handleCatcherChange}
+              />
             ))}
           </tbody>
         </table>
@@ -0,0 +1,150 @@
+import React from "react";
+import { FIELD_POSITIONS, INFIELD_SET, OUTFIELD_SET } from "../../constants";
+
+// True if two positions are both infield or both outfield
+const sameArea = (a, b) =>
+  (INFIELD_SET.has(a) && INFIELD_SET.has(b)) || (OUTFIELD_SET.has(a) && OUTFIELD_SET.has(b));
+
+// Editable player-by-inning position grid for the fielding rotation tab.
+// Memoized so state changes elsewhere in the tab (AI options, save status,
+// messages) don't rebuild every dropdown; it only re-renders when the rotation,
+// players or innings change. The handlers passed in must be stable.
+const RotationGrid = ({
+  sortedPlayers,
+  inningsArray,
+  innings,
+  rotations,
+  positionsByInning,
+  positionSummaries,
+  onPositionChange,
+  onClearPosition,
+  onAutoAssign,
+  onCopyPrevious
+}) => (
+  <div className="table-responsive">
+    <table className="table table-striped" style={{ fontSize: '0.875rem' }}>
+      <thead>
+        <tr>
+          <th className="text-nowrap">Batting</th>
+          <th className="text-nowrap">#</th>
+          <th className="text-nowrap">Player</th>
+          <th className="text-nowrap">Summary</th>
+          {inningsArray.map(inning => (
+            <th key={inning} className="text-nowrap" style={{ minWidth: '140px' }}>
+              Inning {inning}
+              <div className="btn-group btn-group-sm ms-2">
+                <button
+                  className="btn btn-outline-secondary btn-sm"
+                  onClick={() => onAutoAssign(inning)}
+                  title="Auto-assign positions for this inning"
+                >
+                  <i className="bi bi-lightning"></i>
+                </button>
+                {inning > 1 && (
+                  <button
+                    className="btn btn-outline-secondary btn-sm"
+                    onClick={() => onCopyPrevious(inning)}
+                    title="Copy from previous inning"
+                  >
+                    <i className="bi bi-arrow-left"></i>
+                  </button>
+                )}
+              </div>
+            </th>
+          ))}
+        </tr>
+      </thead>
+      <tbody>
+        {sortedPlayers.map(player => {
+          const positionSummary = positionSummaries.get(player.id);
+          return (
+          <tr key={player.id}>
+            <td className="text-nowrap">
+              {player.battingPosition ? player.battingPosition : '-'}
+            </td>
+            <td className="text-nowrap">{player.jersey_number}</td>
+            <td className="text-nowrap">{player.name}</td>
+            <td className="text-nowrap">
+              <small>
+                IF: {positionSummary.infield} &middot;
+                OF: {positionSummary.outfield} &middot;
+                Bench: {positionSummary.bench}
+              </small>
+            </td>
+            {inningsArray.map(inning => {
+              // Find the position for this player in this inning
+              const inningRotation = rotations[inning] || {};
+              const position = positionsByInning[inning].get(player.id) ?? null;
+
+              // Check if this is a problematic position (consecutive infield or outfield)
+              let isProblematic = false;
+              if (position) {
+                // Check previous inning
+                if (inning > 1) {
+                  const prevPosition = positionsByInning[inning - 1].get(player.id);
+                  if (prevPosition && sameArea(position, prevPosition)) {
+                    isProblematic = true;
+                  }
+                }
+
+                // Check next inning
+                if (inning < innings) {
+                  const nextPosition = positionsByInning[inning + 1].get(player.id);
+                  if (nextPosition && sameArea(position, nextPosition)) {
+                    isProblematic = true;
+                  }
+                }
+              }
+
+              return (
+                <td key={inning} className="text-nowrap">
+                  <select
+                    className={`form-select form-select-sm ${isProblematic ? 'border-danger' : ''}`}
+                    value={position || ""}
+                    style={{ fontSize: '0.875rem', minWidth: '120px' }}
+                    onChange={(e) => {
+                      const newPosition = e.target.value;
+                      if (newPosition === "") {
+                        // If empty, clear any existing position for this player in this inning
+                        if (position) {
+                          onClearPosition(inning, position);
+                        }
+                      } else {
+                        // Assign the player to the new position
+                        onPositionChange(player, inning, newPosition);
+                      }
+                    }}
+                  >
+                    <option value="">Bench</option>
+                    {FIELD_POSITIONS.map(pos => {
+                      // Check if this position already appears for this player in the game
+                      const isDuplicatePosition = positionSummary.positions[pos] &&
+                                                (position !== pos || positionSummary.positions[pos] > 1);
+
+                      // Check if this position is currently occupied by someone else
+                      const isOccupied = inningRotation[pos] && inningRotation[pos] !== player.id;
+
+                      return (
+                        <option
+                          key={pos}
+                          value={pos}
+                          className={`${isDuplicatePosition ? 'text-danger' : ''} ${isOccupied ? 'text-warning' : ''}`}
+                        >
+                          {pos}
+                          {isDuplicatePosition ? ` (${positionSummary.positions[pos]}×)` : ''}
+                          {isOccupied ? ' (occupied)' : ''}
+                        </option>
+                      );
+                    })}
+                  </select>
+                </td>
+              );
+            })}
+          </tr>
+        )})}
+      </tbody>
+    </table>
+  </div>
+);
+
+export default React.memo(RotationGrid);
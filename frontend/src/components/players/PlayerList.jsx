@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useRef } from "react";
 import { Link } from "react-router-dom";
-import { get, post, put, del as deleteMethod } from "../../services/api";
+import { get, post, put, del as deleteMethod, invalidatePlayersCache, invalidateGameDataCache } from "../../services/api";
 import axios from "axios";
 import PlayerForm from "./PlayerForm";
 import CSVUploadForm from "./CSVUploadForm";
@@ -18,6 +18,8 @@ const PlayerList = ({ teamId }) => {
   }, [teamId]);
 
   const fetchPlayers = async () => {
+    // The roster is about to change or be re-read; drop the cached copy used by game pages
+    invalidatePlayersCache(teamId);
     try {
       setLoading(true);
       const response = await get(`/teams/${teamId}/players`);
@@ -34,9 +36,14 @@ const PlayerList = ({ teamId }) => {
   const handleAddPlayer = async (playerData) => {
     try {
       // Using the RESTful endpoint format
-      await post(`/teams/${teamId}/players`, playerData);
+      const response = await post(`/teams/${teamId}/players`, playerData);
       setShowAddForm(false);
-      fetchPlayers();
+      
+      // The response is the created player, so append it rather than
+      // re-downloading the whole roster
+      const { message, ...createdPlayer } = response.data;
+      setPlayers(prevPlayers => [...prevPlayers, createdPlayer]);
+      invalidatePlayersCache(teamId);
     } catch (err) {
       setError("Failed to add player. Please try again.");
       console.error(err);
@@ -60,7 +67,12 @@ const PlayerList = ({ teamId }) => {
     if (window.confirm("Are you sure you want to delete this player? This action cannot be undone.")) {
       try {
         await deleteMethod(`/players/${playerId}`);
-        fetchPlayers();
+        
+        // Drop the player from the list by ID instead of reloading the roster
+        setPlayers(prevPlayers => prevPlayers.filter(player => player.id !== playerId));
+        invalidatePlayersCache(teamId);
+        // Cached availability and batting orders may still reference the player
+        invalidateGameDataCache();
       } catch (err) {
         setError("Failed to delete player. Please try again.");
         console.error(err);
@@ -7,6 +7,12 @@ export const POSITIONS = ["Pitcher", "Catcher", "1B", "2B", "3B", "SS", "LF", "R
 export const INFIELD = ["Pitcher", "1B", "2B", "3B", "SS"];
 export const OUTFIELD = ["Catcher", "LF", "RF", "LC", "RC"];
 export const BENCH = ["Bench"];
+// Positions that must be filled on the field each inning (everything but Bench)
+export const FIELD_POSITIONS = POSITIONS.filter(pos => pos !== "Bench");
+
+// Set views of the position groups for membership checks in per-cell loops
+export const INFIELD_SET = new Set(INFIELD);
+export const OUTFIELD_SET = new Set(OUTFIELD);
 
 // Other constants
 export const MAX_INNINGS = 9;
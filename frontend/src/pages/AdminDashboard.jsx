@@ -1,4 +1,4 @@
-import React, { useState, useEffect, useContext } from "react";
+import React, { useState, useEffect, useContext, useMemo } from "react";
 import { useNavigate } from "react-router-dom";
 import { api } from "../services/api";
 import { AuthContext } from "../services/AuthContext";
@@ -15,6 +15,13 @@ const AdminDashboard = () => {
   const { refreshToken, logout } = useContext(AuthContext);
   const navigate = useNavigate();
 
+  // User ID -> user for the loaded list, so the action handlers can check a
+  // user's status without searching the list
+  const usersById = useMemo(
+    () => new Map(users.map(user => [user.id, user])),
+    [users]
+  );
+
   useEffect(() => {
     // Check token and refresh data when component mounts or tab changes
     const loadData = async () => {
@@ -105,6 +112,8 @@ const AdminDashboard = () => {
 
   const handleApprove = async (userId) => {
     try {
+      // Note the status before the list is updated, to adjust the badge count locally
+      const wasPending = usersById.get(userId)?.status === "pending";
       setLoading(true);
       setError("");
       await api.post(`/admin/users/${userId}/approve`);
@@ -119,7 +128,11 @@ const AdminDashboard = () => {
         ));
       }
       
-      await fetchPendingCount();
+      // A pending user leaving the queue is the only way this changes the
+      // count, so adjust it here instead of asking the server again
+      if (wasPending) {
+        setPendingCount(count => Math.max(0, count - 1));
+      }
       setSuccess(`User approved successfully`);
       setTimeout(() => setSuccess(""), 3000);
     } catch (err) {
@@ -137,6 +150,7 @@ const AdminDashboard = () => {
 
   const handleReject = async (userId, reason = "") => {
     try {
+      const wasPending = usersById.get(userId)?.status === "pending";
       setLoading(true);
       setError("");
       await api.post(`/admin/users/${userId}/reject`, { reason });
@@ -151,7 +165,10 @@ const AdminDashboard = () => {
         ));
       }
       
-      await fetchPendingCount();
+      // Same local adjustment as for approvals
+      if (wasPending) {
+        setPendingCount(count => Math.max(0, count - 1));
+      }
       setSuccess(`User rejected successfully`);
       setTimeout(() => setSuccess(""), 3000);
     } catch (err) {
@@ -1,15 +1,54 @@
-import React, { useState, useEffect, useCallback } from "react";
+import React, { useState, useEffect, useCallback, useMemo } from "react";
 import { useParams, Link } from "react-router-dom";
-import { getGame, getPlayers } from "../services/api";
+import { getGame, getPlayers, getTeam } from "../services/api";
 import BattingOrderTab from "../components/games/BattingOrderTab";
 import FieldingRotationTab from "../components/games/FieldingRotationTab";
 import PlayerAvailabilityTab from "../components/games/PlayerAvailabilityTab";
 import GameSummaryTab from "../components/games/GameSummaryTab";
 
+// Formatters are created once and reused; toLocale*String builds a new one per call
+const DATE_FORMAT = new Intl.DateTimeFormat(undefined, { year: 'numeric', month: 'long', day: 'numeric' });
+const TIME_FORMAT = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit' });
+
+// Helper function to format date
+const formatDate = (dateString) => {
+  if (!dateString) return "N/A";
+  
+  // Fix for timezone issue: parse date parts directly to avoid timezone offset
+  const [year, month, day] = dateString.split('-').map(num => parseInt(num, 10));
+  // Month is 0-indexed in JavaScript Date
+  const date = new Date(year, month - 1, day);
+  
+  return DATE_FORMAT.format(date);
+};
+
+// Helper function to format time
+const formatTime = (timeString) => {
+  if (!timeString) return "N/A";
+  
+  try {
+    // Handle ISO format or time-only string
+    let time;
+    if (timeString.includes("T")) {
+      time = new Date(timeString);
+    } else {
+      // For time-only string in format HH:MM:SS
+      const [hours, minutes] = timeString.split(":");
+      time = new Date();
+      time.setHours(hours, minutes);
+    }
+    
+    return TIME_FORMAT.format(time);
+  } catch (e) {
+    return timeString;
+  }
+};
+
 const GameDetail = () => {
   const { gameId } = useParams();
   const [game, setGame] = useState(null);
   const [players, setPlayers] = useState([]);
+  const [team, setTeam] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
   const [activeTab, setActiveTab] = useState("availability");
@@ -21,10 +60,18 @@ const GameDetail = () => {
       const gameResponse = await getGame(gameId);
       setGame(gameResponse.data);
       
-      // Get team players
+      // Get team players and the team details for the summary header together.
+      // The page still works without the team details, so don't fail on them.
       const teamId = gameResponse.data.team_id;
-      const playersResponse = await getPlayers(teamId);
+      const [playersResponse, teamResponse] = await Promise.all([
+        getPlayers(teamId),
+        getTeam(teamId).catch(err => {
+          console.error("Failed to load team details:", err);
+          return null;
+        })
+      ]);
       setPlayers(playersResponse.data);
+      setTeam(teamResponse?.data || null);
       
       setError("");
     } catch (err) {
@@ -39,40 +86,20 @@ const GameDetail = () => {
     fetchGameData();
   }, [fetchGameData]);
 
-  // Helper function to format date
-  const formatDate = (dateString) => {
-    if (!dateString) return "N/A";
-    const options = { year: 'numeric', month: 'long', day: 'numeric' };
-    
-    // Fix for timezone issue: parse date parts directly to avoid timezone offset
-    const [year, month, day] = dateString.split('-').map(num => parseInt(num, 10));
-    // Month is 0-indexed in JavaScript Date
-    const date = new Date(year, month - 1, day);
-    
-    return date.toLocaleDateString(undefined, options);
-  };
+  // Player ID -> player lookup shared by the tabs; rebuilt only when the roster changes
+  const playerLookup = useMemo(
+    () => new Map(players.map(player => [player.id, player])),
+    [players]
+  );
 
-  // Helper function to format time
-  const formatTime = (timeString) => {
-    if (!timeString) return "N/A";
-    
-    try {
-      // Handle ISO format or time-only string
-      let time;
-      if (timeString.includes("T")) {
-        time = new Date(timeString);
-      } else {
-        // For time-only string in format HH:MM:SS
-        const [hours, minutes] = timeString.split(":");
-        time = new Date();
-        time.setHours(hours, minutes);
-      }
-      
-      return time.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
-    } catch (e) {
-      return timeString;
-    }
-  };
+  // Date/time labels for the header and summary tab, formatted once per game load
+  const gameLabels = useMemo(
+    () => ({
+      date: formatDate(game?.date),
+      time: formatTime(game?.time)
+    }),
+    [game]
+  );
 
   if (loading) {
     return <div className="text-center mt-5"><div className="spinner-border"></div></div>;
@@ -99,8 +126,8 @@ const GameDetail = () => {
         <div className="card-body">
           <div className="row">
             <div className="col-md-6">
-              <p><strong>Date:</strong> {formatDate(game.date)}</p>
-              <p><strong>Time:</strong> {formatTime(game.time)}</p>
+              <p><strong>Date:</strong> {gameLabels.date}</p>
+              <p><strong>Time:</strong> {gameLabels.time}</p>
             </div>
             <div className="col-md-6">
               <p><strong>Innings:</strong> {game.innings}</p>
@@ -158,7 +185,7 @@ const GameDetail = () => {
       )}
       
       {activeTab === "summary" && (
-        <GameSummaryTab gameId={gameId} players={players} game={game} innings={game.innings} />
+        <GameSummaryTab gameId={gameId} players={players} playerLookup={playerLookup} game={game} team={team} gameLabels={gameLabels} innings={game.innings} />
       )}
     </div>
   );
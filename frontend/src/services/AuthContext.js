@@ -1,5 +1,5 @@
 import React, { createContext, useState, useEffect } from "react";
-import { login, register, getCurrentUser, refreshToken, getPendingCount } from "../services/api";
+import { login, register, getCurrentUser, refreshToken, getPendingCount, invalidatePlayersCache, invalidateTeamsCache, invalidateGameDataCache, invalidateGamesCache } from "../services/api";
 
 // Create Auth Context
 export const AuthContext = createContext();
@@ -107,6 +107,11 @@ export const AuthProvider = ({ children }) => {
     try {
       // Clear any existing token first to prevent session conflicts
       localStorage.removeItem("token");
+      // Don't show a previous user's cached data
+      invalidatePlayersCache();
+      invalidateTeamsCache();
+      invalidateGameDataCache();
+      invalidateGamesCache();
       
       // Step 1: Attempt to log in and get token
       let response;
@@ -239,6 +244,10 @@ export const AuthProvider = ({ children }) => {
   // Logout function
   const handleLogout = () => {
     localStorage.removeItem("token");
+    invalidatePlayersCache();
+    invalidateTeamsCache();
+    invalidateGameDataCache();
+    invalidateGamesCache();
     setCurrentUser(null);
   };
 
@@ -278,14 +278,49 @@ export const getUserSubscription = () => {
 };
 
 // TEAMS API
+// The team list is fetched every time the dashboard mounts, and a team's
+// details every time one of its pages or the game summary mounts, but they only
+// change when a team is created, edited or deleted, so keep them for a minute.
+// Team writes clear them once they finish.
+const TEAMS_CACHE_TTL_MS = 60 * 1000;
+let teamsCache = null;
+const teamDetailsCache = new Map();
+
+export const invalidateTeamsCache = () => {
+  teamsCache = null;
+  teamDetailsCache.clear();
+};
+
 export const getTeams = () => {
+  if (teamsCache && Date.now() - teamsCache.fetchedAt < TEAMS_CACHE_TTL_MS) {
+    return teamsCache.request;
+  }
+  
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.get('/teams');
+  const request = axios.get('/teams').catch(error => {
+    // Don't keep failed requests around
+    invalidateTeamsCache();
+    throw error;
+  });
+  teamsCache = { request, fetchedAt: Date.now() };
+  return request;
 };
 
 export const getTeam = (teamId) => {
+  const key = String(teamId);
+  const cached = teamDetailsCache.get(key);
+  if (cached && Date.now() - cached.fetchedAt < TEAMS_CACHE_TTL_MS) {
+    return cached.request;
+  }
+  
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.get(`/teams/${teamId}`);
+  const request = axios.get(`/teams/${teamId}`).catch(error => {
+    // Don't keep failed requests around
+    teamDetailsCache.delete(key);
+    throw error;
+  });
+  teamDetailsCache.set(key, { request, fetchedAt: Date.now() });
+  return request;
 };
 
 export const createTeam = (teamData) => {
@@ -306,12 +341,12 @@ export const createTeam = (teamData) => {
       'Content-Type': 'application/json',
       'Authorization': `Bearer ${token}`
     }
-  });
+  }).finally(invalidateTeamsCache);
 };
 
 export const updateTeam = (teamId, teamData) => {
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.put(`/teams/${teamId}`, teamData);
+  return axios.put(`/teams/${teamId}`, teamData).finally(invalidateTeamsCache);
 };
 
 export const deleteTeam = (teamId) => {
@@ -322,13 +357,38 @@ export const deleteTeam = (teamId) => {
     headers: {
       'Authorization': `Bearer ${token}`
     }
-  });
+  }).finally(invalidateTeamsCache);
 };
 
 // PLAYERS API
+// Rosters rarely change while games are being edited, so keep each team's
+// roster request for a few minutes. Any player write clears the cache.
+const ROSTER_CACHE_TTL_MS = 5 * 60 * 1000;
+const rosterCache = new Map();
+
+export const invalidatePlayersCache = (teamId) => {
+  if (teamId === undefined) {
+    rosterCache.clear();
+  } else {
+    rosterCache.delete(String(teamId));
+  }
+};
+
 export const getPlayers = (teamId) => {
+  const key = String(teamId);
+  const cached = rosterCache.get(key);
+  if (cached && Date.now() - cached.fetchedAt < ROSTER_CACHE_TTL_MS) {
+    return cached.request;
+  }
+  
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.get(`/teams/${teamId}/players`);
+  const request = axios.get(`/teams/${teamId}/players`).catch(error => {
+    // Don't keep failed requests around
+    rosterCache.delete(key);
+    throw error;
+  });
+  rosterCache.set(key, { request, fetchedAt: Date.now() });
+  return request;
 };
 
 export const getPlayer = (playerId) => {
@@ -338,23 +398,55 @@ export const getPlayer = (playerId) => {
 
 export const createPlayer = (teamId, playerData) => {
   // Use RESTful URL pattern
-  return axios.post(`/teams/${teamId}/players`, playerData);
+  return axios.post(`/teams/${teamId}/players`, playerData)
+    .finally(() => invalidatePlayersCache(teamId));
 };
 
 export const updatePlayer = (playerId, playerData) => {
+  // The player's team isn't known here, so drop every cached roster
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.put(`/players/${playerId}`, playerData);
+  return axios.put(`/players/${playerId}`, playerData)
+    .finally(() => invalidatePlayersCache());
 };
 
 export const deletePlayer = (playerId) => {
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.delete(`/players/${playerId}`);
+  return axios.delete(`/players/${playerId}`).finally(() => {
+    invalidatePlayersCache();
+    // Deleting a player also removes their availability and lineup entries
+    invalidateGameDataCache();
+  });
 };
 
 // GAMES API
+// A team's schedule is loaded by the team page and the game pages; keep it
+// for a minute per team. Game writes clear it once they finish.
+const SCHEDULE_CACHE_TTL_MS = 60 * 1000;
+const scheduleCache = new Map();
+
+export const invalidateGamesCache = (teamId) => {
+  if (teamId === undefined) {
+    scheduleCache.clear();
+  } else {
+    scheduleCache.delete(String(teamId));
+  }
+};
+
 export const getGames = (teamId) => {
+  const key = String(teamId);
+  const cached = scheduleCache.get(key);
+  if (cached && Date.now() - cached.fetchedAt < SCHEDULE_CACHE_TTL_MS) {
+    return cached.request;
+  }
+  
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.get(`/teams/${teamId}/games`);
+  const request = axios.get(`/teams/${teamId}/games`).catch(error => {
+    // Don't keep failed requests around
+    scheduleCache.delete(key);
+    throw error;
+  });
+  scheduleCache.set(key, { request, fetchedAt: Date.now() });
+  return request;
 };
 
 export const getGame = (gameId) => {
@@ -364,17 +456,23 @@ export const getGame = (gameId) => {
 
 export const createGame = (teamId, gameData) => {
   // Use RESTful URL pattern
-  return axios.post(`/teams/${teamId}/games`, gameData);
+  return axios.post(`/teams/${teamId}/games`, gameData)
+    .finally(() => invalidateGamesCache(teamId));
 };
 
 export const updateGame = (gameId, gameData) => {
+  // The game's team isn't known here, so drop every cached schedule
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.put(`/games/${gameId}`, gameData);
+  return axios.put(`/games/${gameId}`, gameData)
+    .finally(() => invalidateGamesCache());
 };
 
 export const deleteGame = (gameId) => {
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.delete(`/games/${gameId}`);
+  return axios.delete(`/games/${gameId}`).finally(() => {
+    invalidateGamesCache();
+    invalidateGameDataCache(gameId);
+  });
 };
 
 // ADMIN API
@@ -429,30 +527,65 @@ export const checkApiHealth = async () => {
   }
 };
 
-// LINEUP API
-export const getBattingOrder = (gameId) => {
+// GAME DATA CACHE
+// Each game tab loads the game's availability (and most load its batting
+// order and fielding rotations) when it mounts, so switching between tabs
+// refetched the same data every time. Keep these requests per game for a minute; any write for a
+// game clears that game's entries once it finishes.
+const GAME_DATA_CACHE_TTL_MS = 60 * 1000;
+const gameDataCache = new Map();
+
+export const invalidateGameDataCache = (gameId) => {
+  if (gameId === undefined) {
+    gameDataCache.clear();
+    return;
+  }
+  const prefix = `${gameId}:`;
+  for (const key of gameDataCache.keys()) {
+    if (key.startsWith(prefix)) {
+      gameDataCache.delete(key);
+    }
+  }
+};
+
+const getGameData = (gameId, resource) => {
+  const key = `${gameId}:${resource}`;
+  const cached = gameDataCache.get(key);
+  if (cached && Date.now() - cached.fetchedAt < GAME_DATA_CACHE_TTL_MS) {
+    return cached.request;
+  }
+  
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.get(`/games/${gameId}/batting-order`);
+  const request = axios.get(`/games/${gameId}/${resource}`).catch(error => {
+    // Don't keep failed requests around (e.g. a 404 for a game with no batting order yet)
+    gameDataCache.delete(key);
+    throw error;
+  });
+  gameDataCache.set(key, { request, fetchedAt: Date.now() });
+  return request;
 };
 
+// LINEUP API
+export const getBattingOrder = (gameId) => getGameData(gameId, 'batting-order');
+
 export const updateBattingOrder = (gameId, orderData) => {
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.put(`/games/${gameId}/batting-order`, orderData);
+  return axios.put(`/games/${gameId}/batting-order`, orderData)
+    .finally(() => invalidateGameDataCache(gameId));
 };
 
 export const saveBattingOrder = (gameId, orderData) => {
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.post(`/games/${gameId}/batting-order`, { order_data: orderData });
+  return axios.post(`/games/${gameId}/batting-order`, { order_data: orderData })
+    .finally(() => invalidateGameDataCache(gameId));
 };
 
-export const getFieldingRotations = (gameId) => {
-  // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.get(`/games/${gameId}/fielding-rotations`);
-};
+export const getFieldingRotations = (gameId) => getGameData(gameId, 'fielding-rotations');
 
 export const updateFieldingRotation = (gameId, inning, positionsData) => {
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.put(`/games/${gameId}/fielding-rotations/${inning}`, positionsData);
+  return axios.put(`/games/${gameId}/fielding-rotations/${inning}`, positionsData)
+    .finally(() => invalidateGameDataCache(gameId));
 };
 
 export const saveFieldingRotation = (gameId, inning, positions) => {
@@ -485,7 +618,7 @@ export const saveFieldingRotation = (gameId, inning, positions) => {
     paramsSerializer: {
       indexes: null
     }
-  });
+  }).finally(() => invalidateGameDataCache(gameId));
 };
 
 export const batchSaveFieldingRotations = (gameId, rotationsData) => {
@@ -522,17 +655,15 @@ export const batchSaveFieldingRotations = (gameId, rotationsData) => {
     paramsSerializer: {
       indexes: null
     }
-  });
+  }).finally(() => invalidateGameDataCache(gameId));
 };
 
-export const getPlayerAvailability = (gameId) => {
-  // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.get(`/games/${gameId}/player-availability`);
-};
+export const getPlayerAvailability = (gameId) => getGameData(gameId, 'player-availability');
 
 export const updatePlayerAvailability = (gameId, availabilityData) => {
   // Use direct axios call to avoid duplicating the /api prefix from baseURL
-  return axios.put(`/games/${gameId}/player-availability`, availabilityData);
+  return axios.put(`/games/${gameId}/player-availability`, availabilityData)
+    .finally(() => invalidateGameDataCache(gameId));
 };
 
 export const batchSavePlayerAvailability = (gameId, playerAvailabilityArray) => {
@@ -566,7 +697,7 @@ export const batchSavePlayerAvailability = (gameId, playerAvailabilityArray) =>
     paramsSerializer: {
       indexes: null
     }
-  });
+  }).finally(() => invalidateGameDataCache(gameId));
 };
 
 // ANALYTICS API
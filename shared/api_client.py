@@ -4,13 +4,58 @@ API client for LineupBoss.
 This module provides a unified client for accessing the LineupBoss API.
 """
 import os
-import requests
+import time
 import json
 from typing import Dict, List, Optional, Union, Any
-from dotenv import load_dotenv
+from shared.config import load_environment
 
-# Load environment variables
-load_dotenv()
+# Connection pool for the client's session: keep connections to the API open
+# for reuse, and retry idempotent requests that hit a connection error or a
+# gateway error while the API restarts
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+RETRY_SETTINGS = {
+    "total": 3,
+    "backoff_factor": 0.3,
+    "status_forcelist": (502, 503, 504),
+    "allowed_methods": frozenset({"GET", "PUT", "DELETE"}),
+    "raise_on_status": False,
+}
+
+# requests (and the SSL stack under it) is only imported once a client first
+# talks to the API, so importing this module stays cheap for scripts that
+# never make a request
+_requests = None
+
+def _requests_module():
+    """Import requests on first use and return the module."""
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
+def _create_session():
+    """Create a requests session with the pooled, retrying adapter mounted."""
+    requests = _requests_module()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(**RETRY_SETTINGS)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Successful GET responses are reused for a short time, so screens that load
+# the same team, roster or lineup repeatedly don't wait on the API each time.
+# Any successful write clears the cache.
+GET_CACHE_TTL = 30  # seconds
+GET_CACHE_MAX_ENTRIES = 512
 
 class LineupBossAPIClient:
     """Client for the LineupBoss API."""
@@ -22,6 +67,7 @@ class LineupBossAPIClient:
             base_url: The base URL of the API. If not provided, uses environment variable.
         """
         # Try to get from environment variable first
+        load_environment()
         self.base_url = base_url or os.getenv("API_URL")
             
         # Fallback to local API
@@ -32,9 +78,19 @@ class LineupBossAPIClient:
         if self.base_url and self.base_url.endswith("/"):
             self.base_url = self.base_url[:-1]
             
-        # Initialize session and token
-        self.session = requests.Session()
+        # Initialize token; the session is created on first request
+        self._session = None
         self.token = None
+        self._base_headers = {"Content-Type": "application/json"}
+        # (url, params, token) -> (stored_at, response data)
+        self._get_cache = {}
+        
+    @property
+    def session(self):
+        """The HTTP session, created the first time it is needed."""
+        if self._session is None:
+            self._session = _create_session()
+        return self._session
         
     def set_token(self, token):
         """Set the authentication token.
@@ -44,13 +100,42 @@ class LineupBossAPIClient:
         """
         self.token = token
         
+    def clear_cache(self):
+        """Drop all cached GET responses."""
+        self._get_cache.clear()
+        
+    def _get_cached(self, key):
+        """Return the cached response for key, or None if missing or expired."""
+        entry = self._get_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        if time.monotonic() - stored_at > GET_CACHE_TTL:
+            del self._get_cache[key]
+            return None
+        return data
+        
+    def _store_cached(self, key, data):
+        """Cache a GET response, dropping expired or old entries when full."""
+        now = time.monotonic()
+        if len(self._get_cache) >= GET_CACHE_MAX_ENTRIES:
+            expired = [k for k, (stored_at, _) in self._get_cache.items()
+                       if now - stored_at > GET_CACHE_TTL]
+            for k in expired:
+                del self._get_cache[k]
+            if len(self._get_cache) >= GET_CACHE_MAX_ENTRIES:
+                # Still full - drop the oldest entry
+                oldest = min(self._get_cache, key=lambda k: self._get_cache[k][0])
+                del self._get_cache[oldest]
+        self._get_cache[key] = (now, data)
+        
     def get_headers(self):
         """Get request headers with authentication token if available.
         
         Returns:
             dict: Headers for API requests.
         """
-        headers = {"Content-Type": "application/json"}
+        headers = self._base_headers.copy()
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
@@ -79,6 +164,15 @@ class LineupBossAPIClient:
         if token_required and not self.token:
             return {"error": "Authentication required", "status_code": 401}
         
+        # Serve repeated GETs from the cache. Cached data is shared between
+        # callers, so treat it as read-only.
+        is_get = method.upper() == "GET"
+        if is_get:
+            cache_key = (url, tuple(sorted((params or {}).items())), self.token)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             if method.upper() == "GET":
                 response = self.session.get(url, headers=headers, params=params)
@@ -93,7 +187,14 @@ class LineupBossAPIClient:
                 
             # Handle response
             if response.status_code in (200, 201):
-                return response.json()
+                result = response.json()
+                if is_get:
+                    self._store_cached(cache_key, result)
+                else:
+                    # A write can change any cached view (e.g. deleting a team
+                    # removes its players and games), so start fresh
+                    self.clear_cache()
+                return result
             else:
                 # Try to get error message from response
                 try:
@@ -104,7 +205,7 @@ class LineupBossAPIClient:
                     
                 return {"error": error_message, "status_code": response.status_code}
                 
-        except requests.RequestException as e:
+        except _requests_module().RequestException as e:
             return {"error": str(e), "status_code": 500}
             
     # Auth endpoints
@@ -375,6 +476,22 @@ class LineupBossAPIClient:
             "positions": positions_data
         })
         
+    def save_fielding_rotations_batch(self, game_id, rotations_by_inning):
+        """Save fielding rotations for several innings of a game in one request.
+        
+        Args:
+            game_id: Game ID
+            rotations_by_inning: Dictionary of inning number to positions data
+            
+        Returns:
+            Saved fielding rotations data or error
+        """
+        # The batch endpoint takes the inning -> positions mapping as the body,
+        # with innings as JSON object keys
+        return self.request("POST", f"/games/{game_id}/fielding-rotations/batch", {
+            str(inning): positions for inning, positions in rotations_by_inning.items()
+        })
+        
     # Player availability endpoints
     def get_player_availability(self, game_id):
         """Get player availability for a game.
@@ -3,6 +3,7 @@ Shared authentication utilities for LineupBoss.
 
 This module provides common user authentication functions for the application.
 """
+from sqlalchemy.exc import IntegrityError
 from shared.database import get_db_session, db_session
 from shared.models import User
 
@@ -10,16 +11,16 @@ def create_user(email, password):
     """Create a new user"""
     with db_session() as session:
         try:
-            # Check if user already exists
-            existing_user = session.query(User).filter(User.email == email).first()
-            if existing_user:
-                return None, "Email already registered"
-                
+            # Let the unique constraint on email catch duplicates, rather than
+            # checking first, which costs a query and can race another signup
             user = User(email=email)
             user.set_password(password)
             session.add(user)
             session.commit()
             return user.id, "User created successfully"
+        except IntegrityError:
+            session.rollback()
+            return None, "Email already registered"
         except Exception as e:
             session.rollback()
             return None, str(e)
@@ -42,27 +43,29 @@ def get_teams_for_user(user_id):
     """Get all teams owned by a specific user"""
     from shared.models import Team
     with db_session() as session:
-        teams = session.query(Team).filter(
+        # Select just the columns needed rather than whole Team objects
+        rows = session.query(Team.id, Team.name).filter(
             (Team.user_id == user_id) | (Team.user_id == None)
         ).all()
-        return [(team.id, team.name) for team in teams]
+        return [(team_id, name) for team_id, name in rows]
 
 def get_teams_with_details_for_user(user_id):
     """Get all teams with details owned by a specific user"""
     from shared.models import Team
     with db_session() as session:
-        teams = session.query(Team).filter(
+        # Select just the columns needed rather than whole Team objects
+        rows = session.query(Team.id, Team.name, Team.league, Team.head_coach).filter(
             (Team.user_id == user_id) | (Team.user_id == None)
         ).all()
-        team_details = []
-        for team in teams:
-            team_details.append({
-                "id": team.id, 
-                "name": team.name,
-                "league": team.league,
-                "head_coach": team.head_coach
-            })
-        return team_details
+        return [
+            {
+                "id": team_id,
+                "name": name,
+                "league": league,
+                "head_coach": head_coach
+            }
+            for team_id, name, league, head_coach in rows
+        ]
         
 def create_team_with_user(team_info, user_id):
     """Create a new team with user ownership"""
@@ -4,10 +4,16 @@ Configuration settings for LineupBoss.
 This module provides configuration settings for the application.
 """
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+@lru_cache(maxsize=1)
+def load_environment():
+    """Load the .env file into the environment, once per process."""
+    load_dotenv()
+
+# Load environment variables; the settings below are read at import time
+load_environment()
 
 # Base configuration
 class Config:
@@ -37,6 +43,12 @@ class Config:
             
         return db_url
     
+    # Database connection pool settings
+    DB_POOL_SIZE = int(os.getenv("POOL_SIZE", 10))               # Connections kept open
+    DB_MAX_OVERFLOW = int(os.getenv("POOL_MAX_OVERFLOW", 2))     # Extra connections when the pool is full
+    DB_POOL_TIMEOUT = int(os.getenv("POOL_TIMEOUT", 30))         # Seconds to wait for a connection
+    DB_POOL_RECYCLE = int(os.getenv("POOL_RECYCLE", 300))        # Seconds before a connection is replaced
+    
     # Application configuration
     DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
     SECRET_KEY = os.getenv("SECRET_KEY", "dev_key_not_secure")
@@ -9,6 +9,7 @@ import sys
 import time
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.exc import OperationalError, DisconnectionError
 
 from shared.models import Base, Player, Game
@@ -40,20 +41,35 @@ def create_engine_from_url(database_url=None):
                 "keepalives_interval": 10,
                 "keepalives_count": 5
             }
+        # Pool sizes and timeouts come from config so they can be tuned per
+        # deployment (e.g. to the database plan's connection limit)
         return create_engine(
             database_url, 
             connect_args=connect_args,
-            pool_pre_ping=True,  # Verify connections before using them
-            pool_recycle=300,    # Recycle connections after 5 minutes
-            pool_timeout=30,     # Wait up to 30 seconds for a connection
-            pool_size=10,        # Maximum pool size
-            max_overflow=2       # Allow 2 extra connections when pool is full
+            pool_pre_ping=True,                   # Verify connections before using them
+            pool_recycle=config.DB_POOL_RECYCLE,  # Replace connections before the server drops them
+            pool_timeout=config.DB_POOL_TIMEOUT,  # How long to wait for a free connection
+            pool_size=config.DB_POOL_SIZE,        # Connections kept open
+            max_overflow=config.DB_MAX_OVERFLOW   # Extra connections allowed when the pool is full
         )
     else:
         print("WARNING: DATABASE_URL not found in environment variables.")
         print("Please set DATABASE_URL in your .env file.")
         print("Using in-memory SQLite database as fallback. Most operations will fail.")
-        return create_engine('sqlite:///:memory:')
+        return create_sqlite_fallback_engine()
+
+def create_sqlite_fallback_engine():
+    """Create the in-memory SQLite engine used when no database is reachable.
+    
+    Every connection to sqlite:///:memory: normally gets its own empty
+    database; StaticPool shares one connection so the schema and data stay
+    visible across sessions and threads.
+    """
+    return create_engine(
+        'sqlite:///:memory:',
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
 
 # Create a simpler, more stable database engine
 try:
@@ -68,7 +84,7 @@ except Exception as e:
     logger.error(f"Fatal database connection error: {str(e)}")
     # Fall back to in-memory SQLite in case of fatal error
     logger.warning("Using in-memory SQLite as fallback. Most operations will fail.")
-    engine = create_engine('sqlite:///:memory:')
+    engine = create_sqlite_fallback_engine()
 
 # Create a session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)